@@ -15,6 +15,7 @@ predictor_lambda = spl.SagemakerPredictorLambda(
         model_framework='linear-learner',
         model_data_bucket=bucket.id,
         model_data_key=trained_model_key,
+        http_endpoint='function_url',
         column_names=[
             "quality",
             "fixed acidity",
@@ -37,6 +38,8 @@ pulumi.export('bucket', bucket.id)
 
 pulumi.export('lambda_function_name', predictor_lambda.lambda_function_name)
 
+pulumi.export('predictor_url', predictor_lambda.predictor_url)
+
 pulumi.export('endpoint_name', predictor_lambda.endpoint_name)
 
 pulumi.export('training_role_arn', predictor_lambda.training_role_arn)
@@ -0,0 +1,49 @@
+import boto3
+import http.client
+import json
+import subprocess as sp
+import urllib.parse
+
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+
+test_datum = {
+    "fixed acidity": 7.8,
+    "volatile acidity": 0.88,
+    "pH": 3.2,
+    "citric acid": 0.0,
+    "residual sugar": 2.6,
+    "chlorides": 0.098,
+    "free sulfur dioxide": 25.0,
+    "total sulfur dioxide": 67.0,
+    "density": 0.9968,
+    "sulphates": 0.68,
+    "alcohol": 9.8
+}
+
+
+pulumi_config = json.loads(sp.check_output('pulumi config --json', shell=True).decode().strip())
+region = pulumi_config['aws:region']['value']
+pulumi_stack_output = json.loads(sp.check_output('pulumi stack output --json', shell=True).decode().strip())
+predictor_url = pulumi_stack_output['predictor_url']
+credentials = boto3.Session().get_credentials()
+
+# One connection is kept alive across requests; only the first pays for
+# the TLS handshake.
+connection = http.client.HTTPSConnection(urllib.parse.urlparse(predictor_url).netloc)
+
+
+def predict(datum):
+    request = AWSRequest(method='POST', url=predictor_url, data=json.dumps(datum),
+                         headers={'Content-Type': 'application/json'})
+    SigV4Auth(credentials, 'lambda', region).add_auth(request)
+    connection.request('POST', '/', body=request.body, headers=dict(request.headers))
+    return json.load(connection.getresponse())
+
+
+for _ in range(3):
+    out = predict(test_datum)
+
+print(json.dumps({'url': predictor_url,
+                  'request': test_datum,
+                  'response': out}, indent=True, sort_keys=True))
@@ -0,0 +1,286 @@
+#  Copyright 2016-2021, Pulumi Corporation.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Benchmarks of the hot path of the Lambda function in `handler.py`.
+
+Requests are built from the records of the winequality example data.
+Each case is timed at batch sizes from 1 to 10k rows:
+
+    convert_json_request_to_csv  - encoding a single record
+    parse_request/instances      - encoding a row-major batch
+    parse_request/columns        - encoding a column-major batch
+    decode_scores/json           - parsing a `linear-learner` JSON response
+    decode_scores/csv            - parsing a `text/csv` response
+    lambda_handler/record        - a full single-record request
+    lambda_handler/instances     - a full row-major batch request
+    lambda_handler/columns       - a full column-major batch request
+    lambda_handler/cached        - a row-major batch answered from the
+                                   prediction cache
+
+Full requests go to a local stand-in endpoint (see
+`sagemakerlambda_provider/standin.py`) with no added latency, so they
+measure the function rather than the network.
+
+Run from the provider directory:
+
+    python -m benchmarks.hotpath --output results.json
+
+A run compared against an earlier one fails when the median time of any
+case grew by more than the threshold:
+
+    python -m benchmarks.hotpath --baseline main.json --threshold 0.25
+
+or, to compare two saved runs without running anything:
+
+    python -m benchmarks.hotpath --baseline main.json --current branch.json
+
+"""
+
+import argparse
+import csv
+import datetime
+import json
+import pathlib
+import platform
+import statistics
+import sys
+import time
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sagemakerlambda_provider.standin import StandIn, load_handler
+
+
+# Bump when the layout of the results changes.
+RESULTS_VERSION = 1
+
+DATA_PATH = pathlib.Path(__file__).absolute().parents[4].joinpath(
+    'examples', 'winequality', 'data', 'winequality-red.csv')
+
+TARGET = 'quality'
+
+SIZES = [1, 10, 100, 1000, 10000]
+
+SCHEMA_BUCKET = 'benchmarks'
+SCHEMA_KEY = 'schema/winequality.json'
+
+
+def load_records() -> Tuple[List[str], List[Dict[str, float]]]:
+    """The winequality schema columns, dependent variable first, and the
+    feature records of the example data."""
+
+    with open(DATA_PATH) as fp:
+        reader = csv.DictReader(fp)
+        features = [name for name in reader.fieldnames or [] if name != TARGET]
+        records = [{name: float(row[name]) for name in features} for row in reader]
+
+    return [TARGET] + features, records
+
+
+def take(records: List[Dict[str, float]], size: int) -> List[Dict[str, float]]:
+    """The first `size` records, cycling through the data as needed."""
+
+    return [records[i % len(records)] for i in range(size)]
+
+
+def to_columns(records: List[Dict[str, float]]) -> Dict[str, List[float]]:
+    return {name: [record[name] for record in records] for name in records[0]}
+
+
+def measure(call: Callable[[], Any], repeat: int, min_time: float) -> Dict[str, Any]:
+    """Times `call` like `timeit`: the number of loops per sample grows
+    until a sample takes `min_time`, then `repeat` samples are taken.
+    Times are in seconds per call."""
+
+    call()
+    loops = 1
+
+    while True:
+        started = time.perf_counter()
+
+        for _ in range(loops):
+            call()
+
+        elapsed = time.perf_counter() - started
+
+        if elapsed >= min_time:
+            break
+
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    samples = [elapsed / loops]
+
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+
+        for _ in range(loops):
+            call()
+
+        samples.append((time.perf_counter() - started) / loops)
+
+    return {
+        'loops': loops,
+        'median': statistics.median(samples),
+        'min': min(samples),
+        'max': max(samples),
+    }
+
+
+def cases(standin: StandIn,
+          handler: Any,
+          cached: Any,
+          column_names: List[str],
+          records: List[Dict[str, float]],
+          sizes: List[int]) -> List[Tuple[str, int, Callable[[], Any]]]:
+    """The benchmark cases as (name, rows, call) triples. `cached` is the
+    handler with the prediction cache enabled."""
+
+    schema = handler.schema_cache.get()
+    record = records[0]
+
+    found: List[Tuple[str, int, Callable[[], Any]]] = [
+        ('convert_json_request_to_csv', 1, lambda: handler.convert_json_request_to_csv(record, column_names[1:])),
+        ('lambda_handler/record', 1, lambda: handler.lambda_handler(record, None)),
+    ]
+
+    for size in sizes:
+        batch = take(records, size)
+        instances = {'instances': batch}
+        columns = {'columns': to_columns(batch)}
+        scores = [standin.score(row) for row in schema.encoder.encode_batch(batch).split('\n')]
+        json_body = json.dumps({'predictions': [{'score': score} for score in scores]}).encode()
+        csv_body = ''.join(f'{score}\n' for score in scores).encode()
+
+        found += [
+            ('parse_request/instances', size, _bind(handler.parse_request, schema, instances)),
+            ('parse_request/columns', size, _bind(handler.parse_request, schema, columns)),
+            ('decode_scores/json', size, _bind(handler.decode_scores, json_body, 'application/json')),
+            ('decode_scores/csv', size, _bind(handler.decode_scores, csv_body, 'text/csv')),
+            ('lambda_handler/instances', size, _bind(handler.lambda_handler, instances, None)),
+            ('lambda_handler/columns', size, _bind(handler.lambda_handler, columns, None)),
+            ('lambda_handler/cached', size, _bind(cached.lambda_handler, instances, None)),
+        ]
+
+    return found
+
+
+def _bind(function: Callable[..., Any], *args: Any) -> Callable[[], Any]:
+    return lambda: function(*args)
+
+
+def run(sizes: List[int], repeat: int, min_time: float, only: Optional[str]) -> dict:
+    results = {}
+    column_names, records = load_records()
+
+    with StandIn() as standin:
+        standin.put_schema(SCHEMA_BUCKET, SCHEMA_KEY, column_names)
+        env = {'SCHEMA_BUCKET': SCHEMA_BUCKET, 'SCHEMA_KEY': SCHEMA_KEY}
+        handler = load_handler(standin, env)
+        cached = load_handler(standin, dict(env, PREDICTION_CACHE_SIZE=str(max(sizes))))
+
+        for name, rows, call in cases(standin, handler, cached, column_names, records, sizes):
+            if only is not None and only not in name:
+                continue
+
+            timing = measure(call, repeat, min_time)
+            timing['rows'] = rows
+            timing['rowsPerSecond'] = rows / timing['median']
+            results[f'{name}[{rows}]'] = timing
+            print(f'{name}[{rows}]'.ljust(40), _format_seconds(timing['median']), file=sys.stderr)
+
+    return {
+        'version': RESULTS_VERSION,
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'json': handler._json_loads.__module__,
+        'results': results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[str]:
+    """The cases of `current` whose median time grew by more than
+    `threshold`, a fraction, over `baseline`, as printable lines."""
+
+    if baseline.get('version') != current.get('version'):
+        raise Exception(f'Cannot compare results of version {baseline.get("version")} and {current.get("version")}')
+
+    regressions = []
+
+    for name, timing in sorted(current['results'].items()):
+        before = baseline['results'].get(name)
+
+        if before is None:
+            continue
+
+        ratio = timing['median'] / before['median']
+        line = f'{name.ljust(40)} {_format_seconds(before["median"])} -> {_format_seconds(timing["median"])} ({ratio:.2f}x)'
+        print(line, file=sys.stderr)
+
+        if ratio > 1 + threshold:
+            regressions.append(line)
+
+    return regressions
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:8.2f} {unit}'
+
+    return f'{seconds / 1e-9:8.2f} ns'
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the hot path of the predictor Lambda function.')
+    parser.add_argument('--output', help='file to write the results to as JSON')
+    parser.add_argument('--baseline', help='results of an earlier run to compare against')
+    parser.add_argument('--current', help='compare these saved results instead of running the benchmarks')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='slowdown of a median that fails the comparison, as a fraction (default 0.25)')
+    parser.add_argument('--sizes', type=lambda text: [int(size) for size in text.split(',')], default=SIZES,
+                        help='comma-separated batch sizes (default 1,10,100,1000,10000)')
+    parser.add_argument('--repeat', type=int, default=5, help='samples per case (default 5)')
+    parser.add_argument('--min-time', type=float, default=0.2, help='minimum seconds per sample (default 0.2)')
+    parser.add_argument('--only', help='run only the cases whose name contains this text')
+    args = parser.parse_args(argv)
+
+    if args.current:
+        with open(args.current) as fp:
+            current = json.load(fp)
+    else:
+        current = run(args.sizes, args.repeat, args.min_time, args.only)
+
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(current, fp, indent=2, sort_keys=True)
+            fp.write('\n')
+
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)
+
+        regressions = compare(baseline, current, args.threshold)
+
+        if regressions:
+            print(f'{len(regressions)} cases slowed down by more than {args.threshold:.0%}:', file=sys.stderr)
+
+            for line in regressions:
+                print(line, file=sys.stderr)
+
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
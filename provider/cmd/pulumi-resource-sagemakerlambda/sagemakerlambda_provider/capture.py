@@ -0,0 +1,191 @@
+#  Copyright 2016-2021, Pulumi Corporation.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Reads back the requests a SagemakerPredictorLambda endpoint captured
+with `data_capture_percentage`, as columns of feature values and scores.
+
+SageMaker writes one JSON Lines object per few minutes of traffic under
+`capture/<name>/<endpoint>/<variant>/yyyy/mm/dd/hh/`, each line holding
+the CSV payload of one endpoint call and its response. Calls answered
+from the Lambda function's prediction cache never reach the endpoint
+and are not captured.
+
+    python -m sagemakerlambda_provider.capture \\
+        --schema s3://my-bucket/schema/predictor.json \\
+        --capture s3://my-bucket/capture/predictor/ \\
+        --output captured.csv
+
+streams the captured rows and their scores to a CSV file and prints the
+number of captured rows and calls, the call sizes and the share of
+distinct rows, which bound what batching and caching can save.
+"""
+
+import argparse
+import base64
+import csv
+import hashlib
+import json
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TextIO
+
+import boto3
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+from sagemakerlambda_provider import handler
+from sagemakerlambda_provider.transform import load_schema, parse_s3_uri
+
+
+def capture_keys(s3: Any, bucket: str, prefix: str) -> Iterator[str]:
+    """Lists the capture objects under a prefix in time order."""
+
+    paginator = s3.get_paginator('list_objects_v2')
+
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for item in page.get('Contents', []):
+            if item['Key'].endswith('.jsonl'):
+                yield item['Key']
+
+
+def capture_data(data: dict) -> bytes:
+    """Decodes the payload of an `endpointInput` or `endpointOutput`."""
+
+    if data.get('encoding') == 'BASE64':
+        return base64.b64decode(data['data'])
+
+    return data['data'].encode()
+
+
+def read_capture(s3: Any, bucket: str, prefix: str) -> Iterator[Tuple[List[str], List[float]]]:
+    """Streams the captured endpoint calls as their CSV rows and scores."""
+
+    for key in capture_keys(s3, bucket, prefix):
+        for line in s3.get_object(Bucket=bucket, Key=key)['Body'].iter_lines():
+            if not line.strip():
+                continue
+
+            event = json.loads(line)['captureData']
+            rows = capture_data(event['endpointInput']).decode().splitlines()
+            output = event['endpointOutput']
+            scores = handler.decode_scores(capture_data(output), output.get('observedContentType') or 'text/json')
+
+            if len(rows) != len(scores):
+                raise Exception(f'{key}: captured {len(rows)} rows but {len(scores)} scores')
+
+            yield rows, scores
+
+
+def to_columns(schema: handler.Schema, calls: Iterable[Tuple[List[str], List[float]]]) -> Dict[str, Any]:
+    """Gathers captured calls into one array per schema column, as NumPy
+    arrays when NumPy is importable and lists otherwise. This holds every
+    call in memory; `write_rows` streams them instead."""
+
+    features: List[List[float]] = [[] for _ in schema.encoder.column_names]
+    target: List[float] = []
+
+    for rows, scores in calls:
+        for row in rows:
+            for column, value in zip(features, row.split(',')):
+                column.append(float(value))
+
+        target.extend(scores)
+
+    columns = dict(zip(schema.encoder.column_names, features))
+    columns[schema.target] = target
+
+    if np is not None:
+        return {name: np.asarray(values) for name, values in columns.items()}
+
+    return columns
+
+
+def write_rows(schema: handler.Schema,
+               calls: Iterable[Tuple[List[str], List[float]]],
+               fp: TextIO) -> Iterator[Tuple[List[str], List[float]]]:
+    """Writes captured calls to `fp` as CSV, one feature row and its
+    score per line, passing each call on once written."""
+
+    writer = csv.writer(fp)
+    writer.writerow(schema.encoder.column_names + [schema.target])
+
+    for rows, scores in calls:
+        writer.writerows(row.split(',') + [repr(score)] for row, score in zip(rows, scores))
+        yield rows, scores
+
+
+class Summary:
+    """Statistics of captured calls, gathered one call at a time. Only the
+    call sizes and a digest of each distinct row are kept."""
+
+    def __init__(self) -> None:
+        self.sizes: List[int] = []
+        self.distinct: Set[bytes] = set()
+
+    def add(self, rows: List[str]) -> None:
+        self.sizes.append(len(rows))
+        self.distinct.update(hashlib.blake2b(row.encode(), digest_size=8).digest() for row in rows)
+
+    def result(self) -> dict:
+        sizes = sorted(self.sizes)
+        rows = sum(sizes)
+
+        if not sizes:
+            return {'rows': 0, 'calls': 0}
+
+        return {
+            'rows': rows,
+            'calls': len(sizes),
+            'meanRowsPerCall': rows / len(sizes),
+            'medianRowsPerCall': sizes[len(sizes) // 2],
+            'maxRowsPerCall': sizes[-1],
+            'distinctRowShare': len(self.distinct) / rows,
+        }
+
+
+def summarize(calls: Iterable[Tuple[List[str], List[float]]]) -> dict:
+    summary = Summary()
+
+    for rows, _ in calls:
+        summary.add(rows)
+
+    return summary.result()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Read the requests captured by a predictor endpoint.')
+    parser.add_argument('--schema', required=True, help='schema object, as an s3:// URI or a local file')
+    parser.add_argument('--capture', required=True, help='s3:// prefix the endpoint captures under')
+    parser.add_argument('--output', help='file to write the captured rows and scores to as CSV')
+    parser.add_argument('--region')
+    args = parser.parse_args(argv)
+
+    s3 = boto3.client('s3', region_name=args.region)
+    schema = load_schema(s3, args.schema)
+    bucket, prefix = parse_s3_uri(args.capture)
+    calls = read_capture(s3, bucket, prefix)
+
+    if args.output:
+        with open(args.output, 'w', newline='') as fp:
+            summary = summarize(write_rows(schema, calls, fp))
+    else:
+        summary = summarize(calls)
+
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == '__main__':
+    main()
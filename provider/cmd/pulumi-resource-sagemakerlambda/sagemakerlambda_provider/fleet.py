@@ -0,0 +1,336 @@
+# Copyright 2016-2021, Pulumi Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import pathlib
+
+from typing import Any, Dict, Optional
+
+from pulumi_aws import sagemaker, iam, kms, lambda_, s3
+import pulumi
+
+from sagemakerlambda_provider import image_uris
+from sagemakerlambda_provider.sagemakerlambda import \
+    _assume_role_policy, \
+    _default_account_id, \
+    _default_region, \
+    _lambda_role_policy, \
+    _plain, \
+    _training_role_policy
+
+
+class SagemakerPredictorFleetArgs:
+
+    model_data_bucket: pulumi.Input[str]
+    """ID of a bucket where trained model data is stored."""
+
+    models: Dict[str, dict]
+    """Predictors of the fleet by name, each a map with the
+    `modelDataKey` of its trained model and the `columnNames` of its
+    features, dependent variable first. A predictor may also set
+    `modelFramework` or `modelImage`, `instanceType` and
+    `initialInstanceCount`, which default to the settings of the
+    fleet."""
+
+    initial_instance_count: pulumi.Input[int]
+    """Initial number of instances of each endpoint. Defaults to 1."""
+
+    instance_type: pulumi.Input[str]
+    """Type of instance of each endpoint. Defaults to the smallest
+    instance."""
+
+    region: pulumi.Input[str]
+    """AWS region name. If None, infer from the environment."""
+
+    account_id: pulumi.Input[str]
+    """AWS account ID. If None, the account of the AWS provider's
+    credentials."""
+
+    model_image: Optional[pulumi.Input[str]]
+    """Custom Docker image serving the predictors that set neither
+    `modelImage` nor `modelFramework`."""
+
+    model_framework: Optional[pulumi.Input[str]]
+    """Built-in SageMaker framework such as `linear-learner` serving the
+    predictors that set neither `modelImage` nor `modelFramework`."""
+
+    lambda_memory_size: Optional[pulumi.Input[int]]
+    """Memory of the shared Lambda function in MB. Defaults to 128."""
+
+    lambda_timeout: pulumi.Input[int]
+    """Timeout of the shared Lambda function in seconds. Defaults to 30."""
+
+    lambda_runtime: pulumi.Input[str]
+    """Python runtime of the shared Lambda function. Defaults to
+    `python3.8`."""
+
+    def __init__(self,
+                 model_data_bucket: pulumi.Input[str],
+                 models: pulumi.Input[Dict[str, dict]],
+                 initial_instance_count: Optional[pulumi.Input[int]] = None,
+                 instance_type: Optional[pulumi.Input[str]] = None,
+                 region: Optional[pulumi.Input[str]] = None,
+                 account_id: Optional[pulumi.Input[str]] = None,
+                 model_image: Optional[pulumi.Input[str]] = None,
+                 model_framework: Optional[pulumi.Input[str]] = None,
+                 lambda_memory_size: Optional[pulumi.Input[int]] = None,
+                 lambda_timeout: Optional[pulumi.Input[int]] = None,
+                 lambda_runtime: Optional[pulumi.Input[str]] = None) -> None:
+
+        self.model_data_bucket = pulumi.Output.from_input(model_data_bucket)
+        self.models = _plain(models, 'models')
+
+        if not self.models:
+            raise Exception('A fleet needs at least one model')
+
+        for model_name, spec in self.models.items():
+            missing = [key for key in ('modelDataKey', 'columnNames') if spec.get(key) is None]
+
+            if missing:
+                raise Exception(f'Model {model_name} is missing ' + ', '.join(missing))
+
+            if spec.get('modelImage') is None and spec.get('modelFramework') is None \
+                    and model_image is None and model_framework is None:
+                raise Exception(f'Model {model_name} needs a modelImage or modelFramework')
+
+        if initial_instance_count is None:
+            initial_instance_count = 1
+
+        self.initial_instance_count = initial_instance_count
+
+        if instance_type is None:
+            instance_type = 'ml.t2.medium'
+
+        self.instance_type = instance_type
+
+        if region is not None:
+            self.region = region
+        else:
+            self.region = _default_region()
+
+        if account_id is not None:
+            self.account_id = account_id
+        else:
+            self.account_id = _default_account_id()
+
+        self.model_image = model_image
+        self.model_framework = model_framework
+
+        if lambda_timeout is None:
+            lambda_timeout = 30
+
+        if lambda_runtime is None:
+            lambda_runtime = 'python3.8'
+
+        self.lambda_memory_size = lambda_memory_size
+        self.lambda_timeout = lambda_timeout
+        self.lambda_runtime = lambda_runtime
+
+    @staticmethod
+    def from_inputs(inputs: pulumi.Inputs) -> 'SagemakerPredictorFleetArgs':
+        """This boilerplate will be automated in the future."""
+
+        return SagemakerPredictorFleetArgs(
+            model_data_bucket=inputs['modelDataBucket'],
+            models=inputs['models'],
+            initial_instance_count=inputs.get('initialInstanceCount', None),
+            instance_type=inputs.get('instanceType', None),
+            region=inputs.get('region', None),
+            account_id=inputs.get('accountId', None),
+            model_image=inputs.get('modelImage', None),
+            model_framework=inputs.get('modelFramework', None),
+            lambda_memory_size=inputs.get('lambdaMemorySize', None),
+            lambda_timeout=inputs.get('lambdaTimeout', None),
+            lambda_runtime=inputs.get('lambdaRuntime', None)
+        )
+
+
+class SagemakerPredictorFleet(pulumi.ComponentResource):
+    """Many predictors behind one Lambda function. The roles, KMS key,
+    invoke policy and function are provisioned once for the fleet; each
+    predictor only adds its model, endpoint configuration and endpoint.
+    Requests name the predictor to score with as `"predictor": "<name>"`.
+    """
+
+    training_role_arn: pulumi.Output[str]
+    """ARN of the provisioned role that can be reused for model training."""
+
+    lambda_function_name: pulumi.Output[str]
+    """Name of the Lambda function serving every predictor."""
+
+    endpoint_names: pulumi.Output[Dict[str, str]]
+    """Names of the SageMaker endpoints by predictor."""
+
+    def __init__(self,
+                 name: str,
+                 args: SagemakerPredictorFleetArgs,
+                 props: Optional[dict] = None,
+                 opts: Optional[pulumi.ResourceOptions] = None) -> None:
+
+        super().__init__('sagemakerlambda:index:SagemakerPredictorFleet', name, props, opts)
+
+        kms_key = kms.Key(
+            f'{name}-kms-key',
+            deletion_window_in_days=30,
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        lambda_role = iam.Role(
+            f'{name}-lambda-role',
+            assume_role_policy=_assume_role_policy('lambda.amazonaws.com'),
+            inline_policies=[
+                iam.RoleInlinePolicyArgs(
+                    name=f'{name}-lambda-role-policy',
+                    policy=pulumi.Output.all(args.model_data_bucket, args.region, args.account_id).apply(
+                        lambda values: _lambda_role_policy(*values))
+                )
+            ],
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        role = iam.Role(
+            f'{name}-role',
+            assume_role_policy=_assume_role_policy('sagemaker.amazonaws.com'),
+            inline_policies=[
+                iam.RoleInlinePolicyArgs(
+                    name=f'{name}-policy',
+                    policy=pulumi.Output.all(args.model_data_bucket, args.region, args.account_id).apply(
+                        lambda values: _training_role_policy(*values))
+                )
+            ],
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        endpoints = {
+            model_name: self._predictor(name, model_name, spec, args, role, kms_key)
+            for model_name, spec in args.models.items()
+        }
+
+        policy = iam.Policy(
+            f'{name}-invoke-policy',
+            policy=pulumi.Output.from_input([endpoint.arn for endpoint in endpoints.values()]).apply(
+                lambda arns: json.dumps({
+                    'Version': '2012-10-17',
+                    'Statement': [
+                        {
+                            'Action': [
+                                'sagemaker:InvokeEndpoint'
+                            ],
+                            'Effect': 'Allow',
+                            'Resource': arns
+                        }
+                    ],
+                })),
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        routes = pulumi.Output.from_input({
+            model_name: {
+                'columns': spec['columnNames'],
+                'endpoint': endpoints[model_name].name,
+            }
+            for model_name, spec in args.models.items()
+        })
+
+        # Kept apart from the schema/ objects of SagemakerPredictorLambda,
+        # which may share the bucket and the name.
+        routing_object = s3.BucketObject(
+            f'{name}-routing',
+            content=routes.apply(lambda predictors: json.dumps({'predictors': predictors})),
+            content_type='application/json',
+            key=f'fleet/{name}.json',
+            bucket=args.model_data_bucket,
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        lambda_function = lambda_.Function(
+            f'{name}-lambda',
+            timeout=args.lambda_timeout,
+            memory_size=args.lambda_memory_size,
+            role=lambda_role.arn,
+            runtime=args.lambda_runtime,
+            handler='handler.lambda_handler',
+            code=pulumi.AssetArchive({
+                'handler.py': pulumi.FileAsset(pathlib.Path(__file__).absolute().parent.joinpath('./handler.py'))
+            }),
+            environment=lambda_.FunctionEnvironmentArgs(variables={
+                'PREDICTOR_FLEET': 'true',
+                'SCHEMA_BUCKET': args.model_data_bucket,
+                'SCHEMA_KEY': routing_object.key,
+            }),
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        iam.PolicyAttachment(
+            f'{name}-invoke-policy-attachment',
+            roles=[lambda_role.name],
+            policy_arn=policy.arn,
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        self.training_role_arn = role.arn
+        self.lambda_function_name = lambda_function.name
+        self.endpoint_names = pulumi.Output.all(
+            **{model_name: endpoint.name for model_name, endpoint in endpoints.items()})
+
+    def _predictor(self,
+                   name: str,
+                   model_name: str,
+                   spec: dict,
+                   args: SagemakerPredictorFleetArgs,
+                   role: iam.Role,
+                   kms_key: kms.Key) -> sagemaker.Endpoint:
+        """The model, endpoint configuration and endpoint of one
+        predictor."""
+
+        image: Any = spec.get('modelImage')
+
+        if image is None and spec.get('modelFramework') is None:
+            image = args.model_image
+
+        if image is None:
+            framework = spec.get('modelFramework') or args.model_framework
+            image = pulumi.Output.all(framework, args.region).apply(
+                lambda values: image_uris.resolve(values[0], values[1]))
+
+        model = sagemaker.Model(
+            f'{name}-{model_name}-model',
+            execution_role_arn=role.arn,
+            primary_container=sagemaker.ModelPrimaryContainerArgs(
+                image=image,
+                model_data_url=pulumi.Output.concat('s3://', args.model_data_bucket, '/', spec['modelDataKey'])
+            ),
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        endpoint_config = sagemaker.EndpointConfiguration(
+            f'{name}-{model_name}-endpoint-config',
+            production_variants=[
+                sagemaker.EndpointConfigurationProductionVariantArgs(
+                    variant_name='AllTraffic',
+                    model_name=model.name,
+                    initial_instance_count=spec.get('initialInstanceCount', args.initial_instance_count),
+                    instance_type=spec.get('instanceType', args.instance_type),
+                )
+            ],
+            kms_key_arn=kms_key.arn,
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        return sagemaker.Endpoint(
+            f'{name}-{model_name}-endpoint',
+            endpoint_config_name=endpoint_config.name,
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
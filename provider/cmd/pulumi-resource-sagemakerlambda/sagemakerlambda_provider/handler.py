@@ -6,11 +6,115 @@ returns the predicted dependent variable. To do this it needs to know
 the column names of the features; this metadata is not currently
 retained by SageMaker Model and Endpoint objects.
 
+A request is either a single JSON object, which gets a single
+`prediction` back, or a batch of objects given as a JSON list or as
+`{"instances": [...]}`. A batch is sent to the endpoint as one
+multi-line CSV payload and answered with a `predictions` list in the
+order of the input records.
+
+Requests given as a JSON object may add `"targetVariant": "<name>"` to
+be scored by that production variant of the endpoint instead of one
+chosen by the variant weights.
+
+A predictor fleet serves many models, each from its own endpoint,
+through one function. Its requests name the predictor to score with as
+`"predictor": "<name>"`; the schema and endpoint of every predictor
+come from a single routing object,
+`{"predictors": {"<name>": {"columns": [...], "endpoint": "..."}}}`,
+read from SCHEMA_BUCKET and SCHEMA_KEY and revalidated like a schema.
+A request naming an unknown predictor revalidates it right away, so
+that a predictor added to the fleet is served without waiting out the
+TTL.
+
+A multi-model endpoint serves many models from one S3 prefix, loading
+each on first use. Requests to one must name the model artifact to
+score with, relative to that prefix, as `"targetModel": "<key>"`. The
+schema of a model is read from `<MODEL_SCHEMA_PREFIX><key>.json` if that
+object exists, and is otherwise the default schema below.
+
+Large batches can also be sent column-major as
+`{"columns": {"fixed acidity": [...], ...}}`, which avoids repeating
+the column names in every record; the answer is then column-major too,
+`{"predictions": {"quality": [...]}}`. A row is validated and encoded
+the same way in either shape, so it gets the same CSV and shares
+cached scores.
+
 Environment variables:
 
     SAGEMAKER_ENDPOINT_NAME - name of the predictor SageMaker endpoint
+    SCHEMA_JSON             - the schema object itself, if embedded in the
+                              environment
+    SCHEMA_FILE             - path of the schema object relative to this
+                              script, if bundled with it
     SCHEMA_BUCKET           - name of the bucket where the schema object lives
     SCHEMA_KEY              - key of the schema object
+    SCHEMA_CACHE_TTL        - seconds between conditional re-fetches of the
+                              schema object (default 300)
+    SCHEMA_CACHE_FILE       - file caching the last fetched schema across
+                              warm restarts (default under /tmp, empty to
+                              disable)
+
+Optional tuning of the SageMaker runtime client; botocore defaults apply
+to anything left unset:
+
+    SAGEMAKER_MAX_POOL_CONNECTIONS - size of the HTTP connection pool
+    SAGEMAKER_CONNECT_TIMEOUT      - connect timeout in seconds
+    SAGEMAKER_READ_TIMEOUT         - read timeout in seconds
+    SAGEMAKER_RETRY_MODE           - `legacy`, `standard` or `adaptive`
+    SAGEMAKER_MAX_ATTEMPTS         - total attempts including the first
+    SAGEMAKER_TCP_KEEPALIVE        - `true` to enable TCP keepalive
+    SAGEMAKER_ACCEPT               - response type requested from the
+                                     endpoint, `text/json` (default) or
+                                     `text/csv` for a plain score column
+
+Batches larger than a single endpoint call should carry are split into
+chunks that are scored in parallel and reassembled in order:
+
+    BATCH_MAX_ROWS    - maximum rows per endpoint call (default 1000)
+    BATCH_MAX_BYTES   - maximum CSV bytes per endpoint call (default 5000000,
+                        under the 6 MB SageMaker payload limit)
+    BATCH_CONCURRENCY - endpoint calls in flight per request (default 4)
+
+Repeated feature rows can be answered from a cache of scores keyed by
+the encoded CSV row, either an LRU in this container's memory or a
+Redis server shared by all containers. Responses then carry
+`cacheHits`, the number of rows that skipped the endpoint. Cached
+scores are scoped to the schema and the endpoint name; bound the TTL to
+limit how long they survive a model update behind the same endpoint.
+
+    PREDICTION_CACHE_BACKEND - `memory` (default) or `redis`
+    PREDICTION_CACHE_URL     - `redis://[:password@]host[:port][/db]` of the
+                               Redis server, `rediss://` for TLS
+    PREDICTION_CACHE_SIZE    - maximum rows cached in memory (default 0,
+                               disabling the `memory` backend)
+    PREDICTION_CACHE_TTL     - seconds a cached score stays valid (default 0,
+                               until evicted)
+
+An asynchronous inference endpoint takes payloads of up to 1 GB from S3
+and cannot be invoked synchronously. Against one, every scoring request
+is staged to S3 and submitted with `invoke_endpoint_async`, and the
+answer is a job handle, `{"job": "<id>", "status": "pending"}`. Sending
+the handle back as the request returns the status and, once the
+endpoint has written its output, the predictions in the shape of the
+original request.
+
+    ASYNC_INFERENCE - `true` if the endpoint serves asynchronous inference
+    ASYNC_BUCKET    - bucket where payloads and job records are staged
+    ASYNC_PREFIX    - key prefix of the staged objects (default `async/`)
+
+    PREDICTOR_FLEET     - `true` if the function routes for a predictor
+                          fleet rather than a single endpoint
+    MULTI_MODEL         - `true` if the endpoint is a multi-model endpoint
+    MODEL_SCHEMA_BUCKET - bucket of the per-model schema objects
+    MODEL_SCHEMA_PREFIX - key prefix of the per-model schema objects
+
+The function can also be reached over HTTP through a Lambda Function URL
+or an API Gateway HTTP API. Requests are then `POST`ed as JSON bodies,
+optionally gzip-compressed with `Content-Encoding: gzip`, and answered
+with a JSON body, compressed when the client sends
+`Accept-Encoding: gzip`. Invalid requests get a 400 status with an
+`error` message, and compressed bodies that inflate past the 6 MB Lambda
+payload limit a 413 status.
 
 Example schema object (first column assumed to be a dependent variable):
 
@@ -25,71 +129,1230 @@ Example schema object (first column assumed to be a dependent variable):
 
 """
 
+import abc
+import base64
 import boto3
+import botocore.config
+import collections
+import concurrent.futures
+import functools
+import gzip
+import hashlib
+import itertools
 import json
+import logging
+import operator
 import os
+import re
+import socket
+import ssl
+import tempfile
+import time
+import urllib.parse
+import uuid
+import zlib
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        _json_loads = ujson.loads
+    except ImportError:
+        _json_loads = json.loads
 
-SAGEMAKER_ENDPOINT_NAME = os.environ['SAGEMAKER_ENDPOINT_NAME']
-SCHEMA_BUCKET = os.environ['SCHEMA_BUCKET']
-SCHEMA_KEY = os.environ['SCHEMA_KEY']
-AWS_REGION = os.environ['AWS_REGION']
 
+SAGEMAKER_ENDPOINT_NAME = os.environ.get('SAGEMAKER_ENDPOINT_NAME')
+SCHEMA_JSON = os.environ.get('SCHEMA_JSON')
+SCHEMA_FILE = os.environ.get('SCHEMA_FILE')
+SCHEMA_BUCKET = os.environ.get('SCHEMA_BUCKET')
+SCHEMA_KEY = os.environ.get('SCHEMA_KEY')
+AWS_REGION = os.environ.get('AWS_REGION')
+SCHEMA_CACHE_TTL = float(os.environ.get('SCHEMA_CACHE_TTL', '300'))
+SCHEMA_CACHE_FILE = os.environ.get('SCHEMA_CACHE_FILE',
+                                   os.path.join(tempfile.gettempdir(), 'sagemakerlambda-schema.json'))
+SAGEMAKER_ACCEPT = os.environ.get('SAGEMAKER_ACCEPT') or 'text/json'
+BATCH_MAX_ROWS = int(os.environ.get('BATCH_MAX_ROWS', '1000'))
+BATCH_MAX_BYTES = int(os.environ.get('BATCH_MAX_BYTES', '5000000'))
+BATCH_CONCURRENCY = int(os.environ.get('BATCH_CONCURRENCY', '4'))
+PREDICTION_CACHE_BACKEND = os.environ.get('PREDICTION_CACHE_BACKEND') or 'memory'
+PREDICTION_CACHE_URL = os.environ.get('PREDICTION_CACHE_URL')
+PREDICTION_CACHE_SIZE = int(os.environ.get('PREDICTION_CACHE_SIZE', '0'))
+PREDICTION_CACHE_TTL = float(os.environ.get('PREDICTION_CACHE_TTL', '0'))
+ASYNC_INFERENCE = os.environ.get('ASYNC_INFERENCE', '').lower() in ('1', 'true', 'yes')
+ASYNC_BUCKET = os.environ.get('ASYNC_BUCKET')
+ASYNC_PREFIX = os.environ.get('ASYNC_PREFIX', 'async/')
+MULTI_MODEL = os.environ.get('MULTI_MODEL', '').lower() in ('1', 'true', 'yes')
+PREDICTOR_FLEET = os.environ.get('PREDICTOR_FLEET', '').lower() in ('1', 'true', 'yes')
+MODEL_SCHEMA_BUCKET = os.environ.get('MODEL_SCHEMA_BUCKET')
+MODEL_SCHEMA_PREFIX = os.environ.get('MODEL_SCHEMA_PREFIX', '')
 
-def load_column_names():
-    try:
-        resp = s3_client.get_object(Bucket=SCHEMA_BUCKET,
-                                    Key=SCHEMA_KEY)
-        return json.load(resp['Body'])['columns']
-    except Exception as ex:
-        raise Exception('Failure while doing s3_client(region={}).get_object(Bucket={}, Key={}): {}'.format(
-            AWS_REGION, SCHEMA_BUCKET, SCHEMA_KEY, ex))
 
+logger = logging.getLogger(__name__)
+
+_NUMERIC_TYPES = frozenset([int, float])
+
+_JOB_ID = re.compile('[0-9a-f]{32}')
+
+_TARGET_MODEL = re.compile(r'[A-Za-z0-9!_.*\'()/-]{1,1024}')
+
+# HTTP responses smaller than this are not worth compressing.
+_COMPRESS_MIN_BYTES = 1024
+
+# Cap on the inflated size of a gzip-compressed HTTP request body, the
+# Lambda payload limit. A public endpoint must not inflate a small body
+# into more memory than the function has.
+_MAX_REQUEST_BYTES = 6 * 1024 * 1024
+
+# Cap on the number of per-model schemas kept by a multi-model handler.
+_MAX_MODEL_SCHEMAS = 256
+
+# Cap on the number of invalid records described in a batch error.
+_MAX_REPORTED_RECORDS = 10
+
+# A shared prediction cache must never cost more than the endpoint call
+# it saves: calls to it time out quickly, and after a failure it is
+# bypassed for a while instead of being retried on every request.
+_CACHE_SOCKET_TIMEOUT = 0.25
+_CACHE_RETRY_DELAY = 5.0
+
+# A fleet routing object is revalidated ahead of its TTL when a request
+# names an unknown predictor, which may just have been deployed, but at
+# most this often.
+_MIN_REVALIDATE_INTERVAL = 1.0
+
+
+class InvalidRequest(Exception):
+    """A request the function refuses to score, described to the caller.
+    Over HTTP it is answered with a 400 status; any other failure is an
+    internal error."""
+
+
+class RequestTooLarge(Exception):
+    """An HTTP request body that inflates past `_MAX_REQUEST_BYTES`."""
+
+
+class ColumnEncoder:
+    """Validates JSON feature records and serializes them to CSV rows in
+    schema column order.
+
+    The encoder is compiled once per schema: all feature values of a
+    record are fetched by a single `operator.itemgetter` call and
+    rendered by a precompiled `%r` template, which for int and float
+    matches `str(v)`. A batch is rendered by one template application
+    over the flattened values. Validation failures are rare, so they
+    are diagnosed on a separate slow path that reports every missing
+    and non-numeric column at once.
+    """
+
+    def __init__(self, column_names):
+        self.column_names = list(column_names)
+
+        if not self.column_names:
+            raise Exception('At least one feature column is required')
+
+        getter = operator.itemgetter(*self.column_names)
+
+        if len(self.column_names) == 1:
+            self._values = lambda record: (getter(record),)
+        else:
+            self._values = getter
+
+        self._row_format = ','.join(['%r'] * len(self.column_names))
+
+    def encode(self, record):
+        """Encodes a single record as a CSV row (without a newline)."""
+
+        row = self._try_encode(record)
+
+        if row is None:
+            raise InvalidRequest(f'Invalid request: {self.describe_errors(record)}')
+
+        return row
+
+    def encode_rows(self, records):
+        """Encodes a batch of records as a list of CSV rows."""
+
+        rows = list(map(self._try_encode, records))
+
+        if None in rows:
+            raise InvalidRequest(f'Invalid request: {self._describe_batch_errors(records, rows)}')
+
+        return rows
 
-sagemaker_client = boto3.client('sagemaker-runtime', region_name=AWS_REGION)
-s3_client = boto3.client('s3', region_name=AWS_REGION)
-column_names = load_column_names()
+    def encode_batch(self, records):
+        """Encodes a batch of records as a multi-line CSV payload."""
+
+        try:
+            values = tuple(itertools.chain.from_iterable(map(self._values, records)))
+        except (KeyError, TypeError):
+            values = None
+
+        if values is None or not _NUMERIC_TYPES.issuperset(map(type, values)):
+            return '\n'.join(self.encode_rows(records))
+
+        return '\n'.join([self._row_format] * len(records)) % values
+
+    def encode_columns(self, columns):
+        """Encodes column-major input, a mapping from column name to the
+        list of its values, as a multi-line CSV payload."""
+
+        if not isinstance(columns, dict):
+            raise InvalidRequest(
+                f'Invalid request: expected a JSON object of feature lists, got {type(columns).__name__}')
+
+        missing = [c for c in self.column_names if c not in columns]
+
+        if missing:
+            raise InvalidRequest('Invalid request: missing required columns: ' + ', '.join(missing))
+
+        values = [columns[c] for c in self.column_names]
+        not_lists = [c for c, v in zip(self.column_names, values) if not isinstance(v, list)]
+
+        if not_lists:
+            raise InvalidRequest('Invalid request: columns must be lists of values: ' + ', '.join(not_lists))
+
+        count = len(values[0])
+
+        if any(len(v) != count for v in values):
+            raise InvalidRequest('Invalid request: all columns must have the same number of values')
+
+        return '\n'.join([self._row_format] * count) % self._gather(values)
+
+    def describe_errors(self, record):
+        if not isinstance(record, dict):
+            return f'expected a JSON object of features, got {type(record).__name__}'
+
+        missing = [c for c in self.column_names if c not in record]
+        non_numeric = [f'{c} ({type(record[c]).__name__})' for c in self.column_names
+                       if c in record and type(record[c]) not in _NUMERIC_TYPES]
+
+        problems = []
+
+        if missing:
+            problems.append('missing required columns: ' + ', '.join(missing))
+
+        if non_numeric:
+            problems.append('non-numeric columns: ' + ', '.join(non_numeric))
+
+        return '; '.join(problems)
+
+    def _try_encode(self, record):
+        try:
+            values = self._values(record)
+        except (KeyError, TypeError):
+            return None
+
+        if not _NUMERIC_TYPES.issuperset(map(type, values)):
+            return None
+
+        return self._row_format % values
+
+    def _gather(self, values):
+        """Transposes column lists into the flat row-major values of the
+        payload. The values are checked and rendered exactly as on the
+        row path, so a row encodes to the same CSV in either shape."""
+
+        non_numeric = [f'{c} ({_non_numeric_type(v)})' for c, v in zip(self.column_names, values)
+                       if not _NUMERIC_TYPES.issuperset(map(type, v))]
+
+        if non_numeric:
+            raise InvalidRequest('Invalid request: non-numeric columns: ' + ', '.join(non_numeric))
+
+        return tuple(itertools.chain.from_iterable(zip(*values)))
+
+    def _describe_batch_errors(self, records, rows):
+        invalid = [i for i, row in enumerate(rows) if row is None]
+        details = [f'record {i}: {self.describe_errors(records[i])}'
+                   for i in invalid[:_MAX_REPORTED_RECORDS]]
+
+        if len(invalid) > _MAX_REPORTED_RECORDS:
+            details.append(f'and {len(invalid) - _MAX_REPORTED_RECORDS} more invalid records')
+
+        return '; '.join(details)
+
+
+def _non_numeric_type(values):
+    return next(type(v).__name__ for v in values if type(v) not in _NUMERIC_TYPES)
+
+
+@functools.lru_cache(maxsize=8)
+def _encoder_for(column_names):
+    return ColumnEncoder(column_names)
 
 
 def convert_json_request_to_csv(json_req, column_names):
-    out = []
+    """Encodes a single record against an explicit column list. The
+    handler itself uses the encoder precompiled for its schema."""
+
+    return _encoder_for(tuple(column_names)).encode(json_req)
+
+
+class Schema:
+    """Column names of a schema object together with their compiled
+    encoder."""
+
+    def __init__(self, column_names, etag=None):
+        self.column_names = list(column_names)
+        self.target = self.column_names[0]
+        self.encoder = ColumnEncoder(self.column_names[1:])
+        self.etag = etag
+        # Identifies the column layout in prediction cache keys.
+        self.digest = hashlib.sha1(json.dumps(self.column_names).encode()).hexdigest()[:16]
+
+
+class Fleet:
+    """Schemas and endpoints of the predictors of a fleet, by name."""
+
+    def __init__(self, predictors, etag=None):
+        self.schemas = {name: Schema(p['columns']) for name, p in predictors.items()}
+        self.endpoints = {name: p['endpoint'] for name, p in predictors.items()}
+        self.etag = etag
+
+
+class SchemaCache:
+    """Keeps the parsed schema in memory for the life of the container.
+
+    Once the schema is older than `ttl` seconds the next request
+    revalidates it with a conditional `get_object(IfNoneMatch=etag)`,
+    which costs no download while the object is unchanged. A failed
+    revalidation keeps serving the cached schema; only a cache with
+    nothing to serve raises, and it retries on the next request rather
+    than failing the container at import.
+
+    With `seed_path` set the last fetched schema is also kept on local
+    disk so that a restarted runtime in the same execution environment
+    can serve its first request without going to S3.
+
+    An `optional` schema object may be missing; `get` then returns None
+    until the object is looked up again after `ttl` seconds.
+    """
+
+    def __init__(self, bucket, key, ttl, seed_path=None, optional=False):
+        self.bucket = bucket
+        self.key = key
+        self.ttl = ttl
+        self.seed_path = seed_path or None
+        self.optional = optional
+        self._schema = None
+        self._fetched_at = 0.0
+        self._load_seed()
+
+    def get(self):
+        stale = time.time() - self._fetched_at >= self.ttl
+
+        if stale or (self._schema is None and not self.optional):
+            self._refresh()
+
+        return self._schema
+
+    def revalidate(self, min_interval):
+        """Revalidates the schema ahead of its TTL, unless it was fetched
+        or revalidated less than `min_interval` seconds ago."""
+
+        if time.time() - self._fetched_at >= min_interval:
+            self._refresh()
+
+        return self._schema
+
+    def _refresh(self):
+        kwargs = {}
+
+        if self._schema is not None and self._schema.etag is not None:
+            kwargs['IfNoneMatch'] = self._schema.etag
+
+        try:
+            resp = s3_client.get_object(Bucket=self.bucket, Key=self.key, **kwargs)
+            schema = self._parse(json.load(resp['Body']), resp.get('ETag'))
+        except Exception as ex:
+            if _http_status(ex) == 304:
+                self._fetched_at = time.time()
+                return
+
+            if _http_status(ex) == 404 and self.optional:
+                self._schema = None
+                self._fetched_at = time.time()
+                return
+
+            message = 'Failure while doing s3_client(region={}).get_object(Bucket={}, Key={}): {}'.format(
+                AWS_REGION, self.bucket, self.key, ex)
+
+            if self._schema is None:
+                raise Exception(message)
+
+            logger.warning('%s; serving the cached schema', message)
+            self._fetched_at = time.time()
+            return
+
+        self._schema = schema
+        self._fetched_at = time.time()
+        self._save_seed()
+
+    def _parse(self, document, etag):
+        return Schema(document['columns'], etag)
+
+    def _load_seed(self):
+        if self.seed_path is None or not os.path.exists(self.seed_path):
+            return
+
+        try:
+            with open(self.seed_path) as fp:
+                seed = json.load(fp)
+
+            if seed['bucket'] == self.bucket and seed['key'] == self.key:
+                self._schema = Schema(seed['columns'], seed['etag'])
+                self._fetched_at = seed['fetched_at']
+        except Exception as ex:
+            logger.warning('Ignoring unreadable schema cache file %s: %s', self.seed_path, ex)
+
+    def _save_seed(self):
+        if self.seed_path is None:
+            return
+
+        seed = {
+            'bucket': self.bucket,
+            'key': self.key,
+            'etag': self._schema.etag,
+            'columns': self._schema.column_names,
+            'fetched_at': self._fetched_at,
+        }
+
+        try:
+            tmp_path = f'{self.seed_path}.{os.getpid()}'
+            with open(tmp_path, 'w') as fp:
+                json.dump(seed, fp)
+            os.replace(tmp_path, self.seed_path)
+        except Exception as ex:
+            logger.warning('Could not write schema cache file %s: %s', self.seed_path, ex)
+
+
+class FleetCache(SchemaCache):
+    """Keeps the routing object of a predictor fleet, revalidated like a
+    schema object."""
+
+    def _parse(self, document, etag):
+        return Fleet(document['predictors'], etag)
+
+
+class EmbeddedSchema:
+    """Schema shipped with the function itself, in its code package or
+    environment. It is parsed once at import and never touches S3."""
+
+    def __init__(self, text):
+        self._schema = Schema(json.loads(text)['columns'])
+
+    def get(self):
+        return self._schema
+
+
+class ModelSchemaCache:
+    """Schemas of the models behind a multi-model endpoint, keyed by
+    target model. Each model is looked up on first use in its own
+    `SchemaCache`, falling back to the `default` schema when it has no
+    schema object; the least recently used are dropped beyond
+    `max_models`."""
+
+    def __init__(self, bucket, prefix, ttl, default, max_models=_MAX_MODEL_SCHEMAS):
+        self.bucket = bucket
+        self.prefix = prefix
+        self.ttl = ttl
+        self.default = default
+        self.max_models = max_models
+        self._caches = collections.OrderedDict()
+
+    def get(self, target_model):
+        cache = self._caches.pop(target_model, None)
+
+        if cache is None:
+            cache = SchemaCache(self.bucket, f'{self.prefix}{target_model}.json', self.ttl, optional=True)
+
+        self._caches[target_model] = cache
+
+        while len(self._caches) > self.max_models:
+            self._caches.popitem(last=False)
+
+        schema = cache.get()
+
+        if schema is not None:
+            return schema
+
+        if self.default is None:
+            raise InvalidRequest(f'Invalid request: unknown model {target_model}')
+
+        return self.default.get()
+
+
+def _http_status(ex):
+    return getattr(ex, 'response', {}).get('ResponseMetadata', {}).get('HTTPStatusCode')
+
+
+def make_schema_cache():
+    if PREDICTOR_FLEET:
+        if not (SCHEMA_BUCKET and SCHEMA_KEY):
+            raise Exception('SCHEMA_BUCKET and SCHEMA_KEY must be set for a predictor fleet')
+
+        return FleetCache(SCHEMA_BUCKET, SCHEMA_KEY, SCHEMA_CACHE_TTL)
+
+    if SCHEMA_JSON:
+        return EmbeddedSchema(SCHEMA_JSON)
+
+    if SCHEMA_FILE:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), SCHEMA_FILE)) as fp:
+            return EmbeddedSchema(fp.read())
+
+    if not (SCHEMA_BUCKET and SCHEMA_KEY):
+        raise Exception('One of SCHEMA_JSON, SCHEMA_FILE or SCHEMA_BUCKET and SCHEMA_KEY must be set')
+
+    return SchemaCache(SCHEMA_BUCKET, SCHEMA_KEY, SCHEMA_CACHE_TTL, SCHEMA_CACHE_FILE)
+
+
+def make_model_schema_cache(default):
+    if not MULTI_MODEL:
+        return None
+
+    if not MODEL_SCHEMA_BUCKET:
+        raise Exception('MODEL_SCHEMA_BUCKET must be set for a multi-model endpoint')
+
+    return ModelSchemaCache(MODEL_SCHEMA_BUCKET, MODEL_SCHEMA_PREFIX, SCHEMA_CACHE_TTL, default)
+
+
+def sagemaker_client_config():
+    options = {}
+
+    if os.environ.get('SAGEMAKER_MAX_POOL_CONNECTIONS'):
+        options['max_pool_connections'] = int(os.environ['SAGEMAKER_MAX_POOL_CONNECTIONS'])
+    elif BATCH_CONCURRENCY > 10:
+        # Do not let parallel chunks queue on botocore's default pool of 10.
+        options['max_pool_connections'] = BATCH_CONCURRENCY
+
+    if os.environ.get('SAGEMAKER_CONNECT_TIMEOUT'):
+        options['connect_timeout'] = float(os.environ['SAGEMAKER_CONNECT_TIMEOUT'])
+
+    if os.environ.get('SAGEMAKER_READ_TIMEOUT'):
+        options['read_timeout'] = float(os.environ['SAGEMAKER_READ_TIMEOUT'])
+
+    if os.environ.get('SAGEMAKER_TCP_KEEPALIVE'):
+        options['tcp_keepalive'] = os.environ['SAGEMAKER_TCP_KEEPALIVE'].lower() in ('1', 'true', 'yes')
+
+    retries = {}
+
+    if os.environ.get('SAGEMAKER_RETRY_MODE'):
+        retries['mode'] = os.environ['SAGEMAKER_RETRY_MODE']
+
+    if os.environ.get('SAGEMAKER_MAX_ATTEMPTS'):
+        retries['total_max_attempts'] = int(os.environ['SAGEMAKER_MAX_ATTEMPTS'])
+
+    if retries:
+        options['retries'] = retries
+
+    return botocore.config.Config(**options)
+
+
+class CacheBackend(abc.ABC):
+    """Store of scores keyed by encoded CSV row.
+
+    Scores are only valid for the endpoint they were computed with, so
+    callers `bind` the backend to it before every lookup and key them
+    by schema.
+    Lookups and stores take a whole batch at once so that a remote
+    backend answers each in a single round trip. A backend that fails
+    reports misses rather than failing the request.
+    """
+
+    @abc.abstractmethod
+    def bind(self, namespace):
+        """Scopes the following lookups and stores to a namespace."""
+
+    @abc.abstractmethod
+    def get_many(self, keys):
+        """Returns the cached score of each key, or None where missing."""
+
+    @abc.abstractmethod
+    def set_many(self, scores):
+        """Stores a mapping of keys to scores."""
+
+
+class InProcessCacheBackend(CacheBackend):
+    """Bounded LRU in the memory of this container. Entries older than
+    `ttl` seconds (if set) are treated as misses, and binding to another
+    namespace drops every entry."""
+
+    def __init__(self, size, ttl=0):
+        self.size = size
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._namespace = None
+
+    def bind(self, namespace):
+        if namespace != self._namespace:
+            self._entries.clear()
+            self._namespace = namespace
+
+    def get_many(self, keys):
+        now = time.time()
+        scores = []
+
+        for key in keys:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[1] is not None and entry[1] <= now:
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                scores.append(None)
+            else:
+                self._entries.move_to_end(key)
+                scores.append(entry[0])
+
+        return scores
+
+    def set_many(self, scores):
+        expires = time.time() + self.ttl if self.ttl > 0 else None
+
+        for key, score in scores.items():
+            self._entries[key] = (score, expires)
+            self._entries.move_to_end(key)
+
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache shared by all containers on a server speaking the Redis
+    protocol, such as ElastiCache. Lookups are a single MGET and stores
+    a single pipelined write of `SET key value [PX ttl]` commands; the
+    server's own eviction policy bounds its size.
+
+    Keys are prefixed by a digest of the bound namespace, so scores from
+    another schema or endpoint are never seen, and expire on their own.
+    """
+
+    def __init__(self, url, ttl=0, timeout=_CACHE_SOCKET_TIMEOUT):
+        parsed = urllib.parse.urlparse(url)
+
+        if parsed.scheme not in ('redis', 'rediss'):
+            raise Exception(f'Unsupported prediction cache URL, expected redis:// or rediss://: {url}')
+
+        self.host = parsed.hostname or 'localhost'
+        self.port = parsed.port or 6379
+        self.username = urllib.parse.unquote(parsed.username) if parsed.username else None
+        self.password = urllib.parse.unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip('/') or '0')
+        self.tls = parsed.scheme == 'rediss'
+        self.ttl = ttl
+        self.timeout = timeout
+        self._prefix = ''
+        self._sock = None
+        self._reader = None
+        self._retry_at = 0.0
+
+    def bind(self, namespace):
+        digest = hashlib.sha1(repr(namespace).encode()).hexdigest()[:16]
+        self._prefix = f'sagemakerlambda:{digest}:'
+
+    def get_many(self, keys):
+        if not keys:
+            return []
+
+        replies = self._try_execute([['MGET'] + [self._prefix + key for key in keys]])
+
+        if replies is None:
+            return [None] * len(keys)
+
+        return [None if value is None else json.loads(value) for value in replies[0]]
+
+    def set_many(self, scores):
+        if not scores:
+            return
 
-    for c in column_names:
+        expiry = ['PX', str(int(self.ttl * 1000))] if self.ttl > 0 else []
+        self._try_execute([['SET', self._prefix + key, json.dumps(score)] + expiry
+                           for key, score in scores.items()])
 
-        if c not in json_req:
-            raise Exception(f'Missing required column: {c}')
+    def _try_execute(self, commands):
+        if time.time() < self._retry_at:
+            return None
 
-        v = json_req[c]
+        try:
+            return self._execute(commands)
+        except Exception as ex:
+            logger.warning('Prediction cache at %s:%s failed, bypassing it for %ss: %s',
+                           self.host, self.port, _CACHE_RETRY_DELAY, ex)
+            self._close()
+            self._retry_at = time.time() + _CACHE_RETRY_DELAY
+            return None
 
-        if not (type(v) == int or type(v) == float):
-            raise Exception(f'Value of column {c} must be numeric, got {type(v)}')
+    def _execute(self, commands):
+        """Sends the commands in one write and returns their replies in
+        order."""
 
-        out.append(str(v))
+        if self._sock is None:
+            self._connect()
 
-    return ','.join(out)
+        self._sock.sendall(b''.join(map(_encode_redis_command, commands)))
+        return [self._read_reply() for _ in commands]
 
+    def _connect(self):
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+
+        if self.tls:
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=self.host)
+
+        self._sock = sock
+        self._reader = sock.makefile('rb')
+        setup = []
+
+        if self.password is not None:
+            setup.append(['AUTH', self.username, self.password] if self.username else ['AUTH', self.password])
+
+        if self.db:
+            setup.append(['SELECT', str(self.db)])
+
+        if setup:
+            self._execute(setup)
+
+    def _close(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+
+        self._sock = None
+        self._reader = None
+
+    def _read_reply(self):
+        line = self._reader.readline()
+
+        if not line.endswith(b'\r\n'):
+            raise Exception('connection closed')
+
+        kind, rest = line[:1], line[1:-2]
+
+        if kind == b'+':
+            return rest.decode()
+
+        if kind == b'-':
+            raise Exception(rest.decode())
+
+        if kind == b':':
+            return int(rest)
+
+        if kind == b'$':
+            size = int(rest)
+            return None if size < 0 else self._reader.read(size + 2)[:-2]
+
+        if kind == b'*':
+            size = int(rest)
+            return None if size < 0 else [self._read_reply() for _ in range(size)]
+
+        raise Exception(f'unexpected reply {line!r}')
+
+
+def _encode_redis_command(args):
+    parts = [b'*%d\r\n' % len(args)]
+
+    for arg in args:
+        data = arg.encode()
+        parts.append(b'$%d\r\n%s\r\n' % (len(data), data))
+
+    return b''.join(parts)
+
+
+def make_prediction_cache():
+    if PREDICTION_CACHE_BACKEND == 'redis':
+        if not PREDICTION_CACHE_URL:
+            raise Exception('PREDICTION_CACHE_URL must be set for the redis prediction cache')
+
+        return RedisCacheBackend(PREDICTION_CACHE_URL, PREDICTION_CACHE_TTL)
+
+    if PREDICTION_CACHE_BACKEND != 'memory':
+        raise Exception(f'Unknown PREDICTION_CACHE_BACKEND {PREDICTION_CACHE_BACKEND!r}, expected memory or redis')
+
+    if PREDICTION_CACHE_SIZE <= 0:
+        return None
+
+    return InProcessCacheBackend(PREDICTION_CACHE_SIZE, PREDICTION_CACHE_TTL)
+
+
+# The encoding and decoding helpers of this module are also used for
+# offline scoring (see transform.py), which imports it outside of
+# Lambda; clients and caches only exist where an endpoint is configured.
+if SAGEMAKER_ENDPOINT_NAME is not None or PREDICTOR_FLEET:
+    sagemaker_client = boto3.client('sagemaker-runtime', region_name=AWS_REGION, config=sagemaker_client_config())
+    s3_client = boto3.client('s3', region_name=AWS_REGION)
+    schema_cache = make_schema_cache()
+    model_schema_cache = make_model_schema_cache(schema_cache)
+    prediction_cache = make_prediction_cache()
+
+    # Environments kept warm by provisioned concurrency are initialized
+    # ahead of traffic, so load the schema then instead of on the first
+    # request.
+    if os.environ.get('AWS_LAMBDA_INITIALIZATION_TYPE') == 'provisioned-concurrency':
+        try:
+            schema_cache.get()
+        except Exception as ex:
+            logger.warning('Could not preload the schema: %s', ex)
+
+
+def batch_instances(event):
+    """Returns the records of a batch request, or None if the event is a
+    single record."""
+
+    if isinstance(event, list):
+        return event
+
+    if isinstance(event, dict) and isinstance(event.get('instances'), list):
+        return event['instances']
+
+    return None
+
+
+def batch_columns(event):
+    """Returns the feature lists of a column-major batch request, or None
+    if the event is not one."""
+
+    if isinstance(event, dict) and isinstance(event.get('columns'), dict):
+        return event['columns']
+
+    return None
+
+
+def decode_scores(body, content_type):
+    """Extracts the score vector from an endpoint response body.
+
+    A CSV response is parsed as one number per line, taking the last
+    column when a line has several (such as a label and its score). A
+    JSON response is parsed with orjson or ujson when either is
+    importable, falling back to the standard library.
+    """
+
+    if content_type.startswith('text/csv'):
+        if b',' not in body:
+            return list(map(float, body.split()))
+
+        return [float(line.rsplit(b',', 1)[-1]) for line in body.splitlines() if line]
+
+    return [p['score'] for p in _json_loads(body)['predictions']]
+
+
+def predict(csv_payload, route=None):
+    """Scores a CSV payload, returning one score per row. The `route` of
+    the request, its `EndpointName`, `TargetVariant` and `TargetModel`,
+    is passed on to the endpoint call; without a variant SageMaker picks
+    one by weight."""
+
+    options = {'EndpointName': SAGEMAKER_ENDPOINT_NAME}
+    options.update(route or {})
 
-def predict(csv_payload):
     response = sagemaker_client.invoke_endpoint(
+        ContentType='text/csv',
+        Accept=SAGEMAKER_ACCEPT,
+        Body=csv_payload,
+        **options)
+
+    return decode_scores(response['Body'].read(), response.get('ContentType') or SAGEMAKER_ACCEPT)
+
+
+def predict_chunk(csv_payload, count, route=None):
+    scores = predict(csv_payload, route)
+
+    if len(scores) != count:
+        raise Exception(f'Expected {count} predictions from the endpoint, got {len(scores)}')
+
+    return scores
+
+
+def split_payload(csv_payload, count, max_rows, max_bytes):
+    """Splits a multi-line CSV payload into chunks of at most `max_rows`
+    rows and, unless a single row is larger, `max_bytes` bytes. Returns
+    a list of (payload, row count) pairs in input order."""
+
+    if count <= max_rows and len(csv_payload) <= max_bytes:
+        return [(csv_payload, count)]
+
+    rows = csv_payload.split('\n')
+    chunks = []
+    start = 0
+    size = 0
+
+    for i, row in enumerate(rows):
+        if i > start and (i - start >= max_rows or size + len(row) > max_bytes):
+            chunks.append(('\n'.join(rows[start:i]), i - start))
+            start = i
+            size = 0
+
+        size += len(row) + 1
+
+    chunks.append(('\n'.join(rows[start:]), len(rows) - start))
+    return chunks
+
+
+_executor = None
+
+
+def _chunk_executor():
+    global _executor
+
+    if _executor is None:
+        _executor = concurrent.futures.ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY)
+
+    return _executor
+
+
+def predict_batch(csv_payload, count, route=None):
+    """Scores a multi-line CSV payload of `count` rows, fanning it out
+    over parallel endpoint calls when it exceeds the chunk limits."""
+
+    if count == 0:
+        return []
+
+    chunks = split_payload(csv_payload, count, BATCH_MAX_ROWS, BATCH_MAX_BYTES)
+
+    if len(chunks) == 1:
+        return predict_chunk(*chunks[0], route)
+
+    scores = _chunk_executor().map(lambda chunk: predict_chunk(*chunk, route), chunks)
+    return list(itertools.chain.from_iterable(scores))
+
+
+def score_payload(schema, csv_payload, count, route=None):
+    """Scores a multi-line CSV payload of `count` rows. With the
+    prediction cache enabled only the distinct rows it cannot answer go
+    to the endpoint. Scores are cached apart per schema and per route,
+    so that a pinned variant, a target model or a fleet predictor never
+    answers for another. Returns the scores in row order and the number
+    of cache hits."""
+
+    if prediction_cache is None:
+        return predict_batch(csv_payload, count, route), 0
+
+    rows = csv_payload.split('\n') if count else []
+    prefix = schema.digest + '|' + ''.join(f'{name}={value}|' for name, value in sorted((route or {}).items()))
+    prediction_cache.bind(SAGEMAKER_ENDPOINT_NAME)
+    scores = prediction_cache.get_many([prefix + row for row in rows])
+    misses = list(dict.fromkeys(row for row, score in zip(rows, scores) if score is None))
+    hits = len(rows) - scores.count(None)
+
+    if misses:
+        fresh = dict(zip(misses, predict_batch('\n'.join(misses), len(misses), route)))
+        prediction_cache.set_many({prefix + row: score for row, score in fresh.items()})
+        scores = [fresh[row] if score is None else score for row, score in zip(rows, scores)]
+
+    return scores, hits
+
+
+def with_cache_hits(response, hits):
+    if prediction_cache is not None:
+        response['cacheHits'] = hits
+
+    return response
+
+
+def async_job_id(event):
+    """Returns the job id of a request for async results, or None if the
+    event is a scoring request."""
+
+    if ASYNC_INFERENCE and isinstance(event, dict) and len(event) == 1 and isinstance(event.get('job'), str):
+        return event['job']
+
+    return None
+
+
+def submit_job(schema, csv_payload, count, shape):
+    """Stages a CSV payload to S3 and submits it to the asynchronous
+    endpoint. A job record kept next to it remembers where the output
+    will appear and how to shape it, so the handle given to the client
+    is only an opaque id."""
+
+    job_id = uuid.uuid4().hex
+    input_key = f'{ASYNC_PREFIX}input/{job_id}.csv'
+
+    s3_client.put_object(Bucket=ASYNC_BUCKET, Key=input_key, Body=csv_payload.encode(), ContentType='text/csv')
+
+    response = sagemaker_client.invoke_endpoint_async(
         EndpointName=SAGEMAKER_ENDPOINT_NAME,
         ContentType='text/csv',
-        Accept='text/json',
-        Body=csv_payload)
+        Accept=SAGEMAKER_ACCEPT,
+        InputLocation=f's3://{ASYNC_BUCKET}/{input_key}',
+        InferenceId=job_id)
 
-    return json.load(response['Body'])
+    job = {
+        'shape': shape,
+        'count': count,
+        'target': schema.target,
+        'outputLocation': response['OutputLocation'],
+        'failureLocation': response.get('FailureLocation'),
+    }
 
+    s3_client.put_object(Bucket=ASYNC_BUCKET, Key=f'{ASYNC_PREFIX}jobs/{job_id}.json', Body=json.dumps(job).encode())
+
+    return {'job': job_id, 'status': 'pending'}
+
+
+def fetch_job(job_id):
+    """Reports the status of an async job, with its predictions once the
+    endpoint has written them."""
+
+    job_record = None
+
+    if _JOB_ID.fullmatch(job_id):
+        job_record = read_s3_location(f's3://{ASYNC_BUCKET}/{ASYNC_PREFIX}jobs/{job_id}.json')
+
+    if job_record is None:
+        raise InvalidRequest(f'Invalid request: unknown job {job_id}')
+
+    job = json.loads(job_record[0])
+    output = read_s3_location(job['outputLocation'])
+
+    if output is None:
+        failure = job['failureLocation'] and read_s3_location(job['failureLocation'])
+
+        if failure:
+            return {'job': job_id, 'status': 'failed', 'error': failure[0].decode('utf-8', 'replace')}
+
+        return {'job': job_id, 'status': 'pending'}
+
+    scores = decode_scores(output[0], output[1] or SAGEMAKER_ACCEPT)
+
+    if len(scores) != job['count']:
+        raise Exception(f'Expected {job["count"]} predictions from the endpoint, got {len(scores)}')
+
+    response = format_predictions(job['shape'], job['target'], scores)
+    response.update(job=job_id, status='completed')
+    return response
+
+
+def read_s3_location(uri):
+    """Returns the body and content type of an `s3://` object, or None
+    if it does not exist (yet)."""
+
+    bucket, _, key = uri[len('s3://'):].partition('/')
+
+    try:
+        response = s3_client.get_object(Bucket=bucket, Key=key)
+    except Exception as ex:
+        if _http_status(ex) == 404:
+            return None
+
+        raise
+
+    return response['Body'].read(), response.get('ContentType')
+
+
+def request_route(event):
+    """Returns the endpoint call options of a request: the production
+    variant it pins with `targetVariant` and, on a multi-model endpoint,
+    the model it names with `targetModel`."""
+
+    route = {}
+    fields = event if isinstance(event, dict) else {}
+
+    if fields.get('targetVariant') is not None:
+        variant = fields['targetVariant']
+
+        if not isinstance(variant, str):
+            raise InvalidRequest(f'Invalid request: targetVariant must be a string, got {type(variant).__name__}')
+
+        if ASYNC_INFERENCE:
+            raise InvalidRequest('Invalid request: targetVariant is not supported by asynchronous inference')
+
+        route['TargetVariant'] = variant
+
+    if fields.get('targetModel') is not None:
+        model = fields['targetModel']
+
+        if not MULTI_MODEL:
+            raise InvalidRequest('Invalid request: targetModel is only supported by a multi-model endpoint')
+
+        if not isinstance(model, str) or not _TARGET_MODEL.fullmatch(model) or '..' in model.split('/'):
+            raise InvalidRequest(f'Invalid request: targetModel must be a model key, got {model!r}')
+
+        route['TargetModel'] = model
+    elif MULTI_MODEL:
+        raise InvalidRequest('Invalid request: targetModel is required by a multi-model endpoint')
+
+    return route
+
+
+def fleet_route(fleet_cache, event, route):
+    """Returns the schema of the fleet predictor a request names with
+    `predictor`, adding its endpoint to the route. An unknown predictor
+    may have been added since the routing object was last read, so it
+    is looked up again before the request is rejected."""
+
+    name = event.get('predictor') if isinstance(event, dict) else None
+
+    if not isinstance(name, str):
+        raise InvalidRequest('Invalid request: predictor is required by a predictor fleet')
+
+    fleet = fleet_cache.get()
+
+    if name not in fleet.schemas:
+        fleet = fleet_cache.revalidate(_MIN_REVALIDATE_INTERVAL)
+
+    if name not in fleet.schemas:
+        raise InvalidRequest(f'Invalid request: unknown predictor {name!r}')
+
+    route['EndpointName'] = fleet.endpoints[name]
+    return fleet.schemas[name]
+
+
+def parse_request(schema, event):
+    """Encodes a scoring request. Returns its CSV payload, the number of
+    rows and the shape of the request: `columns`, `instances` or
+    `record`."""
+
+    columns = batch_columns(event)
+
+    if columns is not None:
+        csv = schema.encoder.encode_columns(columns)
+        return csv, len(columns[schema.encoder.column_names[0]]), 'columns'
+
+    instances = batch_instances(event)
+
+    if instances is not None:
+        return schema.encoder.encode_batch(instances), len(instances), 'instances'
+
+    return schema.encoder.encode(event), 1, 'record'
+
+
+def format_predictions(shape, target, scores):
+    """Answers in the shape of the request the scores are for."""
+
+    if shape == 'columns':
+        return {
+            'predictions': {
+                target: scores
+            }
+        }
+
+    if shape == 'instances':
+        return {
+            'predictions': [{target: score} for score in scores]
+        }
 
-def lambda_handler(event, context):
-    csv = convert_json_request_to_csv(event, column_names[1:])
-    resp = predict(csv)
-    score = resp['predictions'][0]['score']
     return {
         'prediction': {
-            column_names[0]: score
+            target: scores[0]
+        }
+    }
+
+
+def handle_request(event):
+    job_id = async_job_id(event)
+
+    if job_id is not None:
+        return fetch_job(job_id)
+
+    route = request_route(event)
+
+    if PREDICTOR_FLEET:
+        schema = fleet_route(schema_cache, event, route)
+    elif MULTI_MODEL:
+        schema = model_schema_cache.get(route['TargetModel'])
+    else:
+        schema = schema_cache.get()
+
+    csv, count, shape = parse_request(schema, event)
+
+    if ASYNC_INFERENCE:
+        return submit_job(schema, csv, count, shape)
+
+    scores, hits = score_payload(schema, csv, count, route)
+    return with_cache_hits(format_predictions(shape, schema.target, scores), hits)
+
+
+def is_http_event(event):
+    """Whether the event is an HTTP request from a Function URL or an HTTP
+    API, which both use payload format 2.0."""
+
+    return (isinstance(event, dict) and event.get('version') == '2.0'
+            and isinstance(event.get('requestContext'), dict) and 'http' in event['requestContext'])
+
+
+def http_request_body(event, headers):
+    body = event.get('body') or ''
+    data = base64.b64decode(body) if event.get('isBase64Encoded') else body.encode()
+
+    if 'gzip' in headers.get('content-encoding', ''):
+        data = gunzip(data, _MAX_REQUEST_BYTES)
+
+    return _json_loads(data)
+
+
+def gunzip(data, max_length):
+    """Inflates a gzip member, raising `RequestTooLarge` as soon as it
+    grows past `max_length` bytes rather than buffering all of it."""
+
+    inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    inflated = inflater.decompress(data, max_length + 1)
+
+    if len(inflated) > max_length or inflater.unconsumed_tail:
+        raise RequestTooLarge(f'the inflated body is larger than {max_length} bytes')
+
+    if not inflater.eof:
+        raise Exception('the body is truncated')
+
+    return inflated
+
+
+def http_response(status, payload, headers):
+    body = json.dumps(payload).encode()
+    response_headers = {'Content-Type': 'application/json'}
+
+    if len(body) >= _COMPRESS_MIN_BYTES and 'gzip' in headers.get('accept-encoding', ''):
+        response_headers['Content-Encoding'] = 'gzip'
+        return {
+            'statusCode': status,
+            'headers': response_headers,
+            'body': base64.b64encode(gzip.compress(body, compresslevel=5)).decode(),
+            'isBase64Encoded': True,
         }
+
+    return {
+        'statusCode': status,
+        'headers': response_headers,
+        'body': body.decode(),
+        'isBase64Encoded': False,
     }
 
 
+def handle_http(event):
+    """Answers an HTTP request. Failures other than invalid requests are
+    logged rather than described to the caller."""
+
+    # Header names arrive lower-cased in payload format 2.0.
+    headers = event.get('headers') or {}
+
+    if event['requestContext']['http'].get('method') != 'POST':
+        return http_response(405, {'error': 'Only POST requests are supported'}, headers)
+
+    try:
+        request = http_request_body(event, headers)
+    except RequestTooLarge as ex:
+        return http_response(413, {'error': f'Invalid request: {ex}'}, headers)
+    except Exception:
+        return http_response(400, {'error': 'Invalid request: the body is not JSON'}, headers)
+
+    try:
+        return http_response(200, handle_request(request), headers)
+    except InvalidRequest as ex:
+        return http_response(400, {'error': str(ex)}, headers)
+    except Exception:
+        logger.exception('Failed to answer an HTTP request')
+        return http_response(500, {'error': 'Internal error'}, headers)
+
+
+def lambda_handler(event, context):
+    if is_http_event(event):
+        return handle_http(event)
+
+    return handle_request(event)
+
+
 if __name__ == '__main__':
     test_datum = {
         "fixed acidity": 7.8,
@@ -0,0 +1,179 @@
+#  Copyright 2016-2021, Pulumi Corporation.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Resolves the serving images of built-in SageMaker frameworks without
+importing the SageMaker SDK, which takes seconds.
+
+Images are looked up in `image_uris.json`, a table bundled with the
+provider, then in an on-disk cache of earlier lookups. Only a miss in
+both imports `sagemaker` and asks `sagemaker.image_uris.retrieve`,
+recording the answer in the cache. Cached answers are only used with
+a table generated from the same SDK version, and both the table and
+the cache must have the layout of this module's TABLE_VERSION.
+
+Maintainers regenerate the table from the installed SDK with:
+
+    python -m sagemakerlambda_provider.image_uris
+
+"""
+
+import json
+import os
+import pathlib
+
+from typing import Dict, Optional
+
+
+TABLE_PATH = pathlib.Path(__file__).absolute().parent.joinpath('image_uris.json')
+
+# Bump when the layout of the table changes.
+TABLE_VERSION = 1
+
+_table: Optional[dict] = None
+
+
+def _load_table() -> dict:
+    global _table
+
+    if _table is None:
+        with open(TABLE_PATH) as fp:
+            table = json.load(fp)
+
+        if table.get('version') != TABLE_VERSION:
+            raise Exception(f'{TABLE_PATH} has layout version {table.get("version")!r}, expected {TABLE_VERSION}; '
+                            'regenerate it with python -m sagemakerlambda_provider.image_uris')
+
+        _table = table
+
+    return _table
+
+
+def _cache_path() -> pathlib.Path:
+    root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return pathlib.Path(root, 'pulumi-sagemakerlambda', f'image-uris-{TABLE_VERSION}.json')
+
+
+def _read_cache() -> Dict[str, str]:
+    try:
+        with open(_cache_path()) as fp:
+            cache = json.load(fp)
+
+        if cache.get('version') == TABLE_VERSION and cache.get('sagemaker') == _load_table()['sagemaker']:
+            return cache['images']
+    except Exception:
+        pass
+
+    return {}
+
+
+def _write_cache(images: Dict[str, str]) -> None:
+    path = _cache_path()
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f'{path.name}.{os.getpid()}')
+
+        with open(tmp_path, 'w') as fp:
+            json.dump({'version': TABLE_VERSION, 'sagemaker': _load_table()['sagemaker'], 'images': images}, fp)
+
+        os.replace(tmp_path, path)
+    except OSError:
+        # The cache only saves time; a read-only home must not fail a deployment.
+        pass
+
+
+def lookup(framework: str, region: str) -> Optional[str]:
+    """The image URI of a framework from the bundled table, if it is there."""
+
+    table = _load_table()
+    entry = table['frameworks'].get(framework)
+
+    if entry is None or region not in entry['registries']:
+        return None
+
+    domain = table['domains'].get(region, 'amazonaws.com')
+    return f'{entry["registries"][region]}.dkr.ecr.{region}.{domain}/{entry["image"]}'
+
+
+def resolve(framework: str, region: str) -> str:
+    """The image URI serving a built-in framework in a region."""
+
+    uri = lookup(framework, region)
+
+    if uri is not None:
+        return uri
+
+    key = f'{framework}/{region}'
+    images = _read_cache()
+
+    if key not in images:
+        import sagemaker
+
+        images[key] = sagemaker.image_uris.retrieve(framework=framework, region=region)
+        _write_cache(images)
+
+    return images[key]
+
+
+def generate() -> dict:
+    """Builds the table from the installed SageMaker SDK, covering the
+    frameworks it can resolve without a version."""
+
+    import sagemaker
+
+    config_dir = pathlib.Path(sagemaker.image_uris.__file__).parent.joinpath('image_uri_config')
+    frameworks = {}
+    domains = {}
+
+    for config in sorted(config_dir.glob('*.json')):
+        framework = config.stem
+        registries = {}
+        image = None
+
+        for region in sorted(sagemaker.image_uris.config_for_framework('linear-learner')['versions']['1']['registries']):
+            try:
+                uri = sagemaker.image_uris.retrieve(framework=framework, region=region)
+            except Exception:
+                continue
+
+            registry, _, repository = uri.partition('/')
+            account, _, domain = registry.partition(f'.dkr.ecr.{region}.')
+
+            if not domain:
+                raise Exception(f'Unexpected image URI layout {uri}')
+
+            if domain != 'amazonaws.com':
+                domains[region] = domain
+
+            if image is not None and repository != image:
+                raise Exception(f'{framework} uses different images across regions')
+
+            registries[region] = account
+            image = repository
+
+        if image is not None:
+            frameworks[framework] = {'image': image, 'registries': registries}
+
+    return {
+        'version': TABLE_VERSION,
+        'sagemaker': sagemaker.__version__,
+        'domains': domains,
+        'frameworks': frameworks,
+    }
+
+
+if __name__ == '__main__':
+    with open(TABLE_PATH, 'w') as fp:
+        json.dump(generate(), fp, indent=2, sort_keys=True)
+        fp.write('\n')
@@ -19,9 +19,6 @@ from pulumi.provider import ConstructResult
 import pulumi.provider as provider
 
 import sagemakerlambda_provider
-from sagemakerlambda_provider.sagemakerlambda import \
-    SagemakerPredictorLambda, \
-    SagemakerPredictorLambdaArgs
 
 
 class Provider(provider.Provider):
@@ -38,6 +35,9 @@ class Provider(provider.Provider):
         if resource_type == 'sagemakerlambda:index:SagemakerPredictorLambda':
             return _construct_predictor_lambda(name, inputs, options)
 
+        if resource_type == 'sagemakerlambda:index:SagemakerPredictorFleet':
+            return _construct_predictor_fleet(name, inputs, options)
+
         raise Exception(f'Unknown resource type {resource_type}')
 
 
@@ -47,6 +47,12 @@ def _construct_predictor_lambda(name: str,
                                 options: Optional[ResourceOptions] = None) -> ConstructResult:
     """This boilerplate will eventually be automated."""
 
+    # Imported here so that starting the provider, which every preview
+    # does, does not pay for loading pulumi_aws until it is needed.
+    from sagemakerlambda_provider.sagemakerlambda import \
+        SagemakerPredictorLambda, \
+        SagemakerPredictorLambdaArgs
+
     # Create the component resource.
     l = SagemakerPredictorLambda(
         name,
@@ -60,5 +66,31 @@ def _construct_predictor_lambda(name: str,
         state={
             'trainingRoleArn': l.training_role_arn,
             'endpointName': l.endpoint_name,
-            'lambdaFunctionName': l.lambda_function_name
+            'modelName': l.model_name,
+            'lambdaFunctionName': l.lambda_function_name,
+            'lambdaAliasArn': l.lambda_alias_arn,
+            'predictorUrl': l.predictor_url
+        })
+
+
+def _construct_predictor_fleet(name: str,
+                               inputs: Inputs,
+                               options: Optional[ResourceOptions] = None) -> ConstructResult:
+
+    from sagemakerlambda_provider.fleet import \
+        SagemakerPredictorFleet, \
+        SagemakerPredictorFleetArgs
+
+    fleet = SagemakerPredictorFleet(
+        name,
+        SagemakerPredictorFleetArgs.from_inputs(inputs),
+        dict(inputs),
+        options)
+
+    return provider.ConstructResult(
+        urn=fleet.urn,
+        state={
+            'trainingRoleArn': fleet.training_role_arn,
+            'lambdaFunctionName': fleet.lambda_function_name,
+            'endpointNames': fleet.endpoint_names
         })
@@ -15,12 +15,211 @@
 import json
 import pathlib
 
-from typing import Optional, List
+from typing import Any, Callable, Dict, Optional, List
 
 from pulumi_aws import sagemaker, iam, kms, lambda_, s3
 import pulumi
 import pulumi_aws as aws
-import sagemaker as real_sagemaker
+
+from sagemakerlambda_provider import image_uris
+
+
+SCHEMA_SOURCES = ['s3', 'archive', 'environment']
+
+
+# Region and account lookups are provider invokes that every component
+# would otherwise repeat. The provider process shares one lookup of
+# each per stack and AWS configuration across all components.
+_aws_lookups: Dict[tuple, pulumi.Output] = {}
+
+
+def _memoized_lookup(kind: str, invoke: Callable[[], pulumi.Output]) -> pulumi.Output:
+    aws_config = pulumi.Config('aws')
+    key = (kind, pulumi.get_project(), pulumi.get_stack(), aws_config.get('region'), aws_config.get('profile'))
+
+    if key not in _aws_lookups:
+        _aws_lookups[key] = invoke()
+
+    return _aws_lookups[key]
+
+
+def _default_region() -> pulumi.Output:
+    return _memoized_lookup('region', lambda: aws.get_region_output().name)
+
+
+def _default_account_id() -> pulumi.Output:
+    # get_caller_identity has no _output form; deferring it to an apply
+    # is what those forms do.
+    return _memoized_lookup('account_id', lambda: pulumi.Output.from_input({}).apply(
+        lambda _: aws.get_caller_identity().account_id))
+
+
+def _plain(value: Any, name: str) -> Any:
+    """Options that decide which resources to create must be known when
+    the component is constructed, so they cannot be Outputs."""
+
+    if isinstance(value, pulumi.Output):
+        raise Exception(f'{name} must be a plain value known at construction time')
+
+    return value
+
+
+def _env_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+
+    # Numbers arrive from the engine as floats, even integral ones.
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+
+    return str(value)
+
+
+def _assume_role_policy(service: str) -> str:
+    return json.dumps({
+        'Version': '2012-10-17',
+        'Statement': [
+            {
+                'Action': 'sts:AssumeRole',
+                'Effect': 'Allow',
+                'Principal': {
+                    'Service': service
+                }
+            }
+        ],
+    })
+
+
+def _lambda_role_policy(bucket: str, region: str, account_id: str) -> str:
+    return json.dumps({
+        'Version': '2012-10-17',
+        'Statement': [
+            {
+                'Action': [
+                    's3:GetObject',
+                    's3:ListBucket'
+                ],
+                'Effect': 'Allow',
+                'Resource': [
+                    f'arn:aws:s3:::{bucket}',
+                    f'arn:aws:s3:::{bucket}/*',
+                ]
+            },
+            {
+                'Action': [
+                    'logs:CreateLogGroup',
+                    'logs:CreateLogStream',
+                    'logs:PutLogEvents'
+                ],
+                'Effect': 'Allow',
+                'Resource': f'arn:aws:logs:{region}:{account_id}:log-group:/aws/lambda/*'
+            }
+        ],
+    })
+
+
+def _training_role_policy(bucket: str, region: str, account_id: str) -> str:
+    return json.dumps({
+        'Version': '2012-10-17',
+        'Statement': [
+            {
+                'Action': [
+                    's3:GetObject',
+                    's3:PutObject',
+                    's3:DeleteObject',
+                    's3:ListBucket'
+                ],
+                'Effect': 'Allow',
+                'Resource': [
+                    f'arn:aws:s3:::{bucket}',
+                    f'arn:aws:s3:::{bucket}/*',
+                ]
+            },
+            {
+                'Action': [
+                    'logs:CreateLogGroup',
+                    'logs:CreateLogStream',
+                    'logs:DescribeLogStreams',
+                    'logs:GetLogEvents',
+                    'logs:PutLogEvents'
+                ],
+                'Effect': 'Allow',
+                'Resource': f'arn:aws:logs:{region}:{account_id}:log-group:/aws/sagemaker/*'
+            },
+            {
+                'Action': [
+                    'sagemaker:CreateTrainingJob',
+                    'sagemaker:DescribeTrainingJob',
+                ],
+                'Effect': 'Allow',
+                'Resource': f'arn:aws:sagemaker:{region}:{account_id}:*'
+            },
+            {
+                'Action': [
+                    'kms:Encrypt',
+                    'kms:Decrypt',
+                    'kms:ReEncrypt*',
+                    'kms:GenerateDataKey*',
+                    'kms:DescribeKey'
+                ],
+                'Effect': 'Allow',
+                'Resource': f'arn:aws:kms:{region}:{account_id}:*'
+            },
+        ]
+    })
+
+
+def _invoke_statements(endpoint_arn: str, bucket: str, async_prefix: Optional[str]) -> list:
+    """Policy statements letting the Lambda function call the endpoint
+    and, for asynchronous inference, stage its requests."""
+
+    if async_prefix is None:
+        return [
+            {
+                'Action': [
+                    'sagemaker:InvokeEndpoint'
+                ],
+                'Effect': 'Allow',
+                'Resource': endpoint_arn
+            }
+        ]
+
+    return [
+        {
+            'Action': [
+                'sagemaker:InvokeEndpointAsync'
+            ],
+            'Effect': 'Allow',
+            'Resource': endpoint_arn
+        },
+        {
+            'Action': [
+                's3:PutObject'
+            ],
+            'Effect': 'Allow',
+            'Resource': f'arn:aws:s3:::{bucket}/{async_prefix}*'
+        }
+    ]
+
+
+def _model_prefix(key: str) -> str:
+    """The S3 prefix a multi-model endpoint loads its models from."""
+
+    return key if key.endswith('/') else f'{key}/'
+
+
+def _customized_metric(metric: dict) -> Any:
+    return aws.appautoscaling.PolicyTargetTrackingScalingPolicyConfigurationCustomizedMetricSpecificationArgs(
+        metric_name=metric['metricName'],
+        namespace=metric['namespace'],
+        statistic=metric['statistic'],
+        unit=metric.get('unit'),
+        dimensions=[
+            aws.appautoscaling.PolicyTargetTrackingScalingPolicyConfigurationCustomizedMetricSpecificationDimensionArgs(
+                name=k, value=v)
+            for k, v in (metric.get('dimensions') or {}).items()
+        ]
+    )
 
 
 class SagemakerPredictorLambdaArgs:
@@ -48,7 +247,8 @@ class SagemakerPredictorLambdaArgs:
     """AWS region name. If None, infer from the environment."""
 
     account_id: pulumi.Input[str]
-    """AWS account ID."""
+    """AWS account ID. If None, the account of the AWS provider's
+    credentials."""
 
     model_image: pulumi.Input[str]
     """Custom Docker image for serving the model in the SageMaker
@@ -60,6 +260,204 @@ class SagemakerPredictorLambdaArgs:
     given, model_image should not be given as the code will find the
     right image automatically. """
 
+    schema_source: str
+    """Where the Lambda function reads the feature schema from. `s3`
+    (the default) stores it as an object in model_data_bucket that the
+    function fetches, `archive` bundles it as `schema.json` with the
+    function code and `environment` passes it in the `SCHEMA_JSON`
+    variable. The latter two spare every cold start an S3 request."""
+
+    client_max_pool_connections: Optional[pulumi.Input[int]]
+    """Size of the HTTP connection pool of the Lambda function's
+    SageMaker runtime client. Defaults to the botocore default of 10."""
+
+    client_connect_timeout: Optional[pulumi.Input[float]]
+    """Connect timeout in seconds of the SageMaker runtime client."""
+
+    client_read_timeout: Optional[pulumi.Input[float]]
+    """Read timeout in seconds of the SageMaker runtime client."""
+
+    client_retry_mode: Optional[pulumi.Input[str]]
+    """botocore retry mode of the SageMaker runtime client: `legacy`,
+    `standard` or `adaptive`."""
+
+    client_max_attempts: Optional[pulumi.Input[int]]
+    """Total number of attempts, including the first, the SageMaker
+    runtime client makes per call."""
+
+    client_tcp_keepalive: Optional[pulumi.Input[bool]]
+    """Whether the SageMaker runtime client enables TCP keepalive on its
+    connections."""
+
+    client_accept: Optional[pulumi.Input[str]]
+    """Response type the Lambda function requests from the endpoint:
+    `text/json` (default) or `text/csv`, which is cheaper to parse."""
+
+    batch_max_rows: Optional[pulumi.Input[int]]
+    """Maximum number of rows the Lambda function sends per endpoint
+    call; larger batches are split into chunks. Defaults to 1000."""
+
+    batch_max_bytes: Optional[pulumi.Input[int]]
+    """Maximum CSV payload size in bytes per endpoint call. Defaults to
+    5000000, under the 6 MB SageMaker limit."""
+
+    batch_concurrency: Optional[pulumi.Input[int]]
+    """Number of chunks of one batch the Lambda function scores in
+    parallel. Defaults to 4."""
+
+    prediction_cache_size: Optional[pulumi.Input[int]]
+    """Maximum number of encoded feature rows whose scores the Lambda
+    function caches in memory. Defaults to 0, which disables the cache."""
+
+    prediction_cache_ttl: Optional[pulumi.Input[float]]
+    """Seconds a cached score stays valid. Defaults to 0, keeping scores
+    until they are evicted."""
+
+    prediction_cache_backend: Optional[pulumi.Input[str]]
+    """Where the Lambda function caches scores: `memory` (default), an
+    LRU per container, or `redis`, a server shared by all containers."""
+
+    prediction_cache_url: Optional[pulumi.Input[str]]
+    """URL of the Redis server for the `redis` prediction cache, such as
+    `redis://host:6379/0`, or `rediss://` for TLS."""
+
+    lambda_subnet_ids: Optional[pulumi.Input[List[str]]]
+    """VPC subnets to run the Lambda function in, for example to reach an
+    ElastiCache prediction cache. The subnets then need a route to S3
+    and the SageMaker runtime."""
+
+    lambda_security_group_ids: Optional[pulumi.Input[List[str]]]
+    """Security groups of the Lambda function when it runs in a VPC."""
+
+    lambda_memory_size: Optional[pulumi.Input[int]]
+    """Memory of the Lambda function in MB, which also scales its CPU.
+    Defaults to 128."""
+
+    lambda_timeout: Optional[pulumi.Input[int]]
+    """Timeout of the Lambda function in seconds. Defaults to 30."""
+
+    lambda_architecture: Optional[pulumi.Input[str]]
+    """Instruction set of the Lambda function: `x86_64` (default) or
+    `arm64` for Graviton."""
+
+    lambda_runtime: Optional[pulumi.Input[str]]
+    """Python runtime of the Lambda function. Defaults to `python3.8`."""
+
+    reserved_concurrency: Optional[pulumi.Input[int]]
+    """Concurrent executions reserved for the Lambda function, which also
+    caps its concurrency. Unreserved by default."""
+
+    provisioned_concurrency: Optional[int]
+    """Number of pre-initialized execution environments kept warm for the
+    Lambda function. When set, a version is published and the `live`
+    alias serving it is given this provisioned concurrency."""
+
+    provisioned_concurrency_max: Optional[int]
+    """When set, Application Auto Scaling tracks provisioned concurrency
+    utilization and scales between `provisioned_concurrency` and this
+    maximum."""
+
+    provisioned_concurrency_target_utilization: pulumi.Input[float]
+    """Provisioned concurrency utilization the scaling policy aims for.
+    Defaults to 0.7."""
+
+    max_instance_count: Optional[int]
+    """When set, Application Auto Scaling scales the endpoint's
+    `AllTraffic` variant between `min_instance_count` and this many
+    instances."""
+
+    min_instance_count: pulumi.Input[int]
+    """Fewest instances the endpoint scales in to. Defaults to
+    `initial_instance_count`."""
+
+    target_invocations_per_instance: pulumi.Input[float]
+    """Invocations per instance per minute the scaling policy aims for.
+    Defaults to 70."""
+
+    scaling_custom_metric: Optional[pulumi.Input[dict]]
+    """CloudWatch metric to track instead of invocations per instance,
+    given as `metricName`, `namespace`, `statistic`, optional `unit` and
+    `dimensions` (a map of dimension names to values) and the
+    `targetValue` to aim for."""
+
+    scale_in_cooldown: pulumi.Input[int]
+    """Seconds after a scale-in before the endpoint scales in again.
+    Defaults to 300."""
+
+    scale_out_cooldown: pulumi.Input[int]
+    """Seconds after a scale-out before the endpoint scales out again.
+    Defaults to 60."""
+
+    serverless: bool
+    """Whether the endpoint uses SageMaker Serverless Inference instead of
+    dedicated instances, scaling to zero when idle. Serverless endpoints
+    take no instance type, count or autoscaling options and are not
+    encrypted with the component's KMS key."""
+
+    serverless_memory_size: pulumi.Input[int]
+    """Memory of a serverless endpoint in MB, from 1024 to 6144 in 1024
+    MB steps. Defaults to 2048."""
+
+    serverless_max_concurrency: pulumi.Input[int]
+    """Concurrent invocations a serverless endpoint serves before
+    throttling. Defaults to 20."""
+
+    async_inference: bool
+    """Whether the endpoint serves asynchronous inference. The Lambda
+    function then stages requests under `async/<name>/` in
+    `model_data_bucket`, where the endpoint also writes its output, and
+    answers with job handles that are sent back to fetch the results."""
+
+    async_success_topic_arn: Optional[pulumi.Input[str]]
+    """SNS topic notified when an asynchronous inference succeeds."""
+
+    async_error_topic_arn: Optional[pulumi.Input[str]]
+    """SNS topic notified when an asynchronous inference fails."""
+
+    async_max_concurrent_invocations_per_instance: Optional[pulumi.Input[int]]
+    """Requests each instance of an asynchronous endpoint processes at
+    once. Chosen by SageMaker by default."""
+
+    variants: Optional[List[dict]]
+    """Production variants to split traffic between, each a map with a
+    `name` and optional `modelDataKey`, `instanceType`,
+    `initialInstanceCount` and `weight`, which default to the settings
+    of the component and a weight of 1. Defaults to a single
+    `AllTraffic` variant."""
+
+    shadow_variant: Optional[dict]
+    """Variant that is sent a copy of production requests, given in the
+    same form as `variants`, whose responses SageMaker only logs. Its
+    weight relative to the production variants sets the share of
+    requests it receives."""
+
+    multi_model: bool
+    """Whether the endpoint is a multi-model endpoint, serving every model
+    artifact under the `model_data_key` prefix from shared instances.
+    Requests then name their model with `targetModel`, a key relative to
+    that prefix, and a model with a `<key>.json` schema object next to
+    its artifact is scored with that schema instead of `column_names`."""
+
+    data_capture_percentage: Optional[pulumi.Input[int]]
+    """Percentage of endpoint requests, from 1 to 100, whose payloads and
+    responses SageMaker captures as JSON Lines under
+    `capture/<name>/` in `model_data_bucket`. Capture happens on the
+    endpoint, off the Lambda function's request path; the
+    `sagemakerlambda_provider.capture` module reads it back. Not
+    supported by serverless endpoints. Disabled by default."""
+
+    http_endpoint: Optional[str]
+    """Exposes the Lambda function over HTTP, as `function_url` for a
+    Lambda Function URL or `http_api` for an API Gateway HTTP API, so
+    that clients can POST requests over reused connections instead of
+    calling the Lambda Invoke API. The URL is the `predictor_url`
+    output."""
+
+    http_auth_type: str
+    """Authorization of the HTTP endpoint, `AWS_IAM` to require SigV4
+    signed requests or `NONE` for a public endpoint. Defaults to
+    `AWS_IAM`."""
+
     def __init__(self,
                  model_data_bucket: pulumi.Input[str],
                  column_names: pulumi.Input[List[str]],
@@ -69,7 +467,129 @@ class SagemakerPredictorLambdaArgs:
                  region: Optional[pulumi.Input[str]] = None,
                  account_id: Optional[pulumi.Input[str]] = None,
                  model_image: Optional[pulumi.Input[str]] = None,
-                 model_framework: Optional[pulumi.Input[str]] = None) -> None:
+                 model_framework: Optional[pulumi.Input[str]] = None,
+                 schema_source: Optional[pulumi.Input[str]] = None,
+                 client_max_pool_connections: Optional[pulumi.Input[int]] = None,
+                 client_connect_timeout: Optional[pulumi.Input[float]] = None,
+                 client_read_timeout: Optional[pulumi.Input[float]] = None,
+                 client_retry_mode: Optional[pulumi.Input[str]] = None,
+                 client_max_attempts: Optional[pulumi.Input[int]] = None,
+                 client_tcp_keepalive: Optional[pulumi.Input[bool]] = None,
+                 client_accept: Optional[pulumi.Input[str]] = None,
+                 batch_max_rows: Optional[pulumi.Input[int]] = None,
+                 batch_max_bytes: Optional[pulumi.Input[int]] = None,
+                 batch_concurrency: Optional[pulumi.Input[int]] = None,
+                 prediction_cache_size: Optional[pulumi.Input[int]] = None,
+                 prediction_cache_ttl: Optional[pulumi.Input[float]] = None,
+                 prediction_cache_backend: Optional[pulumi.Input[str]] = None,
+                 prediction_cache_url: Optional[pulumi.Input[str]] = None,
+                 lambda_subnet_ids: Optional[pulumi.Input[List[str]]] = None,
+                 lambda_security_group_ids: Optional[pulumi.Input[List[str]]] = None,
+                 lambda_memory_size: Optional[pulumi.Input[int]] = None,
+                 lambda_timeout: Optional[pulumi.Input[int]] = None,
+                 lambda_architecture: Optional[pulumi.Input[str]] = None,
+                 lambda_runtime: Optional[pulumi.Input[str]] = None,
+                 reserved_concurrency: Optional[pulumi.Input[int]] = None,
+                 provisioned_concurrency: Optional[pulumi.Input[int]] = None,
+                 provisioned_concurrency_max: Optional[pulumi.Input[int]] = None,
+                 provisioned_concurrency_target_utilization: Optional[pulumi.Input[float]] = None,
+                 max_instance_count: Optional[pulumi.Input[int]] = None,
+                 min_instance_count: Optional[pulumi.Input[int]] = None,
+                 target_invocations_per_instance: Optional[pulumi.Input[float]] = None,
+                 scaling_custom_metric: Optional[pulumi.Input[dict]] = None,
+                 scale_in_cooldown: Optional[pulumi.Input[int]] = None,
+                 scale_out_cooldown: Optional[pulumi.Input[int]] = None,
+                 serverless: Optional[pulumi.Input[bool]] = None,
+                 serverless_memory_size: Optional[pulumi.Input[int]] = None,
+                 serverless_max_concurrency: Optional[pulumi.Input[int]] = None,
+                 async_inference: Optional[pulumi.Input[bool]] = None,
+                 async_success_topic_arn: Optional[pulumi.Input[str]] = None,
+                 async_error_topic_arn: Optional[pulumi.Input[str]] = None,
+                 async_max_concurrent_invocations_per_instance: Optional[pulumi.Input[int]] = None,
+                 variants: Optional[pulumi.Input[List[dict]]] = None,
+                 shadow_variant: Optional[pulumi.Input[dict]] = None,
+                 multi_model: Optional[pulumi.Input[bool]] = None,
+                 data_capture_percentage: Optional[pulumi.Input[int]] = None,
+                 http_endpoint: Optional[pulumi.Input[str]] = None,
+                 http_auth_type: Optional[pulumi.Input[str]] = None) -> None:
+
+        self.serverless = bool(_plain(serverless, 'serverless'))
+
+        if self.serverless:
+            conflicting = [option for option, value in [
+                ('instance_type', instance_type),
+                ('initial_instance_count', initial_instance_count),
+                ('max_instance_count', max_instance_count),
+            ] if value is not None]
+
+            if conflicting:
+                raise Exception('A serverless endpoint cannot be combined with ' + ', '.join(conflicting))
+
+        if serverless_memory_size is None:
+            serverless_memory_size = 2048
+
+        if serverless_max_concurrency is None:
+            serverless_max_concurrency = 20
+
+        self.serverless_memory_size = serverless_memory_size
+        self.serverless_max_concurrency = serverless_max_concurrency
+
+        self.async_inference = bool(_plain(async_inference, 'async_inference'))
+
+        if self.async_inference and self.serverless:
+            raise Exception('Asynchronous inference is not supported on serverless endpoints')
+
+        self.async_success_topic_arn = async_success_topic_arn
+        self.async_error_topic_arn = async_error_topic_arn
+        self.async_max_concurrent_invocations_per_instance = async_max_concurrent_invocations_per_instance
+
+        self.variants = _plain(variants, 'variants')
+        self.shadow_variant = _plain(shadow_variant, 'shadow_variant')
+
+        all_variants = (self.variants or []) + ([self.shadow_variant] if self.shadow_variant else [])
+        names = [_plain(v.get('name'), 'variant name') for v in all_variants]
+
+        if not all(isinstance(n, str) and n for n in names):
+            raise Exception('Every variant needs a name')
+
+        if len(set(names)) != len(names):
+            raise Exception('Variant names must be unique')
+
+        if self.serverless and any('instanceType' in v or 'initialInstanceCount' in v for v in all_variants):
+            raise Exception('Variants of a serverless endpoint cannot set instanceType or initialInstanceCount')
+
+        self.multi_model = bool(_plain(multi_model, 'multi_model'))
+
+        if self.multi_model and self.serverless:
+            raise Exception('Multi-model endpoints are not supported by serverless inference')
+
+        if self.multi_model and self.async_inference:
+            raise Exception('Multi-model endpoints are not supported by asynchronous inference')
+
+        data_capture_percentage = _plain(data_capture_percentage, 'data_capture_percentage')
+
+        if data_capture_percentage is not None and self.serverless:
+            raise Exception('Data capture is not supported by serverless endpoints')
+
+        if data_capture_percentage is not None and (
+                isinstance(data_capture_percentage, bool) or
+                not isinstance(data_capture_percentage, (int, float)) or
+                data_capture_percentage != int(data_capture_percentage) or
+                not 1 <= data_capture_percentage <= 100):
+            raise Exception('data_capture_percentage must be a whole number from 1 to 100, '
+                            f'got {data_capture_percentage!r}')
+
+        self.data_capture_percentage = None if data_capture_percentage is None else int(data_capture_percentage)
+
+        self.http_endpoint = _plain(http_endpoint, 'http_endpoint')
+
+        if self.http_endpoint not in (None, 'function_url', 'http_api'):
+            raise Exception(f'Unknown http_endpoint {self.http_endpoint!r}, expected function_url or http_api')
+
+        self.http_auth_type = _plain(http_auth_type, 'http_auth_type') or 'AWS_IAM'
+
+        if self.http_auth_type not in ('AWS_IAM', 'NONE'):
+            raise Exception(f'Unknown http_auth_type {self.http_auth_type!r}, expected AWS_IAM or NONE')
 
         if initial_instance_count is None:
             initial_instance_count = 1
@@ -86,12 +606,12 @@ class SagemakerPredictorLambdaArgs:
         if region is not None:
             self.region = region
         else:
-            self.region = aws.get_region().name
+            self.region = _default_region()
 
         if account_id is not None:
             self.account_id = account_id
         else:
-            self.account_id = aws.get_caller_identity().account_id
+            self.account_id = _default_account_id()
 
         if model_image is not None:
             self.model_image = model_image
@@ -99,13 +619,90 @@ class SagemakerPredictorLambdaArgs:
             if model_framework is not None:
                 self.model_image = pulumi.Output.from_input(model_framework).apply(
                     lambda f: pulumi.Output.from_input(self.region).apply(
-                        lambda r: real_sagemaker.image_uris.retrieve(framework=f, region=r)))
+                        lambda r: image_uris.resolve(f, r)))
             else:
                 raise Exception('model_framework is required when model_image is unspecified')
 
         self.model_data_bucket = pulumi.Output.from_input(model_data_bucket)
         self.model_data_key = pulumi.Output.from_input(model_data_key) if model_data_key is not None else None
 
+        schema_source = _plain(schema_source, 'schema_source')
+
+        if schema_source is None:
+            schema_source = 's3'
+
+        if schema_source not in SCHEMA_SOURCES:
+            raise Exception(f'schema_source must be one of {", ".join(SCHEMA_SOURCES)}, got {schema_source}')
+
+        self.schema_source = schema_source
+
+        self.client_max_pool_connections = client_max_pool_connections
+        self.client_connect_timeout = client_connect_timeout
+        self.client_read_timeout = client_read_timeout
+        self.client_retry_mode = client_retry_mode
+        self.client_max_attempts = client_max_attempts
+        self.client_tcp_keepalive = client_tcp_keepalive
+        self.client_accept = client_accept
+
+        self.batch_max_rows = batch_max_rows
+        self.batch_max_bytes = batch_max_bytes
+        self.batch_concurrency = batch_concurrency
+
+        self.prediction_cache_size = prediction_cache_size
+        self.prediction_cache_ttl = prediction_cache_ttl
+        self.prediction_cache_backend = prediction_cache_backend
+        self.prediction_cache_url = prediction_cache_url
+
+        self.lambda_subnet_ids = lambda_subnet_ids
+        self.lambda_security_group_ids = lambda_security_group_ids
+
+        if lambda_timeout is None:
+            lambda_timeout = 30
+
+        if lambda_runtime is None:
+            lambda_runtime = 'python3.8'
+
+        self.lambda_memory_size = lambda_memory_size
+        self.lambda_timeout = lambda_timeout
+        self.lambda_architecture = lambda_architecture
+        self.lambda_runtime = lambda_runtime
+        self.reserved_concurrency = reserved_concurrency
+
+        self.provisioned_concurrency = _plain(provisioned_concurrency, 'provisioned_concurrency')
+        self.provisioned_concurrency_max = _plain(provisioned_concurrency_max, 'provisioned_concurrency_max')
+
+        if self.provisioned_concurrency_max is not None and self.provisioned_concurrency is None:
+            raise Exception('provisioned_concurrency_max requires provisioned_concurrency')
+
+        if provisioned_concurrency_target_utilization is None:
+            provisioned_concurrency_target_utilization = 0.7
+
+        self.provisioned_concurrency_target_utilization = provisioned_concurrency_target_utilization
+
+        self.max_instance_count = _plain(max_instance_count, 'max_instance_count')
+
+        if self.max_instance_count is None and (min_instance_count is not None or
+                                                target_invocations_per_instance is not None or
+                                                scaling_custom_metric is not None):
+            raise Exception('Endpoint autoscaling options require max_instance_count')
+
+        if min_instance_count is None:
+            min_instance_count = initial_instance_count
+
+        if target_invocations_per_instance is None:
+            target_invocations_per_instance = 70
+
+        if scale_in_cooldown is None:
+            scale_in_cooldown = 300
+
+        if scale_out_cooldown is None:
+            scale_out_cooldown = 60
+
+        self.min_instance_count = min_instance_count
+        self.target_invocations_per_instance = target_invocations_per_instance
+        self.scaling_custom_metric = scaling_custom_metric
+        self.scale_in_cooldown = scale_in_cooldown
+        self.scale_out_cooldown = scale_out_cooldown
 
     @staticmethod
     def from_inputs(inputs: pulumi.Inputs) -> 'SagemakerPredictorLambdaArgs':
@@ -120,7 +717,51 @@ class SagemakerPredictorLambdaArgs:
             region=inputs.get('region', None),
             account_id=inputs.get('accountId', None),
             model_image=inputs.get('modelImage', None),
-            model_framework=inputs.get('modelFramework', None)
+            model_framework=inputs.get('modelFramework', None),
+            schema_source=inputs.get('schemaSource', None),
+            client_max_pool_connections=inputs.get('clientMaxPoolConnections', None),
+            client_connect_timeout=inputs.get('clientConnectTimeout', None),
+            client_read_timeout=inputs.get('clientReadTimeout', None),
+            client_retry_mode=inputs.get('clientRetryMode', None),
+            client_max_attempts=inputs.get('clientMaxAttempts', None),
+            client_tcp_keepalive=inputs.get('clientTcpKeepalive', None),
+            client_accept=inputs.get('clientAccept', None),
+            batch_max_rows=inputs.get('batchMaxRows', None),
+            batch_max_bytes=inputs.get('batchMaxBytes', None),
+            batch_concurrency=inputs.get('batchConcurrency', None),
+            prediction_cache_size=inputs.get('predictionCacheSize', None),
+            prediction_cache_ttl=inputs.get('predictionCacheTtl', None),
+            prediction_cache_backend=inputs.get('predictionCacheBackend', None),
+            prediction_cache_url=inputs.get('predictionCacheUrl', None),
+            lambda_subnet_ids=inputs.get('lambdaSubnetIds', None),
+            lambda_security_group_ids=inputs.get('lambdaSecurityGroupIds', None),
+            lambda_memory_size=inputs.get('lambdaMemorySize', None),
+            lambda_timeout=inputs.get('lambdaTimeout', None),
+            lambda_architecture=inputs.get('lambdaArchitecture', None),
+            lambda_runtime=inputs.get('lambdaRuntime', None),
+            reserved_concurrency=inputs.get('reservedConcurrency', None),
+            provisioned_concurrency=inputs.get('provisionedConcurrency', None),
+            provisioned_concurrency_max=inputs.get('provisionedConcurrencyMax', None),
+            provisioned_concurrency_target_utilization=inputs.get('provisionedConcurrencyTargetUtilization', None),
+            max_instance_count=inputs.get('maxInstanceCount', None),
+            min_instance_count=inputs.get('minInstanceCount', None),
+            target_invocations_per_instance=inputs.get('targetInvocationsPerInstance', None),
+            scaling_custom_metric=inputs.get('scalingCustomMetric', None),
+            scale_in_cooldown=inputs.get('scaleInCooldown', None),
+            scale_out_cooldown=inputs.get('scaleOutCooldown', None),
+            serverless=inputs.get('serverless', None),
+            serverless_memory_size=inputs.get('serverlessMemorySize', None),
+            serverless_max_concurrency=inputs.get('serverlessMaxConcurrency', None),
+            async_inference=inputs.get('asyncInference', None),
+            async_success_topic_arn=inputs.get('asyncSuccessTopicArn', None),
+            async_error_topic_arn=inputs.get('asyncErrorTopicArn', None),
+            async_max_concurrent_invocations_per_instance=inputs.get('asyncMaxConcurrentInvocationsPerInstance', None),
+            variants=inputs.get('variants', None),
+            shadow_variant=inputs.get('shadowVariant', None),
+            multi_model=inputs.get('multiModel', None),
+            data_capture_percentage=inputs.get('dataCapturePercentage', None),
+            http_endpoint=inputs.get('httpEndpoint', None),
+            http_auth_type=inputs.get('httpAuthType', None)
         )
 
 
@@ -132,9 +773,20 @@ class SagemakerPredictorLambda(pulumi.ComponentResource):
     endpoint_name: Optional[pulumi.Output[str]]
     """Name of the provisioned SageMaker endpoint."""
 
+    model_name: Optional[pulumi.Output[str]]
+    """Name of the SageMaker model behind the endpoint, which can also
+    score offline with Batch Transform."""
+
     lambda_function_name: Optional[pulumi.Output[str]]
     """Name of the provisioned Lambda function."""
 
+    lambda_alias_arn: Optional[pulumi.Output[str]]
+    """ARN of the Lambda alias serving provisioned concurrency, if any.
+    Invoking the unqualified function bypasses the warm environments."""
+
+    predictor_url: Optional[pulumi.Output[str]]
+    """URL to POST prediction requests to, if `http_endpoint` is set."""
+
 
     def __init__(self,
                  name: str,
@@ -147,55 +799,25 @@ class SagemakerPredictorLambda(pulumi.ComponentResource):
         account_id = args.account_id
         region = args.region
 
-        kms_key = kms.Key(
-            f'{name}-kms-key',
-            deletion_window_in_days=30,
-            opts=pulumi.ResourceOptions(parent=self)
-        )
+        # Serverless endpoints have no instance storage to encrypt.
+        kms_key = None
+
+        if not args.serverless:
+            kms_key = kms.Key(
+                f'{name}-kms-key',
+                deletion_window_in_days=30,
+                opts=pulumi.ResourceOptions(parent=self)
+            )
 
         lambda_role = iam.Role(
             f'{name}-lambda-role',
-            assume_role_policy=json.dumps({
-                'Version': '2012-10-17',
-                'Statement': [
-                    {
-                        'Action': 'sts:AssumeRole',
-                        'Effect': 'Allow',
-                        'Principal': {
-                            'Service': 'lambda.amazonaws.com'
-                        }
-                    }
-                ],
-            }),
+            assume_role_policy=_assume_role_policy('lambda.amazonaws.com'),
             inline_policies=[
                 iam.RoleInlinePolicyArgs(
                     name=f'{name}-lambda-role-policy',
-                    policy=pulumi.Output.from_input(args.model_data_bucket).apply(lambda bucket: json.dumps({
-                        'Version': '2012-10-17',
-                        'Statement': [
-                            {
-                                'Action': [
-                                    's3:GetObject',
-                                    's3:ListBucket'
-                                ],
-                                'Effect': 'Allow',
-                                'Resource': [
-                                    f'arn:aws:s3:::{bucket}',
-                                    f'arn:aws:s3:::{bucket}/*',
-                                ]
-                            },
-                            {
-                                'Action': [
-                                    'logs:CreateLogGroup',
-                                    'logs:CreateLogStream',
-                                    'logs:PutLogEvents'
-                                ],
-                                'Effect': 'Allow',
-                                'Resource': f'arn:aws:{region}:{account_id}:log-group:/aws/lambda/*'
-                            }
-                        ],
-                    })
-                ))
+                    policy=pulumi.Output.all(args.model_data_bucket, region, account_id).apply(
+                        lambda values: _lambda_role_policy(*values))
+                )
             ],
             opts=pulumi.ResourceOptions(parent=self)
         )
@@ -207,71 +829,15 @@ class SagemakerPredictorLambda(pulumi.ComponentResource):
         # TODO tighten kms and sagemaker perms.
         role = iam.Role(
             f'{name}-role',
-            assume_role_policy=json.dumps({
-                'Version': '2012-10-17',
-                'Statement': [
-                    {
-                        'Action': 'sts:AssumeRole',
-                        'Effect': 'Allow',
-                        'Principal': {
-                            'Service': 'sagemaker.amazonaws.com'
-                        }
-                    }
-                ],
-            }),
+            assume_role_policy=_assume_role_policy('sagemaker.amazonaws.com'),
 
-            inline_policies=pulumi.Output.from_input(args.model_data_bucket).apply(lambda bucket: [
+            inline_policies=[
                 iam.RoleInlinePolicyArgs(
                     name=f'{name}-policy',
-                    policy=json.dumps({
-                        'Version': '2012-10-17',
-                        'Statement': [
-                            {
-                                'Action': [
-                                    's3:GetObject',
-                                    's3:PutObject',
-                                    's3:DeleteObject',
-                                    's3:ListBucket'
-                                ],
-                                'Effect': 'Allow',
-                                'Resource': [
-                                    f'arn:aws:s3:::{bucket}',
-                                    f'arn:aws:s3:::{bucket}/*',
-                                ]
-                            },
-                            {
-                                'Action': [
-                                    'logs:CreateLogGroup',
-                                    'logs:CreateLogStream',
-                                    'logs:DescribeLogStreams',
-                                    'logs:GetLogEvents',
-                                    'logs:PutLogEvents'
-                                ],
-                                'Effect': 'Allow',
-                                'Resource': f'arn:aws:logs:{region}:{account_id}:log-group:/aws/sagemaker/*'
-                            },
-                            {
-                                'Action': [
-                                    'sagemaker:CreateTrainingJob',
-                                    'sagemaker:DescribeTrainingJob',
-                                ],
-                                'Effect': 'Allow',
-                                'Resource': f'arn:aws:sagemaker:{region}:{account_id}:*'
-                            },
-                            {
-                                'Action': [
-                                    'kms:Encrypt',
-                                    'kms:Decrypt',
-                                    'kms:ReEncrypt*',
-                                    'kms:GenerateDataKey*',
-                                    'kms:DescribeKey'
-                                ],
-                                'Effect': 'Allow',
-                                'Resource': f'arn:aws:kms:{region}:{account_id}:*'
-                            },
-                        ]
-                    }))
-            ]),
+                    policy=pulumi.Output.all(args.model_data_bucket, region, account_id).apply(
+                        lambda values: _training_role_policy(*values))
+                )
+            ],
 
             opts=pulumi.ResourceOptions(parent=self)
         )
@@ -286,41 +852,91 @@ class SagemakerPredictorLambda(pulumi.ComponentResource):
                                 kms_key=kms_key)
         else:
             self.endpoint_name = None
+            self.model_name = None
             self.lambda_function_name = None
+            self.lambda_alias_arn = None
+            self.predictor_url = None
             return
 
     def _continue_init(self,
                        name: str,
                        args: SagemakerPredictorLambdaArgs,
                        model_data_key: pulumi.Input[str],
-                       kms_key: kms.Key,
+                       kms_key: Optional[kms.Key],
                        role: iam.Role,
                        lambda_role: iam.Role) -> None:
 
-        model = sagemaker.Model(
-            f'{name}-model',
-            execution_role_arn=role.arn,
-            primary_container=sagemaker.ModelPrimaryContainerArgs(
-                image=args.model_image,
-                model_data_url=pulumi.Output.from_input(args.model_data_bucket).apply(
-                    lambda b: pulumi.Output.from_input(model_data_key).apply(
-                        lambda k: f's3://{b}/{k}'))
-            ),
-            opts=pulumi.ResourceOptions(parent=self)
-        )
+        model = self._model(f'{name}-model', args, role, model_data_key)
+        variants = args.variants or [{'name': 'AllTraffic'}]
+
+        production_variants = [
+            sagemaker.EndpointConfigurationProductionVariantArgs(
+                **self._variant_settings(name, args, role, variant, model))
+            for variant in variants
+        ]
+
+        shadow_production_variants = None
+
+        if args.shadow_variant is not None:
+            shadow_production_variants = [
+                sagemaker.EndpointConfigurationShadowProductionVariantArgs(
+                    **self._variant_settings(name, args, role, args.shadow_variant, model))
+            ]
+
+        async_prefix = f'async/{name}/'
+        async_inference_config = None
+
+        if args.async_inference:
+            notification_config = None
+            client_config = None
+
+            if args.async_success_topic_arn is not None or args.async_error_topic_arn is not None:
+                notification_config = sagemaker.EndpointConfigurationAsyncInferenceConfigOutputConfigNotificationConfigArgs(
+                    success_topic=args.async_success_topic_arn,
+                    error_topic=args.async_error_topic_arn,
+                )
+
+            if args.async_max_concurrent_invocations_per_instance is not None:
+                client_config = sagemaker.EndpointConfigurationAsyncInferenceConfigClientConfigArgs(
+                    max_concurrent_invocations_per_instance=args.async_max_concurrent_invocations_per_instance,
+                )
+
+            async_inference_config = sagemaker.EndpointConfigurationAsyncInferenceConfigArgs(
+                output_config=sagemaker.EndpointConfigurationAsyncInferenceConfigOutputConfigArgs(
+                    s3_output_path=pulumi.Output.concat('s3://', args.model_data_bucket, '/', async_prefix, 'output'),
+                    s3_failure_path=pulumi.Output.concat('s3://', args.model_data_bucket, '/', async_prefix, 'failure'),
+                    notification_config=notification_config,
+                ),
+                client_config=client_config,
+            )
+
+            self._allow_async_notifications(name, args, role)
+
+        data_capture_config = None
+
+        if args.data_capture_percentage is not None:
+            data_capture_config = sagemaker.EndpointConfigurationDataCaptureConfigArgs(
+                enable_capture=True,
+                initial_sampling_percentage=args.data_capture_percentage,
+                destination_s3_uri=pulumi.Output.concat('s3://', args.model_data_bucket, f'/capture/{name}'),
+                kms_key_id=kms_key.arn if kms_key is not None else None,
+                capture_options=[
+                    sagemaker.EndpointConfigurationDataCaptureConfigCaptureOptionArgs(capture_mode='Input'),
+                    sagemaker.EndpointConfigurationDataCaptureConfigCaptureOptionArgs(capture_mode='Output'),
+                ],
+                capture_content_type_header=sagemaker.EndpointConfigurationDataCaptureConfigCaptureContentTypeHeaderArgs(
+                    csv_content_types=['text/csv'],
+                    json_content_types=['text/json', 'application/json'],
+                ),
+            )
 
         endpoint_config = sagemaker.EndpointConfiguration(
             f'{name}-endpoint-config',
-            production_variants=[
-                sagemaker.EndpointConfigurationProductionVariantArgs(
-                    variant_name='AllTraffic',
-                    model_name=model.name,
-                    initial_instance_count=args.initial_instance_count,
-                    initial_variant_weight=1,
-                    instance_type=args.instance_type,
-                ),
-            ],
-            kms_key_arn=kms_key.arn,
+            production_variants=production_variants,
+            shadow_production_variants=shadow_production_variants,
+            kms_key_arn=kms_key.arn if kms_key is not None else None,
+            async_inference_config=async_inference_config,
+            data_capture_config=data_capture_config,
             opts=pulumi.ResourceOptions(parent=self)
         )
 
@@ -330,48 +946,120 @@ class SagemakerPredictorLambda(pulumi.ComponentResource):
             opts=pulumi.ResourceOptions(parent=self)
         )
 
+        if args.max_instance_count is not None:
+            for variant in variants:
+                self._scale_endpoint(name, args, endpoint, variant['name'])
+
+        invoke_statements = pulumi.Output.all(endpoint.arn, args.model_data_bucket).apply(
+            lambda values: _invoke_statements(values[0], values[1], async_prefix if args.async_inference else None))
+
         policy = aws.iam.Policy(
             f'{name}-invoke-policy',
-            policy=endpoint.arn.apply(lambda sagemaker_endpoint_arn: json.dumps({
+            policy=invoke_statements.apply(lambda statements: json.dumps({
                 'Version': '2012-10-17',
-                'Statement': [
-                    {
-                        'Action': [
-                            'sagemaker:InvokeEndpoint'
-                        ],
-                        'Effect': 'Allow',
-                        'Resource': sagemaker_endpoint_arn
-                }
-                ],
+                'Statement': statements,
             })),
             opts=pulumi.ResourceOptions(parent=self)
         )
 
-        schema_object_path = f'schema/{name}.json'
-        schema_object = s3.BucketObject(
-            schema_object_path,
-            source=pulumi.StringAsset(json.dumps({
-                'columns': args.column_names
-            })),
-            key=schema_object_path,
-            bucket=args.model_data_bucket,
-            opts=pulumi.ResourceOptions(parent=self)
-        )
+        handler_asset = pulumi.FileAsset(pathlib.Path(__file__).absolute().parent.joinpath('./handler.py'))
+        code: pulumi.Input[pulumi.Archive] = pulumi.AssetArchive({
+            'handler.py': handler_asset
+        })
+
+        variables: dict = {
+            'SAGEMAKER_ENDPOINT_NAME': endpoint.name
+        }
+
+        if args.async_inference:
+            variables['ASYNC_INFERENCE'] = 'true'
+            variables['ASYNC_BUCKET'] = args.model_data_bucket
+            variables['ASYNC_PREFIX'] = async_prefix
+
+        if args.multi_model:
+            variables['MULTI_MODEL'] = 'true'
+            variables['MODEL_SCHEMA_BUCKET'] = args.model_data_bucket
+            variables['MODEL_SCHEMA_PREFIX'] = pulumi.Output.from_input(model_data_key).apply(_model_prefix)
+
+        schema_json = pulumi.Output.from_input(args.column_names).apply(
+            lambda columns: json.dumps({'columns': columns}))
+
+        if args.schema_source == 'archive':
+            code = schema_json.apply(lambda text: pulumi.AssetArchive({
+                'handler.py': handler_asset,
+                'schema.json': pulumi.StringAsset(text)
+            }))
+            variables['SCHEMA_FILE'] = 'schema.json'
+        elif args.schema_source == 'environment':
+            variables['SCHEMA_JSON'] = schema_json
+        else:
+            schema_object_path = f'schema/{name}.json'
+            schema_object = s3.BucketObject(
+                schema_object_path,
+                source=pulumi.StringAsset(json.dumps({
+                    'columns': args.column_names
+                })),
+                key=schema_object_path,
+                bucket=args.model_data_bucket,
+                opts=pulumi.ResourceOptions(parent=self)
+            )
+            variables['SCHEMA_BUCKET'] = args.model_data_bucket
+            variables['SCHEMA_KEY'] = schema_object.key
+
+        handler_settings = {
+            'SAGEMAKER_MAX_POOL_CONNECTIONS': args.client_max_pool_connections,
+            'SAGEMAKER_CONNECT_TIMEOUT': args.client_connect_timeout,
+            'SAGEMAKER_READ_TIMEOUT': args.client_read_timeout,
+            'SAGEMAKER_RETRY_MODE': args.client_retry_mode,
+            'SAGEMAKER_MAX_ATTEMPTS': args.client_max_attempts,
+            'SAGEMAKER_TCP_KEEPALIVE': args.client_tcp_keepalive,
+            'SAGEMAKER_ACCEPT': args.client_accept,
+            'BATCH_MAX_ROWS': args.batch_max_rows,
+            'BATCH_MAX_BYTES': args.batch_max_bytes,
+            'BATCH_CONCURRENCY': args.batch_concurrency,
+            'PREDICTION_CACHE_SIZE': args.prediction_cache_size,
+            'PREDICTION_CACHE_TTL': args.prediction_cache_ttl,
+            'PREDICTION_CACHE_BACKEND': args.prediction_cache_backend,
+            'PREDICTION_CACHE_URL': args.prediction_cache_url,
+        }
+
+        for variable, value in handler_settings.items():
+            if value is not None:
+                variables[variable] = pulumi.Output.from_input(value).apply(_env_value)
+
+        vpc_config = None
+
+        if args.lambda_subnet_ids is not None:
+            vpc_config = lambda_.FunctionVpcConfigArgs(
+                subnet_ids=args.lambda_subnet_ids,
+                security_group_ids=args.lambda_security_group_ids or [],
+            )
+
+            iam.RolePolicyAttachment(
+                f'{name}-lambda-vpc-policy-attachment',
+                role=lambda_role.name,
+                policy_arn='arn:aws:iam::aws:policy/service-role/AWSLambdaVPCAccessExecutionRole',
+                opts=pulumi.ResourceOptions(parent=self)
+            )
+
+        architectures = None
+
+        if args.lambda_architecture is not None:
+            architectures = pulumi.Output.from_input(args.lambda_architecture).apply(lambda a: [a])
 
         lambda_function = lambda_.Function(
             f'{name}-lambda',
-            timeout=30,
+            timeout=args.lambda_timeout,
+            memory_size=args.lambda_memory_size,
+            architectures=architectures,
+            reserved_concurrent_executions=args.reserved_concurrency,
+            publish=args.provisioned_concurrency is not None,
             role=lambda_role.arn,
-            runtime='python3.8',
+            runtime=args.lambda_runtime,
             handler='handler.lambda_handler',
-            code=pulumi.AssetArchive({
-                'handler.py': pulumi.FileAsset(pathlib.Path(__file__).absolute().parent.joinpath('./handler.py'))
-            }),
-            environment=lambda_.FunctionEnvironmentArgs(variables={
-                'SAGEMAKER_ENDPOINT_NAME': endpoint.name,
-                'SCHEMA_BUCKET': args.model_data_bucket,
-                'SCHEMA_KEY': schema_object.key
-            }),
+            code=code,
+            environment=lambda_.FunctionEnvironmentArgs(variables=variables),
+            vpc_config=vpc_config,
             opts=pulumi.ResourceOptions(parent=self)
         )
 
@@ -384,3 +1072,277 @@ class SagemakerPredictorLambda(pulumi.ComponentResource):
 
         self.lambda_function_name = lambda_function.name
         self.endpoint_name = endpoint.name
+        self.model_name = model.name
+        self.lambda_alias_arn = None
+        self.predictor_url = None
+
+        alias = None
+
+        if args.provisioned_concurrency is not None:
+            alias = self._provision_concurrency(name, args, lambda_function)
+
+        if args.http_endpoint is not None:
+            self._expose_http(name, args, lambda_function, alias)
+
+    def _provision_concurrency(self,
+                               name: str,
+                               args: SagemakerPredictorLambdaArgs,
+                               lambda_function: lambda_.Function) -> lambda_.Alias:
+
+        alias = lambda_.Alias(
+            f'{name}-lambda-alias',
+            name='live',
+            function_name=lambda_function.name,
+            function_version=lambda_function.version,
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        concurrency_config = lambda_.ProvisionedConcurrencyConfig(
+            f'{name}-lambda-provisioned-concurrency',
+            function_name=lambda_function.name,
+            qualifier=alias.name,
+            provisioned_concurrent_executions=args.provisioned_concurrency,
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        self.lambda_alias_arn = alias.arn
+
+        if args.provisioned_concurrency_max is None:
+            return alias
+
+        # The scalable target takes over the provisioned count from here,
+        # so it must be registered after the initial config exists.
+        target = aws.appautoscaling.Target(
+            f'{name}-lambda-scaling-target',
+            service_namespace='lambda',
+            scalable_dimension='lambda:function:ProvisionedConcurrency',
+            resource_id=pulumi.Output.concat('function:', lambda_function.name, ':', alias.name),
+            min_capacity=args.provisioned_concurrency,
+            max_capacity=args.provisioned_concurrency_max,
+            opts=pulumi.ResourceOptions(parent=self, depends_on=[concurrency_config])
+        )
+
+        aws.appautoscaling.Policy(
+            f'{name}-lambda-scaling-policy',
+            policy_type='TargetTrackingScaling',
+            service_namespace=target.service_namespace,
+            scalable_dimension=target.scalable_dimension,
+            resource_id=target.resource_id,
+            target_tracking_scaling_policy_configuration=aws.appautoscaling.PolicyTargetTrackingScalingPolicyConfigurationArgs(
+                target_value=args.provisioned_concurrency_target_utilization,
+                predefined_metric_specification=aws.appautoscaling.PolicyTargetTrackingScalingPolicyConfigurationPredefinedMetricSpecificationArgs(
+                    predefined_metric_type='LambdaProvisionedConcurrencyUtilization'
+                )
+            ),
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        return alias
+
+    def _expose_http(self,
+                     name: str,
+                     args: SagemakerPredictorLambdaArgs,
+                     lambda_function: lambda_.Function,
+                     alias: Optional[lambda_.Alias]) -> None:
+        """Puts an HTTP endpoint in front of the function, or of its
+        provisioned concurrency alias when there is one."""
+
+        qualifier = alias.name if alias is not None else None
+
+        if args.http_endpoint == 'function_url':
+            # Python runtimes cannot stream responses, so the URL buffers.
+            function_url = lambda_.FunctionUrl(
+                f'{name}-lambda-url',
+                function_name=lambda_function.name,
+                qualifier=qualifier,
+                authorization_type=args.http_auth_type,
+                invoke_mode='BUFFERED',
+                opts=pulumi.ResourceOptions(parent=self)
+            )
+
+            if args.http_auth_type == 'NONE':
+                lambda_.Permission(
+                    f'{name}-lambda-url-permission',
+                    action='lambda:InvokeFunctionUrl',
+                    function=lambda_function.name,
+                    qualifier=qualifier,
+                    principal='*',
+                    function_url_auth_type='NONE',
+                    opts=pulumi.ResourceOptions(parent=self)
+                )
+
+            self.predictor_url = function_url.function_url
+            return
+
+        api = aws.apigatewayv2.Api(
+            f'{name}-http-api',
+            protocol_type='HTTP',
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        integration = aws.apigatewayv2.Integration(
+            f'{name}-http-integration',
+            api_id=api.id,
+            integration_type='AWS_PROXY',
+            integration_method='POST',
+            integration_uri=alias.invoke_arn if alias is not None else lambda_function.invoke_arn,
+            payload_format_version='2.0',
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        aws.apigatewayv2.Route(
+            f'{name}-http-route',
+            api_id=api.id,
+            route_key='POST /',
+            target=integration.id.apply(lambda integration_id: f'integrations/{integration_id}'),
+            authorization_type=args.http_auth_type,
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        aws.apigatewayv2.Stage(
+            f'{name}-http-stage',
+            api_id=api.id,
+            name='$default',
+            auto_deploy=True,
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        lambda_.Permission(
+            f'{name}-http-api-permission',
+            action='lambda:InvokeFunction',
+            function=lambda_function.name,
+            qualifier=qualifier,
+            principal='apigateway.amazonaws.com',
+            source_arn=api.execution_arn.apply(lambda arn: f'{arn}/*/*'),
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        self.predictor_url = api.api_endpoint
+
+    def _model(self,
+               resource_name: str,
+               args: SagemakerPredictorLambdaArgs,
+               role: iam.Role,
+               model_data_key: pulumi.Input[str]) -> sagemaker.Model:
+
+        if args.multi_model:
+            model_data_key = pulumi.Output.from_input(model_data_key).apply(_model_prefix)
+
+        return sagemaker.Model(
+            resource_name,
+            execution_role_arn=role.arn,
+            primary_container=sagemaker.ModelPrimaryContainerArgs(
+                image=args.model_image,
+                mode='MultiModel' if args.multi_model else None,
+                model_data_url=pulumi.Output.from_input(args.model_data_bucket).apply(
+                    lambda b: pulumi.Output.from_input(model_data_key).apply(
+                        lambda k: f's3://{b}/{k}'))
+            ),
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+    def _variant_settings(self,
+                          name: str,
+                          args: SagemakerPredictorLambdaArgs,
+                          role: iam.Role,
+                          variant: dict,
+                          default_model: sagemaker.Model) -> dict:
+        """Arguments shared by production and shadow variants. A variant
+        with its own `modelDataKey` gets its own model."""
+
+        model = default_model
+
+        if variant.get('modelDataKey') is not None:
+            model = self._model(f'{name}-model-{variant["name"]}', args, role, variant['modelDataKey'])
+
+        settings = {
+            'variant_name': variant['name'],
+            'model_name': model.name,
+            'initial_variant_weight': variant.get('weight', 1),
+        }
+
+        if args.serverless:
+            settings['serverless_config'] = sagemaker.EndpointConfigurationProductionVariantServerlessConfigArgs(
+                memory_size_in_mb=args.serverless_memory_size,
+                max_concurrency=args.serverless_max_concurrency,
+            )
+        else:
+            settings['initial_instance_count'] = variant.get('initialInstanceCount', args.initial_instance_count)
+            settings['instance_type'] = variant.get('instanceType', args.instance_type)
+
+        return settings
+
+    def _scale_endpoint(self,
+                        name: str,
+                        args: SagemakerPredictorLambdaArgs,
+                        endpoint: sagemaker.Endpoint,
+                        variant_name: str) -> None:
+
+        resource_prefix = f'{name}-endpoint' if variant_name == 'AllTraffic' else f'{name}-{variant_name}'
+
+        target = aws.appautoscaling.Target(
+            f'{resource_prefix}-scaling-target',
+            service_namespace='sagemaker',
+            scalable_dimension='sagemaker:variant:DesiredInstanceCount',
+            resource_id=pulumi.Output.concat('endpoint/', endpoint.name, '/variant/', variant_name),
+            min_capacity=args.min_instance_count,
+            max_capacity=args.max_instance_count,
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+        predefined_metric = None
+        customized_metric = None
+        target_value: pulumi.Input[float] = args.target_invocations_per_instance
+
+        if args.scaling_custom_metric is None:
+            predefined_metric = aws.appautoscaling.PolicyTargetTrackingScalingPolicyConfigurationPredefinedMetricSpecificationArgs(
+                predefined_metric_type='SageMakerVariantInvocationsPerInstance'
+            )
+        else:
+            metric = pulumi.Output.from_input(args.scaling_custom_metric)
+            target_value = metric.apply(lambda m: m['targetValue'])
+            customized_metric = metric.apply(_customized_metric)
+
+        aws.appautoscaling.Policy(
+            f'{resource_prefix}-scaling-policy',
+            policy_type='TargetTrackingScaling',
+            service_namespace=target.service_namespace,
+            scalable_dimension=target.scalable_dimension,
+            resource_id=target.resource_id,
+            target_tracking_scaling_policy_configuration=aws.appautoscaling.PolicyTargetTrackingScalingPolicyConfigurationArgs(
+                target_value=target_value,
+                predefined_metric_specification=predefined_metric,
+                customized_metric_specification=customized_metric,
+                scale_in_cooldown=args.scale_in_cooldown,
+                scale_out_cooldown=args.scale_out_cooldown
+            ),
+            opts=pulumi.ResourceOptions(parent=self)
+        )
+
+    def _allow_async_notifications(self,
+                                   name: str,
+                                   args: SagemakerPredictorLambdaArgs,
+                                   role: iam.Role) -> None:
+
+        topics = [t for t in [args.async_success_topic_arn, args.async_error_topic_arn] if t is not None]
+
+        if not topics:
+            return
+
+        iam.RolePolicy(
+            f'{name}-async-notification-policy',
+            role=role.id,
+            policy=pulumi.Output.all(*topics).apply(lambda arns: json.dumps({
+                'Version': '2012-10-17',
+                'Statement': [
+                    {
+                        'Action': [
+                            'sns:Publish'
+                        ],
+                        'Effect': 'Allow',
+                        'Resource': arns
+                    }
+                ],
+            })),
+            opts=pulumi.ResourceOptions(parent=self)
+        )
@@ -0,0 +1,604 @@
+#  Copyright 2016-2021, Pulumi Corporation.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""A local stand-in for the SageMaker runtime and S3, so that the Lambda
+function in `handler.py` can be exercised and measured without AWS.
+
+The server answers the two calls the function makes on its hot path:
+
+- `InvokeEndpoint` at `/endpoints/<name>/invocations` scores a CSV
+  payload with a linear model, `bias + sum(weight * feature)`, and
+  answers like `linear-learner`, `{"predictions": [{"score": ...}]}`,
+  or with one score per line when `text/csv` is accepted. Each call's
+  endpoint, target variant and target model are recorded in
+  `invocations`.
+
+- `GetObject` at `/<bucket>/<key>` serves objects put into the server,
+  such as schema objects, with ETags and `If-None-Match` revalidation.
+
+It also takes the `PutObject` and `InvokeEndpointAsync` calls of
+asynchronous inference. Submitted jobs stay pending until
+`complete_jobs` writes their output, or their failure, next to the
+staged input.
+
+Endpoint calls can be slowed down by a fixed `latency` plus a
+`row_latency` per scored row, and a share `error_rate` of them can be
+failed with a SageMaker error such as `ModelError` or the retried
+`ThrottlingException`.
+
+`RedisStandIn` speaks enough of the Redis protocol for the handler's
+shared prediction cache: `AUTH`, `SELECT`, `MGET`, `SET` with `PX`
+expiry and `PING`, recording every command it is sent.
+
+`load_handler` imports a fresh copy of `handler.py` configured by a
+dict of environment variables, with its boto3 clients pointed at a
+running stand-in:
+
+    with StandIn(latency=0.005) as standin:
+        standin.put_schema('bucket', 'schema/predictor.json', columns)
+        handler = load_handler(standin, {'SCHEMA_BUCKET': 'bucket',
+                                         'SCHEMA_KEY': 'schema/predictor.json'})
+        handler.lambda_handler({'fixed acidity': 7.8, ...}, None)
+
+The server can also run on its own, for a handler in another process
+whose boto3 honors `AWS_ENDPOINT_URL`:
+
+    python -m sagemakerlambda_provider.standin --port 8080 \\
+        --object s3://bucket/schema/predictor.json=schema.json \\
+        --latency 0.005 --error-rate 0.01
+
+"""
+
+import argparse
+import hashlib
+import http.server
+import importlib.util
+import json
+import os
+import pathlib
+import random
+import socketserver
+import socket
+import threading
+import time
+import urllib.parse
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import boto3
+import botocore.config
+
+
+# HTTP status of the SageMaker runtime errors that can be injected.
+ERRORS = {
+    'ModelError': 424,
+    'ThrottlingException': 400,
+    'ServiceUnavailable': 503,
+    'InternalFailure': 500,
+}
+
+# Seconds a stopping server may take to notice; kept short for tests.
+_POLL_INTERVAL = 0.05
+
+HANDLER_PATH = pathlib.Path(__file__).absolute().parent.joinpath('handler.py')
+
+_handler_copies = 0
+
+
+class StandIn:
+    """A stand-in SageMaker runtime and S3 server on a local port,
+    serving from a background thread between `start` and `stop`."""
+
+    def __init__(self,
+                 host: str = '127.0.0.1',
+                 port: int = 0,
+                 latency: float = 0.0,
+                 row_latency: float = 0.0,
+                 error_rate: float = 0.0,
+                 error: str = 'ModelError',
+                 weights: Optional[List[float]] = None,
+                 bias: float = 0.0,
+                 endpoints: Optional[Iterable[str]] = None,
+                 seed: Optional[int] = None) -> None:
+
+        if error not in ERRORS:
+            raise Exception(f'Unknown error {error!r}, expected one of ' + ', '.join(ERRORS))
+
+        self.latency = latency
+        self.row_latency = row_latency
+        self.error_rate = error_rate
+        self.error = error
+        self.weights = weights
+        self.bias = bias
+        self.endpoints = None if endpoints is None else frozenset(endpoints)
+        self.objects: Dict[Tuple[str, str], Tuple[bytes, str, str]] = {}
+        self.jobs: List[Tuple[str, str, str, str]] = []
+        self.invocations: List[Tuple[str, Optional[str], Optional[str]]] = []
+        self.stats = {'calls': 0, 'rows': 0, 'errors': 0, 'gets': 0, 'puts': 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = _HTTPServer((host, port), _handler_class(self))
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.socket.getsockname()[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'StandIn':
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, args=(_POLL_INTERVAL,), daemon=True)
+            self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+
+        self._server.server_close()
+
+    def __enter__(self) -> 'StandIn':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def put_object(self, bucket: str, key: str, body: bytes, content_type: str = 'application/octet-stream') -> None:
+        """Stores an object, replacing its ETag so that revalidating
+        readers see the change."""
+
+        self.objects[(bucket, key)] = (body, '"' + hashlib.md5(body).hexdigest() + '"', content_type)
+
+    def put_schema(self, bucket: str, key: str, columns: List[str]) -> None:
+        self.put_object(bucket, key, json.dumps({'columns': columns}).encode())
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for name in self.stats:
+                self.stats[name] = 0
+
+    def complete_jobs(self, fail: bool = False) -> int:
+        """Answers the pending asynchronous jobs, writing each output, or
+        with `fail` a failure message, to the location given when it was
+        submitted. Returns the number of jobs answered."""
+
+        with self._lock:
+            jobs, self.jobs = self.jobs, []
+
+        for input_location, output_location, failure_location, accept in jobs:
+            if fail:
+                self.put_object(*_s3_location(failure_location), b'Injected by the stand-in', 'text/plain')
+                continue
+
+            body = self.objects[_s3_location(input_location)][0]
+            rows = [row for row in body.decode().split('\n') if row]
+            self.put_object(*_s3_location(output_location), *self.respond(rows, accept))
+
+        return len(jobs)
+
+    def respond(self, rows: List[str], accept: str) -> Tuple[bytes, str]:
+        """The body and content type of the endpoint's answer for `rows`."""
+
+        scores = [self.score(row) for row in rows]
+
+        if accept.startswith('text/csv'):
+            return ''.join(f'{score}\n' for score in scores).encode(), 'text/csv'
+
+        return json.dumps({'predictions': [{'score': score} for score in scores]}).encode(), 'application/json'
+
+    def score(self, row: str) -> float:
+        values = [float(value) for value in row.split(',')]
+        weights = self.weights or [1.0] * len(values)
+
+        if len(weights) != len(values):
+            raise ValueError(f'expected {len(weights)} features, got {len(values)}')
+
+        return self.bias + sum(weight * value for weight, value in zip(weights, values))
+
+    def _inject_error(self) -> bool:
+        with self._lock:
+            return self.error_rate > 0 and self._random.random() < self.error_rate
+
+    def _count(self, **counts: int) -> None:
+        with self._lock:
+            for name, count in counts.items():
+                self.stats[name] += count
+
+
+def _s3_location(uri: str) -> Tuple[str, str]:
+    bucket, _, key = uri[len('s3://'):].partition('/')
+    return bucket, key
+
+
+class _HTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    # http.server.ThreadingHTTPServer, which only exists from Python 3.7.
+    daemon_threads = True
+
+
+def _handler_class(standin: StandIn) -> type:
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def setup(self) -> None:
+            super().setup()
+            # Headers and body are written separately; without this the
+            # client's delayed ACKs add tens of milliseconds per call.
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            bucket, _, key = urllib.parse.unquote(self.path.split('?')[0]).lstrip('/').partition('/')
+            standin._count(gets=1)
+            found = standin.objects.get((bucket, key))
+
+            if found is None:
+                self._s3_error(404, 'NoSuchKey', 'The specified key does not exist.')
+                return
+
+            body, etag, content_type = found
+
+            if self.headers.get('If-None-Match') == etag:
+                self._send(304, b'', content_type, {'ETag': etag})
+                return
+
+            self._send(200, body, content_type, {'ETag': etag})
+
+        def do_PUT(self) -> None:
+            body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            bucket, _, key = urllib.parse.unquote(self.path.split('?')[0]).lstrip('/').partition('/')
+            standin._count(puts=1)
+            standin.put_object(bucket, key, body, self.headers.get('Content-Type') or 'application/octet-stream')
+            self._send(200, b'', 'application/xml', {'ETag': standin.objects[(bucket, key)][1]})
+
+        def do_POST(self) -> None:
+            payload = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            parts = urllib.parse.unquote(self.path.split('?')[0]).strip('/').split('/')
+
+            if len(parts) != 3 or parts[0] != 'endpoints' or parts[2] not in ('invocations', 'async-invocations'):
+                self._runtime_error(404, 'UnknownOperationException', f'Unknown operation {self.path}')
+                return
+
+            if standin.endpoints is not None and parts[1] not in standin.endpoints:
+                self._runtime_error(400, 'ValidationError', f'Endpoint {parts[1]} not found.')
+                return
+
+            if parts[2] == 'async-invocations':
+                self._submit_job()
+                return
+
+            with standin._lock:
+                standin.invocations.append((parts[1],
+                                            self.headers.get('X-Amzn-SageMaker-Target-Variant'),
+                                            self.headers.get('X-Amzn-SageMaker-Target-Model')))
+
+            rows = [row for row in payload.decode().split('\n') if row]
+            time.sleep(standin.latency + standin.row_latency * len(rows))
+
+            if standin._inject_error():
+                standin._count(calls=1, errors=1)
+                self._runtime_error(ERRORS[standin.error], standin.error, 'Injected by the stand-in')
+                return
+
+            try:
+                body, content_type = standin.respond(rows, self.headers.get('Accept', ''))
+            except ValueError as ex:
+                standin._count(calls=1, errors=1)
+                self._runtime_error(424, 'ModelError', f'Unable to evaluate payload: {ex}')
+                return
+
+            standin._count(calls=1, rows=len(rows))
+            self._send(200, body, content_type)
+
+        def _submit_job(self) -> None:
+            input_location = self.headers['X-Amzn-SageMaker-InputLocation']
+            job_id = self.headers.get('X-Amzn-SageMaker-Inference-Id') or os.urandom(16).hex()
+            bucket = _s3_location(input_location)[0]
+            output_location = f's3://{bucket}/async-output/{job_id}.out'
+            failure_location = f's3://{bucket}/async-failure/{job_id}.out'
+
+            with standin._lock:
+                standin.jobs.append((input_location, output_location, failure_location,
+                                     self.headers.get('X-Amzn-SageMaker-Accept', '')))
+
+            body = json.dumps({'InferenceId': job_id}).encode()
+            self._send(202, body, 'application/json', {
+                'X-Amzn-SageMaker-OutputLocation': output_location,
+                'X-Amzn-SageMaker-FailureLocation': failure_location,
+            })
+
+        def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None) -> None:
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _s3_error(self, status: int, code: str, message: str) -> None:
+            body = f'<Error><Code>{code}</Code><Message>{message}</Message></Error>'.encode()
+            self._send(status, body, 'application/xml')
+
+        def _runtime_error(self, status: int, code: str, message: str) -> None:
+            body = json.dumps({'ErrorCode': code, 'Message': message}).encode()
+            self._send(status, body, 'application/json', {'x-amzn-ErrorType': code})
+
+    return Handler
+
+
+class RedisStandIn:
+    """A stand-in Redis server on a local port, serving from a background
+    thread between `start` and `stop`. With `password` set, clients must
+    `AUTH` first, as `username` when that is set too."""
+
+    def __init__(self,
+                 host: str = '127.0.0.1',
+                 port: int = 0,
+                 password: Optional[str] = None,
+                 username: Optional[str] = None) -> None:
+
+        self.password = password
+        self.username = username
+        self.databases: Dict[int, Dict[bytes, Tuple[bytes, Optional[float]]]] = {}
+        self.commands: List[List[bytes]] = []
+        self.connections: List[socket.socket] = []
+        self._lock = threading.Lock()
+        self._server = _RedisServer((host, port), _redis_handler_class(self))
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.socket.getsockname()[:2]
+        return f'redis://{host}:{port}'
+
+    def start(self) -> 'RedisStandIn':
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, args=(_POLL_INTERVAL,), daemon=True)
+            self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        """Stops serving and drops every open connection, as a server
+        going away would."""
+
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+
+        self._server.server_close()
+
+        with self._lock:
+            for connection in self.connections:
+                try:
+                    connection.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+            self.connections.clear()
+
+    def __enter__(self) -> 'RedisStandIn':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def keys(self, db: int = 0) -> List[str]:
+        with self._lock:
+            return sorted(key.decode() for key in self.databases.get(db, {}))
+
+    def execute(self, session: dict, args: List[bytes]) -> bytes:
+        """Runs one command for a connection, returning the encoded reply."""
+
+        name = args[0].upper().decode()
+
+        with self._lock:
+            self.commands.append(args)
+
+            if name == 'AUTH':
+                username = args[1].decode() if len(args) == 3 else None
+                password = args[-1].decode()
+
+                if self.password is None:
+                    return b'-ERR AUTH called without any password configured\r\n'
+
+                if password != self.password or username != self.username:
+                    return b'-WRONGPASS invalid username-password pair\r\n'
+
+                session['authenticated'] = True
+                return b'+OK\r\n'
+
+            if self.password is not None and not session.get('authenticated'):
+                return b'-NOAUTH Authentication required.\r\n'
+
+            if name == 'PING':
+                return b'+PONG\r\n'
+
+            if name == 'SELECT':
+                session['db'] = int(args[1])
+                return b'+OK\r\n'
+
+            store = self.databases.setdefault(session.get('db', 0), {})
+
+            if name == 'MGET':
+                values = [self._get(store, key) for key in args[1:]]
+                return b'*%d\r\n' % len(values) + b''.join(
+                    b'$-1\r\n' if value is None else b'$%d\r\n%s\r\n' % (len(value), value) for value in values)
+
+            if name == 'SET':
+                expires = None
+
+                if len(args) == 5 and args[3].upper() == b'PX':
+                    expires = time.time() + int(args[4]) / 1000
+                elif len(args) != 3:
+                    return b'-ERR syntax error\r\n'
+
+                store[args[1]] = (args[2], expires)
+                return b'+OK\r\n'
+
+        return b"-ERR unknown command '%s'\r\n" % args[0]
+
+    def _get(self, store: Dict[bytes, Tuple[bytes, Optional[float]]], key: bytes) -> Optional[bytes]:
+        entry = store.get(key)
+
+        if entry is None or (entry[1] is not None and entry[1] <= time.time()):
+            store.pop(key, None)
+            return None
+
+        return entry[0]
+
+
+class _RedisServer(socketserver.ThreadingTCPServer):
+    # Restarted on the same port by tests of reconnection.
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+def _redis_handler_class(redis: RedisStandIn) -> type:
+
+    class Handler(socketserver.StreamRequestHandler):
+
+        def handle(self) -> None:
+            session: dict = {}
+
+            with redis._lock:
+                redis.connections.append(self.connection)
+
+            while True:
+                args = self._read_command()
+
+                if args is None:
+                    return
+
+                self.wfile.write(redis.execute(session, args))
+                self.wfile.flush()
+
+        def _read_command(self) -> Optional[List[bytes]]:
+            line = self.rfile.readline()
+
+            if not line.startswith(b'*'):
+                return None
+
+            args = []
+
+            for _ in range(int(line[1:])):
+                size = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(size + 2)[:-2])
+
+            return args
+
+    return Handler
+
+
+def load_handler(standin: StandIn, env: Optional[Dict[str, str]] = None, region: str = 'us-east-1') -> Any:
+    """Imports a fresh copy of `handler.py` with `env` as its environment
+    variables and its boto3 clients pointed at `standin`.
+
+    The endpoint name defaults to `standin` and the on-disk schema cache
+    is disabled, so that copies do not see each other's schemas. Each
+    call returns a separate module with its own caches."""
+
+    global _handler_copies
+
+    variables = {
+        'SAGEMAKER_ENDPOINT_NAME': 'standin',
+        'SCHEMA_CACHE_FILE': '',
+        'AWS_REGION': region,
+        'AWS_ACCESS_KEY_ID': 'standin',
+        'AWS_SECRET_ACCESS_KEY': 'standin',
+    }
+    variables.update(env or {})
+
+    saved = dict(os.environ)
+    _handler_copies += 1
+    spec: Any = importlib.util.spec_from_file_location(
+        f'sagemakerlambda_standin_handler_{_handler_copies}', HANDLER_PATH)
+    module: Any = importlib.util.module_from_spec(spec)
+
+    # The handler reads its settings, the client tuning included, from
+    # the environment, so the clients are replaced before it is restored.
+    try:
+        os.environ.pop('AWS_LAMBDA_INITIALIZATION_TYPE', None)
+        os.environ.update(variables)
+        spec.loader.exec_module(module)
+
+        if hasattr(module, 'sagemaker_client'):
+            options = {
+                'region_name': region,
+                'endpoint_url': standin.url,
+                'aws_access_key_id': 'standin',
+                'aws_secret_access_key': 'standin',
+            }
+            module.sagemaker_client = boto3.client(
+                'sagemaker-runtime', config=module.sagemaker_client_config(), **options)
+            module.s3_client = boto3.client(
+                's3', config=botocore.config.Config(s3={'addressing_style': 'path'}), **options)
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+    return module
+
+
+def _parse_object(spec: str) -> Tuple[str, str, str]:
+    uri, sep, path = spec.partition('=')
+
+    if not (sep and uri.startswith('s3://') and '/' in uri[5:]):
+        raise argparse.ArgumentTypeError(f'expected s3://bucket/key=file, got {spec!r}')
+
+    bucket, _, key = uri[5:].partition('/')
+    return bucket, key, path
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Serve a stand-in SageMaker runtime and S3 locally.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--object', action='append', type=_parse_object, default=[],
+                        help='s3://bucket/key=file to serve, may be repeated')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every endpoint call')
+    parser.add_argument('--row-latency', type=float, default=0.0, help='seconds added per scored row')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of endpoint calls to fail')
+    parser.add_argument('--error', choices=sorted(ERRORS), default='ModelError')
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args(argv)
+
+    standin = StandIn(host=args.host, port=args.port, latency=args.latency, row_latency=args.row_latency,
+                      error_rate=args.error_rate, error=args.error, seed=args.seed)
+
+    for bucket, key, path in args.object:
+        with open(path, 'rb') as fp:
+            standin.put_object(bucket, key, fp.read())
+
+    print(f'Serving on {standin.url}')
+
+    try:
+        standin._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        standin._server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,299 @@
+#  Copyright 2016-2021, Pulumi Corporation.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Offline bulk scoring with SageMaker Batch Transform, using the model
+and schema of a SagemakerPredictorLambda.
+
+JSON Lines records are converted to CSV by the same `ColumnEncoder` as
+the Lambda handler, so offline and online scores agree. The input object
+is streamed and at most one shard is held in memory at a time. Under the
+output prefix the run writes:
+
+    input/shard-00000.csv           CSV rows scored by the transform job
+    keys/shard-00000.jsonl          key of the record on each row
+    output/shard-00000.csv.out      scores written by the transform job
+    predictions/shard-00000.jsonl   `{"<key>": ..., "<target>": ...}` per record
+
+Records are keyed by `--key-field`, or by their position in the input.
+The model's execution role must be able to read and write the output
+prefix, which is simplest under the component's `model_data_bucket`:
+
+    python -m sagemakerlambda_provider.transform \\
+        --model-name $(pulumi stack output modelName) \\
+        --schema s3://my-bucket/schema/predictor.json \\
+        --input s3://my-bucket/data/wines.jsonl \\
+        --output s3://my-bucket/transform/2022-01-01
+
+"""
+
+import argparse
+import itertools
+import json
+import time
+
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+import boto3
+
+from sagemakerlambda_provider import handler
+
+
+SHARD_ROWS = 100000
+
+# Records are encoded in batches of this size, so that only the CSV text
+# of a shard is kept rather than its parsed records.
+ENCODE_BATCH_ROWS = 1000
+
+
+def parse_s3_uri(uri: str) -> Tuple[str, str]:
+    if not uri.startswith('s3://'):
+        raise Exception(f'Expected an s3:// URI, got {uri}')
+
+    bucket, _, key = uri[len('s3://'):].partition('/')
+    return bucket, key
+
+
+def load_schema(s3: Any, location: str) -> handler.Schema:
+    """Reads a schema object from an `s3://` URI or a local file."""
+
+    if location.startswith('s3://'):
+        bucket, key = parse_s3_uri(location)
+        text = s3.get_object(Bucket=bucket, Key=key)['Body'].read()
+    else:
+        with open(location) as fp:
+            text = fp.read()
+
+    return handler.Schema(json.loads(text)['columns'])
+
+
+def read_jsonl(s3: Any, bucket: str, key: str) -> Iterator[Any]:
+    """Streams the records of a JSON Lines object."""
+
+    for line in s3.get_object(Bucket=bucket, Key=key)['Body'].iter_lines():
+        if line.strip():
+            yield json.loads(line)
+
+
+def write_shards(s3: Any,
+                 schema: handler.Schema,
+                 records: Iterable[Any],
+                 bucket: str,
+                 prefix: str,
+                 key_field: Optional[str] = None,
+                 shard_rows: int = SHARD_ROWS) -> int:
+    """Encodes records to CSV shards of at most `shard_rows` rows, along
+    with the key of every row. Returns the number of shards."""
+
+    shards = 0
+    index = 0
+    rows: List[str] = []
+    keys: List[str] = []
+    batch: List[Any] = []
+
+    def encode_batch() -> None:
+        try:
+            rows.append(schema.encoder.encode_batch(batch))
+        except Exception as ex:
+            raise Exception(f'Records {index - len(batch)} to {index - 1}: {ex}')
+
+        batch.clear()
+
+    def put_shard() -> None:
+        name = f'shard-{shards:05d}'
+        s3.put_object(Bucket=bucket, Key=f'{prefix}/input/{name}.csv',
+                      Body=('\n'.join(rows) + '\n').encode(), ContentType='text/csv')
+        s3.put_object(Bucket=bucket, Key=f'{prefix}/keys/{name}.jsonl',
+                      Body=('\n'.join(keys) + '\n').encode())
+        rows.clear()
+        keys.clear()
+
+    for record in records:
+        if key_field is None:
+            keys.append(json.dumps(index))
+        elif isinstance(record, dict) and key_field in record:
+            keys.append(json.dumps(record[key_field]))
+        else:
+            raise Exception(f'Record {index}: missing key field {key_field}')
+
+        batch.append(record)
+        index += 1
+
+        if len(batch) == ENCODE_BATCH_ROWS:
+            encode_batch()
+
+        if len(keys) == shard_rows:
+            if batch:
+                encode_batch()
+            put_shard()
+            shards += 1
+
+    if batch:
+        encode_batch()
+
+    if keys:
+        put_shard()
+        shards += 1
+
+    return shards
+
+
+def start_transform_job(sagemaker: Any,
+                        job_name: str,
+                        model_name: str,
+                        bucket: str,
+                        prefix: str,
+                        instance_type: str,
+                        instance_count: int,
+                        max_payload_mb: int) -> None:
+    """Scores every shard line by line, writing one score per line."""
+
+    sagemaker.create_transform_job(
+        TransformJobName=job_name,
+        ModelName=model_name,
+        BatchStrategy='MultiRecord',
+        MaxPayloadInMB=max_payload_mb,
+        TransformInput={
+            'DataSource': {
+                'S3DataSource': {
+                    'S3DataType': 'S3Prefix',
+                    'S3Uri': f's3://{bucket}/{prefix}/input/',
+                }
+            },
+            'ContentType': 'text/csv',
+            'SplitType': 'Line',
+        },
+        TransformOutput={
+            'S3OutputPath': f's3://{bucket}/{prefix}/output/',
+            'Accept': 'text/csv',
+            'AssembleWith': 'Line',
+        },
+        TransformResources={
+            'InstanceType': instance_type,
+            'InstanceCount': instance_count,
+        })
+
+
+def wait_for_transform_job(sagemaker: Any, job_name: str, poll_seconds: float = 30) -> None:
+    while True:
+        job = sagemaker.describe_transform_job(TransformJobName=job_name)
+        status = job['TransformJobStatus']
+
+        if status == 'Completed':
+            return
+
+        if status in ('Failed', 'Stopped'):
+            raise Exception(f'Transform job {job_name} {status.lower()}: {job.get("FailureReason", "")}')
+
+        time.sleep(poll_seconds)
+
+
+def join_predictions(s3: Any,
+                     schema: handler.Schema,
+                     bucket: str,
+                     prefix: str,
+                     shards: int,
+                     key_field: Optional[str] = None) -> None:
+    """Pairs the scores of every shard with the keys of its records, in
+    row order, and writes them as JSON Lines."""
+
+    key_name = key_field or 'record'
+
+    for shard in range(shards):
+        name = f'shard-{shard:05d}'
+        keys = _lines(s3, bucket, f'{prefix}/keys/{name}.jsonl')
+        scores = _lines(s3, bucket, f'{prefix}/output/{name}.csv.out')
+        predictions = []
+
+        for key, score in itertools.zip_longest(keys, scores):
+            if key is None or score is None:
+                raise Exception(f'Transform output of {name} does not have one score per record')
+
+            predictions.append(json.dumps({
+                key_name: json.loads(key),
+                schema.target: handler.decode_scores(score, 'text/csv')[0],
+            }))
+
+        s3.put_object(Bucket=bucket, Key=f'{prefix}/predictions/{name}.jsonl',
+                      Body=('\n'.join(predictions) + '\n').encode())
+
+
+def _lines(s3: Any, bucket: str, key: str) -> Iterator[bytes]:
+    return (line for line in s3.get_object(Bucket=bucket, Key=key)['Body'].iter_lines() if line.strip())
+
+
+def run(model_name: str,
+        schema_location: str,
+        input_uri: str,
+        output_uri: str,
+        key_field: Optional[str] = None,
+        job_name: Optional[str] = None,
+        instance_type: str = 'ml.m5.large',
+        instance_count: int = 1,
+        shard_rows: int = SHARD_ROWS,
+        max_payload_mb: int = 6,
+        region: Optional[str] = None) -> str:
+    """Converts, scores and joins a JSON Lines object end to end.
+    Returns the prefix the predictions were written under."""
+
+    s3 = boto3.client('s3', region_name=region)
+    sagemaker = boto3.client('sagemaker', region_name=region)
+
+    schema = load_schema(s3, schema_location)
+    input_bucket, input_key = parse_s3_uri(input_uri)
+    bucket, prefix = parse_s3_uri(output_uri.rstrip('/'))
+
+    shards = write_shards(s3, schema, read_jsonl(s3, input_bucket, input_key),
+                          bucket, prefix, key_field, shard_rows)
+
+    if shards == 0:
+        raise Exception(f'No records in {input_uri}')
+
+    if job_name is None:
+        job_name = f'{model_name[:48]}-{time.strftime("%Y%m%d%H%M%S")}'
+
+    start_transform_job(sagemaker, job_name, model_name, bucket, prefix,
+                        instance_type, instance_count, max_payload_mb)
+    wait_for_transform_job(sagemaker, job_name)
+    join_predictions(s3, schema, bucket, prefix, shards, key_field)
+
+    return f's3://{bucket}/{prefix}/predictions/'
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Score JSON Lines records with SageMaker Batch Transform.')
+    parser.add_argument('--model-name', required=True, help='SageMaker model, the modelName output of the component')
+    parser.add_argument('--schema', required=True, help='schema object, as an s3:// URI or a local file')
+    parser.add_argument('--input', required=True, help='s3:// URI of the JSON Lines records')
+    parser.add_argument('--output', required=True, help='s3:// prefix to write shards and predictions under')
+    parser.add_argument('--key-field', help='record field identifying each prediction (default: record position)')
+    parser.add_argument('--job-name', help='name of the transform job (default: derived from the model name)')
+    parser.add_argument('--instance-type', default='ml.m5.large')
+    parser.add_argument('--instance-count', type=int, default=1)
+    parser.add_argument('--shard-rows', type=int, default=SHARD_ROWS)
+    parser.add_argument('--max-payload-mb', type=int, default=6)
+    parser.add_argument('--region')
+    args = parser.parse_args(argv)
+
+    print(run(args.model_name, args.schema, args.input, args.output,
+              key_field=args.key_field,
+              job_name=args.job_name,
+              instance_type=args.instance_type,
+              instance_count=args.instance_count,
+              shard_rows=args.shard_rows,
+              max_payload_mb=args.max_payload_mb,
+              region=args.region))
+
+
+if __name__ == '__main__':
+    main()
@@ -16,10 +16,10 @@ setup(
     version=read_version(),
     description='SageMaker Lambda Pulumi Provider',
     packages=[PKG],
-    package_data={PKG: ['py.typed', 'VERSION']},
+    package_data={PKG: ['py.typed', 'VERSION', 'image_uris.json']},
     zip_safe=False,
     install_requires=[
         'pulumi>=3.0.0',
-        'pulumi_aws>=4.0.0',
+        'pulumi_aws>=5.43.0',
     ],
 )
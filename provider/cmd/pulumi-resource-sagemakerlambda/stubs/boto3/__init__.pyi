@@ -1,5 +1,5 @@
-from typing import Any
+from typing import Any, Optional
 
 
-def client(service: str, region_name: str) -> Any:
+def client(service: str, region_name: Optional[str] = ..., config: Any = ...) -> Any:
     ...
@@ -0,0 +1,6 @@
+from typing import Any
+
+
+class Config:
+    def __init__(self, **kwargs: Any) -> None:
+        ...
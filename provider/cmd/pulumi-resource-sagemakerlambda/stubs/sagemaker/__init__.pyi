@@ -1,5 +1,3 @@
-class ImageURIs:
-    def retrieve(self, framework: str, region: str) -> str:
-        ...
+from . import image_uris as image_uris
 
-image_uris: ImageURIs
+__version__: str
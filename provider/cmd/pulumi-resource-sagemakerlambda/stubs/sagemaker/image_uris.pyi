@@ -0,0 +1,7 @@
+from typing import Any
+
+def retrieve(framework: str, region: str) -> str:
+    ...
+
+def config_for_framework(framework: str) -> Any:
+    ...
@@ -0,0 +1,5 @@
+from typing import Any, Union
+
+
+def loads(__obj: Union[str, bytes, bytearray]) -> Any:
+    ...
@@ -0,0 +1,40 @@
+#  Copyright 2016-2021, Pulumi Corporation.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from sagemakerlambda_provider.standin import StandIn, load_handler
+
+
+BUCKET = 'models'
+SCHEMA_KEY = 'schema/predictor.json'
+COLUMNS = ['quality', 'a', 'b']
+
+
+@pytest.fixture
+def standin():
+    with StandIn() as server:
+        server.put_schema(BUCKET, SCHEMA_KEY, COLUMNS)
+        yield server
+
+
+@pytest.fixture
+def make_handler(standin):
+    """Loads a handler against the stand-in, reading the default schema
+    unless `env` says otherwise."""
+
+    def make(**env):
+        return load_handler(standin, dict({'SCHEMA_BUCKET': BUCKET, 'SCHEMA_KEY': SCHEMA_KEY}, **env))
+
+    return make
@@ -0,0 +1,79 @@
+#  Copyright 2016-2021, Pulumi Corporation.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import io
+import json
+
+from sagemakerlambda_provider import capture, handler
+
+
+def _capture_line(rows, output, content_type='text/json', encoding='JSON'):
+    return json.dumps({'captureData': {
+        'endpointInput': {'observedContentType': 'text/csv', 'mode': 'INPUT', 'data': rows, 'encoding': 'CSV'},
+        'endpointOutput': {'observedContentType': content_type, 'mode': 'OUTPUT', 'data': output,
+                           'encoding': encoding},
+    }})
+
+
+class _Body:
+
+    def __init__(self, data):
+        self.data = data
+
+    def iter_lines(self):
+        return iter(self.data.split(b'\n'))
+
+
+class _S3:
+    """Serves one capture object in the shape boto3 returns it."""
+
+    def __init__(self, lines):
+        self.data = '\n'.join(lines).encode()
+
+    def get_paginator(self, operation):
+        return self
+
+    def paginate(self, Bucket, Prefix):
+        return [{'Contents': [{'Key': f'{Prefix}ep/AllTraffic/2026/10/18/00/capture.jsonl'}]}]
+
+    def get_object(self, Bucket, Key):
+        return {'Body': _Body(self.data)}
+
+
+def test_read_capture_decodes_json_and_base64_csv_responses():
+    s3 = _S3([
+        _capture_line('1,2\n3,4', json.dumps({'predictions': [{'score': 5.0}, {'score': 6.0}]})),
+        _capture_line('1,2', 'NS4w', 'text/csv', 'BASE64'),
+    ])
+
+    assert list(capture.read_capture(s3, 'models', 'capture/predictor/')) == \
+        [(['1,2', '3,4'], [5.0, 6.0]), (['1,2'], [5.0])]
+
+
+def test_write_rows_streams_each_call():
+    schema = handler.Schema(['quality', 'a', 'b'])
+    fp = io.StringIO()
+    written = []
+
+    def calls():
+        yield ['1,2', '3,4'], [5.0, 6.0]
+        written.append(fp.getvalue())
+        yield ['1,2'], [5.0]
+
+    summary = capture.summarize(capture.write_rows(schema, calls(), fp))
+
+    assert written == ['a,b,quality\r\n1,2,5.0\r\n3,4,6.0\r\n']
+    assert fp.getvalue().endswith('1,2,5.0\r\n')
+    assert summary == {'rows': 3, 'calls': 2, 'meanRowsPerCall': 1.5, 'medianRowsPerCall': 2,
+                       'maxRowsPerCall': 2, 'distinctRowShare': 2 / 3}
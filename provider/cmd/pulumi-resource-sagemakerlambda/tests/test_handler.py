@@ -0,0 +1,313 @@
+#  Copyright 2016-2021, Pulumi Corporation.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import base64
+import gzip
+import json
+
+import pytest
+
+from sagemakerlambda_provider.handler import ColumnEncoder
+
+
+def test_columns_encode_like_instances():
+    encoder = ColumnEncoder(['a', 'b', 'c'])
+    records = [{'a': 25, 'b': 2.5, 'c': 2 ** 70}, {'a': -1, 'b': 0.1, 'c': 1e300}]
+    columns = {name: [record[name] for record in records] for name in encoder.column_names}
+
+    assert encoder.encode_columns(columns) == encoder.encode_batch(records)
+    assert encoder.encode_columns(columns) == '\n'.join(map(encoder.encode, records))
+    assert encoder.encode_columns({'a': [25], 'b': [2.5], 'c': [3]}) == '25,2.5,3'
+
+
+def test_columns_reject_what_instances_reject():
+    encoder = ColumnEncoder(['a', 'b'])
+
+    with pytest.raises(Exception, match=r'non-numeric columns: a \(bool\)'):
+        encoder.encode_batch([{'a': True, 'b': 1}])
+
+    with pytest.raises(Exception, match=r'non-numeric columns: a \(bool\), b \(str\)'):
+        encoder.encode_columns({'a': [1, True], 'b': ['x', 2]})
+
+
+def test_csv_responses_are_decoded(make_handler, standin):
+    handler = make_handler(SAGEMAKER_ACCEPT='text/csv')
+
+    assert handler.lambda_handler({'a': 1, 'b': 2.5}, None) == {'prediction': {'quality': 3.5}}
+    assert handler.lambda_handler({'instances': [{'a': 1, 'b': 2}, {'a': -3, 'b': 0.25}]}, None) == \
+        {'predictions': [{'quality': 3.0}, {'quality': -2.75}]}
+    assert standin.respond(['1,2'], 'text/csv') == (b'3.0\n', 'text/csv')
+    assert handler.decode_scores(b'0,0.25\n1,0.75\n', 'text/csv; charset=utf-8') == [0.25, 0.75]
+
+
+def test_schema_is_fetched_once_per_ttl(make_handler, standin):
+    handler = make_handler()
+    handler.lambda_handler({'a': 1, 'b': 2}, None)
+    handler.lambda_handler({'a': 1, 'b': 2}, None)
+
+    assert standin.stats['gets'] == 1
+
+
+def test_schema_revalidates_by_etag(make_handler, standin):
+    handler = make_handler(SCHEMA_CACHE_TTL='0')
+    schema = handler.schema_cache.get()
+
+    assert handler.schema_cache.get() is schema
+
+    standin.put_schema('models', 'schema/predictor.json', ['price', 'a'])
+
+    assert handler.lambda_handler({'a': 1}, None) == {'prediction': {'price': 1.0}}
+
+
+def test_batches_fan_out_in_order(make_handler, standin):
+    handler = make_handler(BATCH_MAX_ROWS='2')
+    records = [{'a': i, 'b': 0.5} for i in range(5)]
+
+    assert handler.lambda_handler({'instances': records}, None) == \
+        {'predictions': [{'quality': i + 0.5} for i in range(5)]}
+    assert standin.stats['calls'] == 3
+    assert standin.stats['rows'] == 5
+
+
+def test_columns_share_cached_scores_with_instances(make_handler, standin):
+    handler = make_handler(PREDICTION_CACHE_SIZE='100')
+
+    assert handler.lambda_handler({'instances': [{'a': 25, 'b': 2.5}]}, None) == \
+        {'predictions': [{'quality': 27.5}], 'cacheHits': 0}
+    assert handler.lambda_handler({'columns': {'a': [25], 'b': [2.5]}}, None) == \
+        {'predictions': {'quality': [27.5]}, 'cacheHits': 1}
+    assert standin.stats['calls'] == 1
+
+
+def test_models_keep_their_cached_scores(make_handler, standin):
+    standin.put_schema('models', 'schemas/red.tar.gz.json', ['quality', 'x'])
+    handler = make_handler(MULTI_MODEL='true', MODEL_SCHEMA_BUCKET='models', MODEL_SCHEMA_PREFIX='schemas/',
+                           PREDICTION_CACHE_SIZE='100')
+
+    def score(model, record):
+        return handler.lambda_handler(dict(record, targetModel=model), None)
+
+    assert score('red.tar.gz', {'x': 1}) == {'prediction': {'quality': 1.0}, 'cacheHits': 0}
+    assert score('white.tar.gz', {'a': 1, 'b': 2}) == {'prediction': {'quality': 3.0}, 'cacheHits': 0}
+    assert score('red.tar.gz', {'x': 1})['cacheHits'] == 1
+    assert score('white.tar.gz', {'a': 1, 'b': 2})['cacheHits'] == 1
+    assert standin.stats['calls'] == 2
+
+
+def test_models_with_one_schema_do_not_share_scores(make_handler, standin):
+    handler = make_handler(MULTI_MODEL='true', MODEL_SCHEMA_BUCKET='models', PREDICTION_CACHE_SIZE='100')
+
+    assert handler.lambda_handler({'a': 1, 'b': 2, 'targetModel': 'red.tar.gz'}, None)['cacheHits'] == 0
+    assert handler.lambda_handler({'a': 1, 'b': 2, 'targetModel': 'white.tar.gz'}, None)['cacheHits'] == 0
+    assert standin.stats['calls'] == 2
+
+
+def _put_routes(standin, predictors):
+    routes = {name: {'columns': columns, 'endpoint': f'{name}-endpoint'} for name, columns in predictors.items()}
+    standin.put_object('models', 'fleet/predictors.json', json.dumps({'predictors': routes}).encode())
+
+
+def test_fleet_routes_by_predictor(make_handler, standin):
+    _put_routes(standin, {'wine': ['quality', 'a', 'b'], 'house': ['price', 'x']})
+    handler = make_handler(PREDICTOR_FLEET='true', SCHEMA_KEY='fleet/predictors.json')
+
+    assert handler.lambda_handler({'predictor': 'wine', 'a': 1, 'b': 2}, None) == {'prediction': {'quality': 3.0}}
+    assert handler.lambda_handler({'predictor': 'house', 'x': 5}, None) == {'prediction': {'price': 5.0}}
+
+    with pytest.raises(Exception, match='predictor is required'):
+        handler.lambda_handler({'x': 5}, None)
+
+
+def test_fleet_serves_a_new_predictor_before_the_ttl(make_handler, standin):
+    _put_routes(standin, {'wine': ['quality', 'a', 'b']})
+    handler = make_handler(PREDICTOR_FLEET='true', SCHEMA_KEY='fleet/predictors.json')
+    handler.lambda_handler({'predictor': 'wine', 'a': 1, 'b': 2}, None)
+
+    _put_routes(standin, {'wine': ['quality', 'a', 'b'], 'house': ['price', 'x']})
+    handler._MIN_REVALIDATE_INTERVAL = 0.0
+
+    assert handler.lambda_handler({'predictor': 'house', 'x': 5}, None) == {'prediction': {'price': 5.0}}
+
+
+def test_fleet_rate_limits_lookups_of_unknown_predictors(make_handler, standin):
+    _put_routes(standin, {'wine': ['quality', 'a', 'b']})
+    handler = make_handler(PREDICTOR_FLEET='true', SCHEMA_KEY='fleet/predictors.json')
+    handler.lambda_handler({'predictor': 'wine', 'a': 1, 'b': 2}, None)
+    gets = standin.stats['gets']
+
+    for _ in range(3):
+        with pytest.raises(Exception, match="unknown predictor 'nope'"):
+            handler.lambda_handler({'predictor': 'nope', 'x': 5}, None)
+
+    assert standin.stats['gets'] == gets
+
+
+def test_async_jobs_return_predictions_once_completed(make_handler, standin):
+    handler = make_handler(ASYNC_INFERENCE='true', ASYNC_BUCKET='staging')
+
+    submitted = handler.lambda_handler({'instances': [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]}, None)
+    assert submitted['status'] == 'pending'
+    assert handler.lambda_handler({'job': submitted['job']}, None) == {'job': submitted['job'], 'status': 'pending'}
+
+    assert standin.complete_jobs() == 1
+    assert handler.lambda_handler({'job': submitted['job']}, None) == {
+        'predictions': [{'quality': 3.0}, {'quality': 7.0}], 'job': submitted['job'], 'status': 'completed'}
+
+
+def test_async_jobs_report_failures(make_handler, standin):
+    handler = make_handler(ASYNC_INFERENCE='true', ASYNC_BUCKET='staging')
+
+    submitted = handler.lambda_handler({'columns': {'a': [1], 'b': [2]}}, None)
+    standin.complete_jobs(fail=True)
+
+    assert handler.lambda_handler({'job': submitted['job']}, None) == {
+        'job': submitted['job'], 'status': 'failed', 'error': 'Injected by the stand-in'}
+
+    with pytest.raises(Exception, match='unknown job'):
+        handler.lambda_handler({'job': 'f' * 32}, None)
+
+
+def _http_event(body, method='POST', headers=None, compress=False):
+    data = json.dumps(body).encode() if not isinstance(body, bytes) else body
+
+    if compress:
+        data = gzip.compress(data)
+        headers = dict(headers or {}, **{'content-encoding': 'gzip'})
+
+    return {
+        'version': '2.0',
+        'requestContext': {'http': {'method': method, 'path': '/'}},
+        'headers': headers or {},
+        'body': base64.b64encode(data).decode(),
+        'isBase64Encoded': True,
+    }
+
+
+def test_http_inflates_gzip_bodies_up_to_the_payload_limit(make_handler):
+    handler = make_handler()
+
+    response = handler.lambda_handler(_http_event({'a': 1, 'b': 2}, compress=True), None)
+    assert (response['statusCode'], json.loads(response['body'])) == (200, {'prediction': {'quality': 3.0}})
+
+    bomb = _http_event(b' ' * (handler._MAX_REQUEST_BYTES + 1), compress=True)
+    assert len(bomb['body']) < 20000
+    assert handler.lambda_handler(bomb, None)['statusCode'] == 413
+
+    truncated = _http_event(gzip.compress(b'{"a": 1, "b": 2}')[:-8], headers={'content-encoding': 'gzip'})
+    assert handler.lambda_handler(truncated, None)['statusCode'] == 400
+
+
+def _http_json(response):
+    body = response['body'].encode()
+
+    if response['isBase64Encoded']:
+        body = base64.b64decode(body)
+
+    if response['headers'].get('Content-Encoding') == 'gzip':
+        body = gzip.decompress(body)
+
+    return response['statusCode'], json.loads(body)
+
+
+def test_http_answers_payload_format_2(make_handler):
+    handler = make_handler()
+    event = _http_event({'a': 1, 'b': 2})
+    event.update(body=json.dumps({'a': 1, 'b': 2}), isBase64Encoded=False)
+
+    assert _http_json(handler.lambda_handler(event, None)) == (200, {'prediction': {'quality': 3.0}})
+    assert _http_json(handler.lambda_handler(_http_event({'a': 1, 'b': 2}), None)) == \
+        (200, {'prediction': {'quality': 3.0}})
+
+
+def test_http_compresses_large_responses_for_gzip_clients(make_handler):
+    handler = make_handler()
+    small = {'instances': [{'a': 1, 'b': 2}]}
+    large = {'instances': [{'a': i, 'b': 2} for i in range(100)]}
+    gzip_client = {'accept-encoding': 'gzip, deflate'}
+
+    response = handler.lambda_handler(_http_event(small, headers=gzip_client), None)
+    assert 'Content-Encoding' not in response['headers']
+    assert _http_json(response) == (200, {'predictions': [{'quality': 3.0}]})
+
+    response = handler.lambda_handler(_http_event(large), None)
+    assert 'Content-Encoding' not in response['headers']
+
+    response = handler.lambda_handler(_http_event(large, headers=gzip_client), None)
+    assert response['headers']['Content-Encoding'] == 'gzip'
+    assert _http_json(response) == (200, {'predictions': [{'quality': i + 2.0} for i in range(100)]})
+
+
+def test_http_status_codes(make_handler, standin):
+    handler = make_handler()
+
+    assert _http_json(handler.lambda_handler(_http_event({'a': 1, 'b': 2}, method='GET'), None)) == \
+        (405, {'error': 'Only POST requests are supported'})
+    assert _http_json(handler.lambda_handler(_http_event(b'{"a": '), None)) == \
+        (400, {'error': 'Invalid request: the body is not JSON'})
+    assert _http_json(handler.lambda_handler(_http_event({'a': 1}), None)) == \
+        (400, {'error': 'Invalid request: missing required columns: b'})
+
+    standin.error_rate = 1.0
+    assert _http_json(handler.lambda_handler(_http_event({'a': 1, 'b': 2}), None)) == \
+        (500, {'error': 'Internal error'})
+
+
+def test_invalid_requests_raise_invalid_request(make_handler):
+    handler = make_handler()
+
+    with pytest.raises(handler.InvalidRequest, match='missing required columns: b'):
+        handler.lambda_handler({'a': 1}, None)
+
+
+def test_routes_reach_the_endpoint(make_handler, standin):
+    handler = make_handler()
+    handler.lambda_handler({'a': 1, 'b': 2}, None)
+    handler.lambda_handler({'a': 1, 'b': 2, 'targetVariant': 'canary'}, None)
+
+    mme = make_handler(MULTI_MODEL='true', MODEL_SCHEMA_BUCKET='models')
+    mme.lambda_handler({'a': 1, 'b': 2, 'targetModel': 'red.tar.gz', 'targetVariant': 'blue'}, None)
+
+    assert standin.invocations == [
+        ('standin', None, None),
+        ('standin', 'canary', None),
+        ('standin', 'blue', 'red.tar.gz'),
+    ]
+
+
+def test_variants_keep_their_cached_scores(make_handler, standin):
+    handler = make_handler(PREDICTION_CACHE_SIZE='100')
+
+    def hits(variant):
+        return handler.lambda_handler({'a': 1, 'b': 2, 'targetVariant': variant}, None)['cacheHits']
+
+    assert (hits('blue'), hits('green'), hits('blue'), hits('green')) == (0, 0, 1, 1)
+    assert standin.stats['calls'] == 2
+
+
+@pytest.mark.parametrize('env, fields, message', [
+    ({}, {'targetVariant': 1}, 'targetVariant must be a string, got int'),
+    ({'ASYNC_INFERENCE': 'true', 'ASYNC_BUCKET': 'staging'}, {'targetVariant': 'blue'},
+     'targetVariant is not supported by asynchronous inference'),
+    ({}, {'targetModel': 'red.tar.gz'}, 'targetModel is only supported by a multi-model endpoint'),
+    ({'MULTI_MODEL': 'true', 'MODEL_SCHEMA_BUCKET': 'models'}, {'targetModel': '../x y'},
+     'targetModel must be a model key'),
+    ({'MULTI_MODEL': 'true', 'MODEL_SCHEMA_BUCKET': 'models'}, {}, 'targetModel is required'),
+])
+def test_routes_are_validated(make_handler, standin, env, fields, message):
+    handler = make_handler(**env)
+
+    with pytest.raises(handler.InvalidRequest, match=message):
+        handler.lambda_handler(dict(fields, a=1, b=2), None)
+
+    assert standin.invocations == []
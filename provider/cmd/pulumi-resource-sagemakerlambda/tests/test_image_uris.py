@@ -0,0 +1,54 @@
+#  Copyright 2016-2021, Pulumi Corporation.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+
+import pytest
+
+from sagemakerlambda_provider import image_uris
+
+
+@pytest.fixture(autouse=True)
+def fresh_table(monkeypatch, tmp_path):
+    monkeypatch.setattr(image_uris, '_table', None)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+
+
+def test_lookup_builds_the_uri_from_the_bundled_table():
+    assert image_uris.lookup('linear-learner', 'us-east-1') == \
+        '382416733822.dkr.ecr.us-east-1.amazonaws.com/linear-learner:1'
+    assert image_uris.lookup('linear-learner', 'mars-north-1') is None
+
+
+def test_a_table_of_another_layout_is_rejected(monkeypatch, tmp_path):
+    table = json.loads(image_uris.TABLE_PATH.read_text())
+    table['version'] = image_uris.TABLE_VERSION + 1
+    path = tmp_path / 'image_uris.json'
+    path.write_text(json.dumps(table))
+    monkeypatch.setattr(image_uris, 'TABLE_PATH', path)
+
+    with pytest.raises(Exception, match='layout version'):
+        image_uris.lookup('linear-learner', 'us-east-1')
+
+
+def test_a_cache_of_another_layout_is_ignored():
+    image_uris._write_cache({'custom/us-east-1': 'image:1'})
+
+    assert image_uris._read_cache() == {'custom/us-east-1': 'image:1'}
+
+    cache = json.loads(image_uris._cache_path().read_text())
+    cache['version'] = image_uris.TABLE_VERSION + 1
+    image_uris._cache_path().write_text(json.dumps(cache))
+
+    assert image_uris._read_cache() == {}
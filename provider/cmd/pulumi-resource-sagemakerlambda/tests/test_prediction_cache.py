@@ -0,0 +1,139 @@
+#  Copyright 2016-2021, Pulumi Corporation.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import socket
+
+import pytest
+
+from sagemakerlambda_provider.handler import CacheBackend, InProcessCacheBackend, RedisCacheBackend
+from sagemakerlambda_provider.standin import RedisStandIn
+
+
+@pytest.fixture
+def redis():
+    with RedisStandIn(password='secret') as server:
+        yield server
+
+
+def _url(redis, credentials='', db=''):
+    return redis.url.replace('redis://', f'redis://{credentials}') + db
+
+
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_backends_implement_the_interface():
+    with pytest.raises(TypeError):
+        CacheBackend()  # type: ignore
+
+    assert isinstance(InProcessCacheBackend(10), CacheBackend)
+
+
+def test_in_process_cache_drops_entries_of_another_namespace():
+    cache = InProcessCacheBackend(2)
+    cache.bind('a')
+    cache.set_many({'1,2': 3.0, '3,4': 7.0, '5,6': 11.0})
+
+    assert cache.get_many(['1,2', '3,4', '5,6']) == [None, 7.0, 11.0]
+
+    cache.bind('b')
+
+    assert cache.get_many(['3,4']) == [None]
+
+
+def test_redis_cache_authenticates_selects_and_round_trips(redis):
+    cache = RedisCacheBackend(_url(redis, ':secret@', '/3'), ttl=60)
+    cache.bind('endpoint')
+    cache.set_many({'1,2': 3.0, '3,4': 7.5})
+
+    assert cache.get_many(['1,2', '5,6', '3,4']) == [3.0, None, 7.5]
+    assert [command[0] for command in redis.commands] == [b'AUTH', b'SELECT', b'SET', b'SET', b'MGET']
+    assert redis.commands[1] == [b'SELECT', b'3']
+    assert redis.commands[2][3:] == [b'PX', b'60000']
+    assert redis.keys(3) == sorted(cache._prefix + key for key in ('1,2', '3,4'))
+
+
+def test_redis_cache_authenticates_as_a_user():
+    with RedisStandIn(password='secret', username='lambda') as redis:
+        cache = RedisCacheBackend(_url(redis, 'lambda:secret@'))
+        cache.bind('endpoint')
+        cache.set_many({'1,2': 3.0})
+
+        assert cache.get_many(['1,2']) == [3.0]
+        assert redis.commands[0] == [b'AUTH', b'lambda', b'secret']
+
+
+def test_redis_cache_scopes_keys_by_namespace(redis):
+    cache = RedisCacheBackend(_url(redis, ':secret@'))
+    cache.bind('red')
+    cache.set_many({'1,2': 3.0})
+    cache.bind('white')
+
+    assert cache.get_many(['1,2']) == [None]
+
+
+def test_redis_cache_is_bypassed_when_unreachable(caplog):
+    cache = RedisCacheBackend(f'redis://127.0.0.1:{_closed_port()}')
+    cache.bind('endpoint')
+    cache.set_many({'1,2': 3.0})
+
+    assert cache.get_many(['1,2']) == [None]
+    assert len([r for r in caplog.records if 'bypassing it' in r.getMessage()]) == 1
+
+
+def test_redis_cache_is_bypassed_when_rejected(redis):
+    cache = RedisCacheBackend(_url(redis, ':wrong@'))
+    cache.bind('endpoint')
+
+    assert cache.get_many(['1,2']) == [None]
+    assert [command[0] for command in redis.commands] == [b'AUTH']
+
+
+def test_redis_cache_reconnects_after_the_retry_delay(redis):
+    cache = RedisCacheBackend(_url(redis, ':secret@'))
+    cache.bind('endpoint')
+    cache.set_many({'1,2': 3.0})
+    port = int(redis.url.rsplit(':', 1)[1])
+    redis.stop()
+
+    assert cache.get_many(['1,2']) == [None]
+
+    with RedisStandIn(password='secret', port=port) as restarted:
+        assert cache.get_many(['1,2']) == [None]
+        assert restarted.commands == []
+
+        cache._retry_at = 0.0
+        cache.set_many({'1,2': 3.0})
+
+        assert cache.get_many(['1,2']) == [3.0]
+
+
+def test_handler_scores_through_the_redis_cache(make_handler, standin, redis):
+    handler = make_handler(PREDICTION_CACHE_BACKEND='redis', PREDICTION_CACHE_URL=_url(redis, ':secret@'))
+    request = {'instances': [{'a': 1, 'b': 2}, {'a': 1, 'b': 2}, {'a': 3, 'b': 4}]}
+
+    assert handler.lambda_handler(request, None) == \
+        {'predictions': [{'quality': 3.0}, {'quality': 3.0}, {'quality': 7.0}], 'cacheHits': 0}
+    assert handler.lambda_handler(request, None)['cacheHits'] == 3
+    assert standin.stats['rows'] == 2
+
+
+def test_handler_scores_without_an_unreachable_redis(make_handler, standin):
+    handler = make_handler(PREDICTION_CACHE_BACKEND='redis', PREDICTION_CACHE_URL=f'redis://127.0.0.1:{_closed_port()}')
+
+    assert handler.lambda_handler({'a': 1, 'b': 2}, None) == {'prediction': {'quality': 3.0}, 'cacheHits': 0}
+    assert standin.stats['calls'] == 1
@@ -0,0 +1,137 @@
+// *** WARNING: this file was generated by Pulumi SDK Generator. ***
+// *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+using System;
+using System.Collections.Generic;
+using System.Collections.Immutable;
+using System.Threading.Tasks;
+using Pulumi.Serialization;
+
+namespace Pulumi.Sagemakerlambda
+{
+    [SagemakerlambdaResourceType("sagemakerlambda:index:SagemakerPredictorFleet")]
+    public partial class SagemakerPredictorFleet : Pulumi.ComponentResource
+    {
+        /// <summary>
+        /// Names of the SageMaker endpoints by predictor.
+        /// </summary>
+        [Output("endpointNames")]
+        public Output<ImmutableDictionary<string, string>> EndpointNames { get; private set; } = null!;
+
+        /// <summary>
+        /// Name of the Lambda function serving every predictor.
+        /// </summary>
+        [Output("lambdaFunctionName")]
+        public Output<string> LambdaFunctionName { get; private set; } = null!;
+
+        /// <summary>
+        /// ARN of the provisioned role that can be reused for model training.
+        /// </summary>
+        [Output("trainingRoleArn")]
+        public Output<string> TrainingRoleArn { get; private set; } = null!;
+
+
+        /// <summary>
+        /// Create a SagemakerPredictorFleet resource with the given unique name, arguments, and options.
+        /// </summary>
+        ///
+        /// <param name="name">The unique name of the resource</param>
+        /// <param name="args">The arguments used to populate this resource's properties</param>
+        /// <param name="options">A bag of options that control this resource's behavior</param>
+        public SagemakerPredictorFleet(string name, SagemakerPredictorFleetArgs args, ComponentResourceOptions? options = null)
+            : base("sagemakerlambda:index:SagemakerPredictorFleet", name, args ?? new SagemakerPredictorFleetArgs(), MakeResourceOptions(options, ""), remote: true)
+        {
+        }
+
+        private static ComponentResourceOptions MakeResourceOptions(ComponentResourceOptions? options, Input<string>? id)
+        {
+            var defaultOptions = new ComponentResourceOptions
+            {
+                Version = Utilities.Version,
+            };
+            var merged = ComponentResourceOptions.Merge(defaultOptions, options);
+            // Override the ID if one was specified for consistency with other language SDKs.
+            merged.Id = id ?? merged.Id;
+            return merged;
+        }
+    }
+
+    public sealed class SagemakerPredictorFleetArgs : Pulumi.ResourceArgs
+    {
+        /// <summary>
+        /// AWS account ID. If omitted, the account of the AWS provider's credentials.
+        /// </summary>
+        [Input("accountId")]
+        public Input<string>? AccountId { get; set; }
+
+        /// <summary>
+        /// Initial number of instances of each endpoint. Defaults to 1.
+        /// </summary>
+        [Input("initialInstanceCount")]
+        public Input<int>? InitialInstanceCount { get; set; }
+
+        /// <summary>
+        /// Type of instance of each endpoint. Defaults to the smallest instance.
+        /// </summary>
+        [Input("instanceType")]
+        public Input<string>? InstanceType { get; set; }
+
+        /// <summary>
+        /// Memory of the shared Lambda function in MB. Defaults to 128.
+        /// </summary>
+        [Input("lambdaMemorySize")]
+        public Input<int>? LambdaMemorySize { get; set; }
+
+        /// <summary>
+        /// Python runtime of the shared Lambda function. Defaults to `python3.8`.
+        /// </summary>
+        [Input("lambdaRuntime")]
+        public Input<string>? LambdaRuntime { get; set; }
+
+        /// <summary>
+        /// Timeout of the shared Lambda function in seconds. Defaults to 30.
+        /// </summary>
+        [Input("lambdaTimeout")]
+        public Input<int>? LambdaTimeout { get; set; }
+
+        /// <summary>
+        /// ID of a bucket where trained model data is stored.
+        /// </summary>
+        [Input("modelDataBucket", required: true)]
+        public Input<string> ModelDataBucket { get; set; } = null!;
+
+        /// <summary>
+        /// Built-in SageMaker framework such as `linear-learner` serving the predictors that set neither `modelImage` nor `modelFramework`.
+        /// </summary>
+        [Input("modelFramework")]
+        public Input<string>? ModelFramework { get; set; }
+
+        /// <summary>
+        /// Custom Docker image serving the predictors that set neither `modelImage` nor `modelFramework`.
+        /// </summary>
+        [Input("modelImage")]
+        public Input<string>? ModelImage { get; set; }
+
+        [Input("models", required: true)]
+        private InputMap<ImmutableDictionary<string, object>>? _models;
+
+        /// <summary>
+        /// Predictors of the fleet by name, each a map with the `modelDataKey` of its trained model and the `columnNames` of its features, dependent variable first. A predictor may also set `modelFramework` or `modelImage`, `instanceType` and `initialInstanceCount`, which default to the settings of the fleet.
+        /// </summary>
+        public InputMap<ImmutableDictionary<string, object>> Models
+        {
+            get => _models ?? (_models = new InputMap<ImmutableDictionary<string, object>>());
+            set => _models = value;
+        }
+
+        /// <summary>
+        /// AWS region name. If omitted, inferred from the environment.
+        /// </summary>
+        [Input("region")]
+        public Input<string>? Region { get; set; }
+
+        public SagemakerPredictorFleetArgs()
+        {
+        }
+    }
+}
@@ -18,12 +18,30 @@ namespace Pulumi.Sagemakerlambda
         [Output("endpointName")]
         public Output<string?> EndpointName { get; private set; } = null!;
 
+        /// <summary>
+        /// ARN of the Lambda alias serving provisioned concurrency, if any. Invoking the unqualified function bypasses the warm environments.
+        /// </summary>
+        [Output("lambdaAliasArn")]
+        public Output<string?> LambdaAliasArn { get; private set; } = null!;
+
         /// <summary>
         /// Name of the provisioned Lambda function.  TODO can we just return the native object?
         /// </summary>
         [Output("lambdaFunctionName")]
         public Output<string?> LambdaFunctionName { get; private set; } = null!;
 
+        /// <summary>
+        /// Name of the SageMaker model behind the endpoint, which can also score offline with Batch Transform.
+        /// </summary>
+        [Output("modelName")]
+        public Output<string?> ModelName { get; private set; } = null!;
+
+        /// <summary>
+        /// URL to POST prediction requests to, if `httpEndpoint` is set.
+        /// </summary>
+        [Output("predictorUrl")]
+        public Output<string?> PredictorUrl { get; private set; } = null!;
+
         /// <summary>
         /// ARN of the provisioned role that can be reused for model training.
         /// </summary>
@@ -64,6 +82,90 @@ namespace Pulumi.Sagemakerlambda
         [Input("accountId")]
         public Input<string>? AccountId { get; set; }
 
+        /// <summary>
+        /// SNS topic notified when an asynchronous inference fails.
+        /// </summary>
+        [Input("asyncErrorTopicArn")]
+        public Input<string>? AsyncErrorTopicArn { get; set; }
+
+        /// <summary>
+        /// Whether the endpoint serves asynchronous inference. The Lambda function then stages requests under `async/<name>/` in `modelDataBucket`, where the endpoint also writes its output, and answers with job handles that are sent back to fetch the results.
+        /// </summary>
+        [Input("asyncInference")]
+        public Input<bool>? AsyncInference { get; set; }
+
+        /// <summary>
+        /// Requests each instance of an asynchronous endpoint processes at once. Chosen by SageMaker by default.
+        /// </summary>
+        [Input("asyncMaxConcurrentInvocationsPerInstance")]
+        public Input<int>? AsyncMaxConcurrentInvocationsPerInstance { get; set; }
+
+        /// <summary>
+        /// SNS topic notified when an asynchronous inference succeeds.
+        /// </summary>
+        [Input("asyncSuccessTopicArn")]
+        public Input<string>? AsyncSuccessTopicArn { get; set; }
+
+        /// <summary>
+        /// Number of chunks of one batch the Lambda function scores in parallel. Defaults to 4.
+        /// </summary>
+        [Input("batchConcurrency")]
+        public Input<int>? BatchConcurrency { get; set; }
+
+        /// <summary>
+        /// Maximum CSV payload size in bytes per endpoint call. Defaults to 5000000, under the 6 MB SageMaker limit.
+        /// </summary>
+        [Input("batchMaxBytes")]
+        public Input<int>? BatchMaxBytes { get; set; }
+
+        /// <summary>
+        /// Maximum number of rows the Lambda function sends per endpoint call; larger batches are split into chunks. Defaults to 1000.
+        /// </summary>
+        [Input("batchMaxRows")]
+        public Input<int>? BatchMaxRows { get; set; }
+
+        /// <summary>
+        /// Response type the Lambda function requests from the endpoint: `text/json` (default) or `text/csv`, which is cheaper to parse.
+        /// </summary>
+        [Input("clientAccept")]
+        public Input<string>? ClientAccept { get; set; }
+
+        /// <summary>
+        /// Connect timeout in seconds of the SageMaker runtime client.
+        /// </summary>
+        [Input("clientConnectTimeout")]
+        public Input<double>? ClientConnectTimeout { get; set; }
+
+        /// <summary>
+        /// Total number of attempts, including the first, the SageMaker runtime client makes per call.
+        /// </summary>
+        [Input("clientMaxAttempts")]
+        public Input<int>? ClientMaxAttempts { get; set; }
+
+        /// <summary>
+        /// Size of the HTTP connection pool of the Lambda function's SageMaker runtime client. Defaults to the botocore default of 10.
+        /// </summary>
+        [Input("clientMaxPoolConnections")]
+        public Input<int>? ClientMaxPoolConnections { get; set; }
+
+        /// <summary>
+        /// Read timeout in seconds of the SageMaker runtime client.
+        /// </summary>
+        [Input("clientReadTimeout")]
+        public Input<double>? ClientReadTimeout { get; set; }
+
+        /// <summary>
+        /// botocore retry mode of the SageMaker runtime client: `legacy`, `standard` or `adaptive`.
+        /// </summary>
+        [Input("clientRetryMode")]
+        public Input<string>? ClientRetryMode { get; set; }
+
+        /// <summary>
+        /// Whether the SageMaker runtime client enables TCP keepalive on its connections.
+        /// </summary>
+        [Input("clientTcpKeepalive")]
+        public Input<bool>? ClientTcpKeepalive { get; set; }
+
         [Input("columnNames", required: true)]
         private InputList<string>? _columnNames;
 
@@ -76,6 +178,24 @@ namespace Pulumi.Sagemakerlambda
             set => _columnNames = value;
         }
 
+        /// <summary>
+        /// Percentage of endpoint requests, from 1 to 100, whose payloads and responses SageMaker captures as JSON Lines under `capture/<name>/` in `modelDataBucket`. Not supported by serverless endpoints. Disabled by default.
+        /// </summary>
+        [Input("dataCapturePercentage")]
+        public Input<int>? DataCapturePercentage { get; set; }
+
+        /// <summary>
+        /// Authorization of the HTTP endpoint, `AWS_IAM` to require SigV4 signed requests or `NONE` for a public endpoint. Defaults to `AWS_IAM`.
+        /// </summary>
+        [Input("httpAuthType")]
+        public Input<string>? HttpAuthType { get; set; }
+
+        /// <summary>
+        /// Exposes the Lambda function over HTTP, as `function_url` for a Lambda Function URL or `http_api` for an API Gateway HTTP API, so that clients can POST requests over reused connections instead of calling the Lambda Invoke API.
+        /// </summary>
+        [Input("httpEndpoint")]
+        public Input<string>? HttpEndpoint { get; set; }
+
         /// <summary>
         /// TODO
         /// </summary>
@@ -88,6 +208,66 @@ namespace Pulumi.Sagemakerlambda
         [Input("instanceType")]
         public Input<string>? InstanceType { get; set; }
 
+        /// <summary>
+        /// Instruction set of the Lambda function: `x86_64` (default) or `arm64` for Graviton.
+        /// </summary>
+        [Input("lambdaArchitecture")]
+        public Input<string>? LambdaArchitecture { get; set; }
+
+        /// <summary>
+        /// Memory of the Lambda function in MB, which also scales its CPU. Defaults to 128.
+        /// </summary>
+        [Input("lambdaMemorySize")]
+        public Input<int>? LambdaMemorySize { get; set; }
+
+        /// <summary>
+        /// Python runtime of the Lambda function. Defaults to `python3.8`.
+        /// </summary>
+        [Input("lambdaRuntime")]
+        public Input<string>? LambdaRuntime { get; set; }
+
+        [Input("lambdaSecurityGroupIds")]
+        private InputList<string>? _lambdaSecurityGroupIds;
+
+        /// <summary>
+        /// Security groups of the Lambda function when it runs in a VPC.
+        /// </summary>
+        public InputList<string> LambdaSecurityGroupIds
+        {
+            get => _lambdaSecurityGroupIds ?? (_lambdaSecurityGroupIds = new InputList<string>());
+            set => _lambdaSecurityGroupIds = value;
+        }
+
+        [Input("lambdaSubnetIds")]
+        private InputList<string>? _lambdaSubnetIds;
+
+        /// <summary>
+        /// VPC subnets to run the Lambda function in, for example to reach an ElastiCache prediction cache. The subnets then need a route to S3 and the SageMaker runtime.
+        /// </summary>
+        public InputList<string> LambdaSubnetIds
+        {
+            get => _lambdaSubnetIds ?? (_lambdaSubnetIds = new InputList<string>());
+            set => _lambdaSubnetIds = value;
+        }
+
+        /// <summary>
+        /// Timeout of the Lambda function in seconds. Defaults to 30.
+        /// </summary>
+        [Input("lambdaTimeout")]
+        public Input<int>? LambdaTimeout { get; set; }
+
+        /// <summary>
+        /// When set, Application Auto Scaling scales the endpoint's `AllTraffic` variant between `minInstanceCount` and this many instances.
+        /// </summary>
+        [Input("maxInstanceCount")]
+        public Input<int>? MaxInstanceCount { get; set; }
+
+        /// <summary>
+        /// Fewest instances the endpoint scales in to. Defaults to `initialInstanceCount`.
+        /// </summary>
+        [Input("minInstanceCount")]
+        public Input<int>? MinInstanceCount { get; set; }
+
         /// <summary>
         /// TODO
         /// </summary>
@@ -112,12 +292,144 @@ namespace Pulumi.Sagemakerlambda
         [Input("modelImage")]
         public Input<string>? ModelImage { get; set; }
 
+        /// <summary>
+        /// Whether the endpoint is a multi-model endpoint serving every model artifact under the `modelDataKey` prefix. Requests name their model with `targetModel`, and a `<key>.json` object next to an artifact overrides `columnNames` for that model.
+        /// </summary>
+        [Input("multiModel")]
+        public Input<bool>? MultiModel { get; set; }
+
+        /// <summary>
+        /// Where the Lambda function caches scores: `memory` (default), an LRU per container, or `redis`, a server shared by all containers.
+        /// </summary>
+        [Input("predictionCacheBackend")]
+        public Input<string>? PredictionCacheBackend { get; set; }
+
+        /// <summary>
+        /// Maximum number of encoded feature rows whose scores the Lambda function caches in memory. Defaults to 0, which disables the cache.
+        /// </summary>
+        [Input("predictionCacheSize")]
+        public Input<int>? PredictionCacheSize { get; set; }
+
+        /// <summary>
+        /// Seconds a cached score stays valid. Defaults to 0, keeping scores until they are evicted.
+        /// </summary>
+        [Input("predictionCacheTtl")]
+        public Input<double>? PredictionCacheTtl { get; set; }
+
+        /// <summary>
+        /// URL of the Redis server for the `redis` prediction cache, such as `redis://host:6379/0`, or `rediss://` for TLS.
+        /// </summary>
+        [Input("predictionCacheUrl")]
+        public Input<string>? PredictionCacheUrl { get; set; }
+
+        /// <summary>
+        /// Number of pre-initialized execution environments kept warm for the Lambda function. When set, a version is published and the `live` alias serving it is given this provisioned concurrency.
+        /// </summary>
+        [Input("provisionedConcurrency")]
+        public Input<int>? ProvisionedConcurrency { get; set; }
+
+        /// <summary>
+        /// When set, Application Auto Scaling tracks provisioned concurrency utilization and scales between `provisionedConcurrency` and this maximum.
+        /// </summary>
+        [Input("provisionedConcurrencyMax")]
+        public Input<int>? ProvisionedConcurrencyMax { get; set; }
+
+        /// <summary>
+        /// Provisioned concurrency utilization the scaling policy aims for. Defaults to 0.7.
+        /// </summary>
+        [Input("provisionedConcurrencyTargetUtilization")]
+        public Input<double>? ProvisionedConcurrencyTargetUtilization { get; set; }
+
         /// <summary>
         /// TODO
         /// </summary>
         [Input("region")]
         public Input<string>? Region { get; set; }
 
+        /// <summary>
+        /// Concurrent executions reserved for the Lambda function, which also caps its concurrency. Unreserved by default.
+        /// </summary>
+        [Input("reservedConcurrency")]
+        public Input<int>? ReservedConcurrency { get; set; }
+
+        /// <summary>
+        /// Seconds after a scale-in before the endpoint scales in again. Defaults to 300.
+        /// </summary>
+        [Input("scaleInCooldown")]
+        public Input<int>? ScaleInCooldown { get; set; }
+
+        /// <summary>
+        /// Seconds after a scale-out before the endpoint scales out again. Defaults to 60.
+        /// </summary>
+        [Input("scaleOutCooldown")]
+        public Input<int>? ScaleOutCooldown { get; set; }
+
+        [Input("scalingCustomMetric")]
+        private InputMap<object>? _scalingCustomMetric;
+
+        /// <summary>
+        /// CloudWatch metric to track instead of invocations per instance, given as `metricName`, `namespace`, `statistic`, optional `unit` and `dimensions` (a map of dimension names to values) and the `targetValue` to aim for.
+        /// </summary>
+        public InputMap<object> ScalingCustomMetric
+        {
+            get => _scalingCustomMetric ?? (_scalingCustomMetric = new InputMap<object>());
+            set => _scalingCustomMetric = value;
+        }
+
+        /// <summary>
+        /// Where the Lambda function reads the feature schema from: `s3` (the default) stores it as an object in modelDataBucket, `archive` bundles it as schema.json with the function code and `environment` passes it in the SCHEMA_JSON variable. The latter two avoid an S3 request on every cold start.
+        /// </summary>
+        [Input("schemaSource")]
+        public Input<string>? SchemaSource { get; set; }
+
+        /// <summary>
+        /// Whether the endpoint uses SageMaker Serverless Inference instead of dedicated instances, scaling to zero when idle. Serverless endpoints take no instance type, count or autoscaling options and are not encrypted with the component's KMS key.
+        /// </summary>
+        [Input("serverless")]
+        public Input<bool>? Serverless { get; set; }
+
+        /// <summary>
+        /// Concurrent invocations a serverless endpoint serves before throttling. Defaults to 20.
+        /// </summary>
+        [Input("serverlessMaxConcurrency")]
+        public Input<int>? ServerlessMaxConcurrency { get; set; }
+
+        /// <summary>
+        /// Memory of a serverless endpoint in MB, from 1024 to 6144 in 1024 MB steps. Defaults to 2048.
+        /// </summary>
+        [Input("serverlessMemorySize")]
+        public Input<int>? ServerlessMemorySize { get; set; }
+
+        [Input("shadowVariant")]
+        private InputMap<object>? _shadowVariant;
+
+        /// <summary>
+        /// Variant that is sent a copy of production requests, given in the same form as `variants`, whose responses SageMaker only logs. Its weight relative to the production variants sets the share of requests it receives.
+        /// </summary>
+        public InputMap<object> ShadowVariant
+        {
+            get => _shadowVariant ?? (_shadowVariant = new InputMap<object>());
+            set => _shadowVariant = value;
+        }
+
+        /// <summary>
+        /// Invocations per instance per minute the scaling policy aims for. Defaults to 70.
+        /// </summary>
+        [Input("targetInvocationsPerInstance")]
+        public Input<double>? TargetInvocationsPerInstance { get; set; }
+
+        [Input("variants")]
+        private InputList<ImmutableDictionary<string, object>>? _variants;
+
+        /// <summary>
+        /// Production variants to split traffic between, each a map with a `name` and optional `modelDataKey`, `instanceType`, `initialInstanceCount` and `weight`, which default to the settings of the component and a weight of 1. Defaults to a single `AllTraffic` variant.
+        /// </summary>
+        public InputList<ImmutableDictionary<string, object>> Variants
+        {
+            get => _variants ?? (_variants = new InputList<ImmutableDictionary<string, object>>());
+            set => _variants = value;
+        }
+
         public SagemakerPredictorLambdaArgs()
         {
         }
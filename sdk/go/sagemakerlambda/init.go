@@ -20,6 +20,8 @@ func (m *module) Version() semver.Version {
 
 func (m *module) Construct(ctx *pulumi.Context, name, typ, urn string) (r pulumi.Resource, err error) {
 	switch typ {
+	case "sagemakerlambda:index:SagemakerPredictorFleet":
+		r = &SagemakerPredictorFleet{}
 	case "sagemakerlambda:index:SagemakerPredictorLambda":
 		r = &SagemakerPredictorLambda{}
 	default:
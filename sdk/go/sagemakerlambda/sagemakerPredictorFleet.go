@@ -0,0 +1,286 @@
+// *** WARNING: this file was generated by Pulumi SDK Generator. ***
+// *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+package sagemakerlambda
+
+import (
+	"context"
+	"reflect"
+
+	"github.com/pkg/errors"
+	"github.com/pulumi/pulumi/sdk/v3/go/pulumi"
+)
+
+type SagemakerPredictorFleet struct {
+	pulumi.ResourceState
+
+	// Names of the SageMaker endpoints by predictor.
+	EndpointNames pulumi.StringMapOutput `pulumi:"endpointNames"`
+	// Name of the Lambda function serving every predictor.
+	LambdaFunctionName pulumi.StringOutput `pulumi:"lambdaFunctionName"`
+	// ARN of the provisioned role that can be reused for model training.
+	TrainingRoleArn pulumi.StringOutput `pulumi:"trainingRoleArn"`
+}
+
+// NewSagemakerPredictorFleet registers a new resource with the given unique name, arguments, and options.
+func NewSagemakerPredictorFleet(ctx *pulumi.Context,
+	name string, args *SagemakerPredictorFleetArgs, opts ...pulumi.ResourceOption) (*SagemakerPredictorFleet, error) {
+	if args == nil {
+		return nil, errors.New("missing one or more required arguments")
+	}
+
+	if args.ModelDataBucket == nil {
+		return nil, errors.New("invalid value for required argument 'ModelDataBucket'")
+	}
+	if args.Models == nil {
+		return nil, errors.New("invalid value for required argument 'Models'")
+	}
+	var resource SagemakerPredictorFleet
+	err := ctx.RegisterRemoteComponentResource("sagemakerlambda:index:SagemakerPredictorFleet", name, args, &resource, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return &resource, nil
+}
+
+type sagemakerPredictorFleetArgs struct {
+	// AWS account ID. If omitted, the account of the AWS provider's credentials.
+	AccountId *string `pulumi:"accountId"`
+	// Initial number of instances of each endpoint. Defaults to 1.
+	InitialInstanceCount *int `pulumi:"initialInstanceCount"`
+	// Type of instance of each endpoint. Defaults to the smallest instance.
+	InstanceType *string `pulumi:"instanceType"`
+	// Memory of the shared Lambda function in MB. Defaults to 128.
+	LambdaMemorySize *int `pulumi:"lambdaMemorySize"`
+	// Python runtime of the shared Lambda function. Defaults to `python3.8`.
+	LambdaRuntime *string `pulumi:"lambdaRuntime"`
+	// Timeout of the shared Lambda function in seconds. Defaults to 30.
+	LambdaTimeout *int `pulumi:"lambdaTimeout"`
+	// ID of a bucket where trained model data is stored.
+	ModelDataBucket string `pulumi:"modelDataBucket"`
+	// Built-in SageMaker framework such as `linear-learner` serving the predictors that set neither `modelImage` nor `modelFramework`.
+	ModelFramework *string `pulumi:"modelFramework"`
+	// Custom Docker image serving the predictors that set neither `modelImage` nor `modelFramework`.
+	ModelImage *string `pulumi:"modelImage"`
+	// Predictors of the fleet by name, each a map with the `modelDataKey` of its trained model and the `columnNames` of its features, dependent variable first. A predictor may also set `modelFramework` or `modelImage`, `instanceType` and `initialInstanceCount`, which default to the settings of the fleet.
+	Models map[string]map[string]interface{} `pulumi:"models"`
+	// AWS region name. If omitted, inferred from the environment.
+	Region *string `pulumi:"region"`
+}
+
+// The set of arguments for constructing a SagemakerPredictorFleet resource.
+type SagemakerPredictorFleetArgs struct {
+	// AWS account ID. If omitted, the account of the AWS provider's credentials.
+	AccountId pulumi.StringPtrInput
+	// Initial number of instances of each endpoint. Defaults to 1.
+	InitialInstanceCount pulumi.IntPtrInput
+	// Type of instance of each endpoint. Defaults to the smallest instance.
+	InstanceType pulumi.StringPtrInput
+	// Memory of the shared Lambda function in MB. Defaults to 128.
+	LambdaMemorySize pulumi.IntPtrInput
+	// Python runtime of the shared Lambda function. Defaults to `python3.8`.
+	LambdaRuntime pulumi.StringPtrInput
+	// Timeout of the shared Lambda function in seconds. Defaults to 30.
+	LambdaTimeout pulumi.IntPtrInput
+	// ID of a bucket where trained model data is stored.
+	ModelDataBucket pulumi.StringInput
+	// Built-in SageMaker framework such as `linear-learner` serving the predictors that set neither `modelImage` nor `modelFramework`.
+	ModelFramework pulumi.StringPtrInput
+	// Custom Docker image serving the predictors that set neither `modelImage` nor `modelFramework`.
+	ModelImage pulumi.StringPtrInput
+	// Predictors of the fleet by name, each a map with the `modelDataKey` of its trained model and the `columnNames` of its features, dependent variable first. A predictor may also set `modelFramework` or `modelImage`, `instanceType` and `initialInstanceCount`, which default to the settings of the fleet.
+	Models pulumi.MapMapInput
+	// AWS region name. If omitted, inferred from the environment.
+	Region pulumi.StringPtrInput
+}
+
+func (SagemakerPredictorFleetArgs) ElementType() reflect.Type {
+	return reflect.TypeOf((*sagemakerPredictorFleetArgs)(nil)).Elem()
+}
+
+type SagemakerPredictorFleetInput interface {
+	pulumi.Input
+
+	ToSagemakerPredictorFleetOutput() SagemakerPredictorFleetOutput
+	ToSagemakerPredictorFleetOutputWithContext(ctx context.Context) SagemakerPredictorFleetOutput
+}
+
+func (*SagemakerPredictorFleet) ElementType() reflect.Type {
+	return reflect.TypeOf((*SagemakerPredictorFleet)(nil))
+}
+
+func (i *SagemakerPredictorFleet) ToSagemakerPredictorFleetOutput() SagemakerPredictorFleetOutput {
+	return i.ToSagemakerPredictorFleetOutputWithContext(context.Background())
+}
+
+func (i *SagemakerPredictorFleet) ToSagemakerPredictorFleetOutputWithContext(ctx context.Context) SagemakerPredictorFleetOutput {
+	return pulumi.ToOutputWithContext(ctx, i).(SagemakerPredictorFleetOutput)
+}
+
+func (i *SagemakerPredictorFleet) ToSagemakerPredictorFleetPtrOutput() SagemakerPredictorFleetPtrOutput {
+	return i.ToSagemakerPredictorFleetPtrOutputWithContext(context.Background())
+}
+
+func (i *SagemakerPredictorFleet) ToSagemakerPredictorFleetPtrOutputWithContext(ctx context.Context) SagemakerPredictorFleetPtrOutput {
+	return pulumi.ToOutputWithContext(ctx, i).(SagemakerPredictorFleetPtrOutput)
+}
+
+type SagemakerPredictorFleetPtrInput interface {
+	pulumi.Input
+
+	ToSagemakerPredictorFleetPtrOutput() SagemakerPredictorFleetPtrOutput
+	ToSagemakerPredictorFleetPtrOutputWithContext(ctx context.Context) SagemakerPredictorFleetPtrOutput
+}
+
+type sagemakerPredictorFleetPtrType SagemakerPredictorFleetArgs
+
+func (*sagemakerPredictorFleetPtrType) ElementType() reflect.Type {
+	return reflect.TypeOf((**SagemakerPredictorFleet)(nil))
+}
+
+func (i *sagemakerPredictorFleetPtrType) ToSagemakerPredictorFleetPtrOutput() SagemakerPredictorFleetPtrOutput {
+	return i.ToSagemakerPredictorFleetPtrOutputWithContext(context.Background())
+}
+
+func (i *sagemakerPredictorFleetPtrType) ToSagemakerPredictorFleetPtrOutputWithContext(ctx context.Context) SagemakerPredictorFleetPtrOutput {
+	return pulumi.ToOutputWithContext(ctx, i).(SagemakerPredictorFleetPtrOutput)
+}
+
+// SagemakerPredictorFleetArrayInput is an input type that accepts SagemakerPredictorFleetArray and SagemakerPredictorFleetArrayOutput values.
+// You can construct a concrete instance of `SagemakerPredictorFleetArrayInput` via:
+//
+//          SagemakerPredictorFleetArray{ SagemakerPredictorFleetArgs{...} }
+type SagemakerPredictorFleetArrayInput interface {
+	pulumi.Input
+
+	ToSagemakerPredictorFleetArrayOutput() SagemakerPredictorFleetArrayOutput
+	ToSagemakerPredictorFleetArrayOutputWithContext(context.Context) SagemakerPredictorFleetArrayOutput
+}
+
+type SagemakerPredictorFleetArray []SagemakerPredictorFleetInput
+
+func (SagemakerPredictorFleetArray) ElementType() reflect.Type {
+	return reflect.TypeOf(([]*SagemakerPredictorFleet)(nil))
+}
+
+func (i SagemakerPredictorFleetArray) ToSagemakerPredictorFleetArrayOutput() SagemakerPredictorFleetArrayOutput {
+	return i.ToSagemakerPredictorFleetArrayOutputWithContext(context.Background())
+}
+
+func (i SagemakerPredictorFleetArray) ToSagemakerPredictorFleetArrayOutputWithContext(ctx context.Context) SagemakerPredictorFleetArrayOutput {
+	return pulumi.ToOutputWithContext(ctx, i).(SagemakerPredictorFleetArrayOutput)
+}
+
+// SagemakerPredictorFleetMapInput is an input type that accepts SagemakerPredictorFleetMap and SagemakerPredictorFleetMapOutput values.
+// You can construct a concrete instance of `SagemakerPredictorFleetMapInput` via:
+//
+//          SagemakerPredictorFleetMap{ "key": SagemakerPredictorFleetArgs{...} }
+type SagemakerPredictorFleetMapInput interface {
+	pulumi.Input
+
+	ToSagemakerPredictorFleetMapOutput() SagemakerPredictorFleetMapOutput
+	ToSagemakerPredictorFleetMapOutputWithContext(context.Context) SagemakerPredictorFleetMapOutput
+}
+
+type SagemakerPredictorFleetMap map[string]SagemakerPredictorFleetInput
+
+func (SagemakerPredictorFleetMap) ElementType() reflect.Type {
+	return reflect.TypeOf((map[string]*SagemakerPredictorFleet)(nil))
+}
+
+func (i SagemakerPredictorFleetMap) ToSagemakerPredictorFleetMapOutput() SagemakerPredictorFleetMapOutput {
+	return i.ToSagemakerPredictorFleetMapOutputWithContext(context.Background())
+}
+
+func (i SagemakerPredictorFleetMap) ToSagemakerPredictorFleetMapOutputWithContext(ctx context.Context) SagemakerPredictorFleetMapOutput {
+	return pulumi.ToOutputWithContext(ctx, i).(SagemakerPredictorFleetMapOutput)
+}
+
+type SagemakerPredictorFleetOutput struct {
+	*pulumi.OutputState
+}
+
+func (SagemakerPredictorFleetOutput) ElementType() reflect.Type {
+	return reflect.TypeOf((*SagemakerPredictorFleet)(nil))
+}
+
+func (o SagemakerPredictorFleetOutput) ToSagemakerPredictorFleetOutput() SagemakerPredictorFleetOutput {
+	return o
+}
+
+func (o SagemakerPredictorFleetOutput) ToSagemakerPredictorFleetOutputWithContext(ctx context.Context) SagemakerPredictorFleetOutput {
+	return o
+}
+
+func (o SagemakerPredictorFleetOutput) ToSagemakerPredictorFleetPtrOutput() SagemakerPredictorFleetPtrOutput {
+	return o.ToSagemakerPredictorFleetPtrOutputWithContext(context.Background())
+}
+
+func (o SagemakerPredictorFleetOutput) ToSagemakerPredictorFleetPtrOutputWithContext(ctx context.Context) SagemakerPredictorFleetPtrOutput {
+	return o.ApplyT(func(v SagemakerPredictorFleet) *SagemakerPredictorFleet {
+		return &v
+	}).(SagemakerPredictorFleetPtrOutput)
+}
+
+type SagemakerPredictorFleetPtrOutput struct {
+	*pulumi.OutputState
+}
+
+func (SagemakerPredictorFleetPtrOutput) ElementType() reflect.Type {
+	return reflect.TypeOf((**SagemakerPredictorFleet)(nil))
+}
+
+func (o SagemakerPredictorFleetPtrOutput) ToSagemakerPredictorFleetPtrOutput() SagemakerPredictorFleetPtrOutput {
+	return o
+}
+
+func (o SagemakerPredictorFleetPtrOutput) ToSagemakerPredictorFleetPtrOutputWithContext(ctx context.Context) SagemakerPredictorFleetPtrOutput {
+	return o
+}
+
+type SagemakerPredictorFleetArrayOutput struct{ *pulumi.OutputState }
+
+func (SagemakerPredictorFleetArrayOutput) ElementType() reflect.Type {
+	return reflect.TypeOf((*[]SagemakerPredictorFleet)(nil))
+}
+
+func (o SagemakerPredictorFleetArrayOutput) ToSagemakerPredictorFleetArrayOutput() SagemakerPredictorFleetArrayOutput {
+	return o
+}
+
+func (o SagemakerPredictorFleetArrayOutput) ToSagemakerPredictorFleetArrayOutputWithContext(ctx context.Context) SagemakerPredictorFleetArrayOutput {
+	return o
+}
+
+func (o SagemakerPredictorFleetArrayOutput) Index(i pulumi.IntInput) SagemakerPredictorFleetOutput {
+	return pulumi.All(o, i).ApplyT(func(vs []interface{}) SagemakerPredictorFleet {
+		return vs[0].([]SagemakerPredictorFleet)[vs[1].(int)]
+	}).(SagemakerPredictorFleetOutput)
+}
+
+type SagemakerPredictorFleetMapOutput struct{ *pulumi.OutputState }
+
+func (SagemakerPredictorFleetMapOutput) ElementType() reflect.Type {
+	return reflect.TypeOf((*map[string]SagemakerPredictorFleet)(nil))
+}
+
+func (o SagemakerPredictorFleetMapOutput) ToSagemakerPredictorFleetMapOutput() SagemakerPredictorFleetMapOutput {
+	return o
+}
+
+func (o SagemakerPredictorFleetMapOutput) ToSagemakerPredictorFleetMapOutputWithContext(ctx context.Context) SagemakerPredictorFleetMapOutput {
+	return o
+}
+
+func (o SagemakerPredictorFleetMapOutput) MapIndex(k pulumi.StringInput) SagemakerPredictorFleetOutput {
+	return pulumi.All(o, k).ApplyT(func(vs []interface{}) SagemakerPredictorFleet {
+		return vs[0].(map[string]SagemakerPredictorFleet)[vs[1].(string)]
+	}).(SagemakerPredictorFleetOutput)
+}
+
+func init() {
+	pulumi.RegisterOutputType(SagemakerPredictorFleetOutput{})
+	pulumi.RegisterOutputType(SagemakerPredictorFleetPtrOutput{})
+	pulumi.RegisterOutputType(SagemakerPredictorFleetArrayOutput{})
+	pulumi.RegisterOutputType(SagemakerPredictorFleetMapOutput{})
+}
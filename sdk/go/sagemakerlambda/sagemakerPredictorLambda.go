@@ -16,8 +16,14 @@ type SagemakerPredictorLambda struct {
 
 	// Name of the provisioned SageMaker endpoint.  TODO can we just pass Endpoint type?
 	EndpointName pulumi.StringPtrOutput `pulumi:"endpointName"`
+	// ARN of the Lambda alias serving provisioned concurrency, if any. Invoking the unqualified function bypasses the warm environments.
+	LambdaAliasArn pulumi.StringPtrOutput `pulumi:"lambdaAliasArn"`
 	// Name of the provisioned Lambda function.  TODO can we just return the native object?
 	LambdaFunctionName pulumi.StringPtrOutput `pulumi:"lambdaFunctionName"`
+	// Name of the SageMaker model behind the endpoint, which can also score offline with Batch Transform.
+	ModelName pulumi.StringPtrOutput `pulumi:"modelName"`
+	// URL to POST prediction requests to, if `httpEndpoint` is set.
+	PredictorUrl pulumi.StringPtrOutput `pulumi:"predictorUrl"`
 	// ARN of the provisioned role that can be reused for model training.
 	TrainingRoleArn pulumi.StringOutput `pulumi:"trainingRoleArn"`
 }
@@ -46,12 +52,62 @@ func NewSagemakerPredictorLambda(ctx *pulumi.Context,
 type sagemakerPredictorLambdaArgs struct {
 	// TODO
 	AccountId *string `pulumi:"accountId"`
+	// SNS topic notified when an asynchronous inference fails.
+	AsyncErrorTopicArn *string `pulumi:"asyncErrorTopicArn"`
+	// Whether the endpoint serves asynchronous inference. The Lambda function then stages requests under `async/<name>/` in `modelDataBucket`, where the endpoint also writes its output, and answers with job handles that are sent back to fetch the results.
+	AsyncInference *bool `pulumi:"asyncInference"`
+	// Requests each instance of an asynchronous endpoint processes at once. Chosen by SageMaker by default.
+	AsyncMaxConcurrentInvocationsPerInstance *int `pulumi:"asyncMaxConcurrentInvocationsPerInstance"`
+	// SNS topic notified when an asynchronous inference succeeds.
+	AsyncSuccessTopicArn *string `pulumi:"asyncSuccessTopicArn"`
+	// Number of chunks of one batch the Lambda function scores in parallel. Defaults to 4.
+	BatchConcurrency *int `pulumi:"batchConcurrency"`
+	// Maximum CSV payload size in bytes per endpoint call. Defaults to 5000000, under the 6 MB SageMaker limit.
+	BatchMaxBytes *int `pulumi:"batchMaxBytes"`
+	// Maximum number of rows the Lambda function sends per endpoint call; larger batches are split into chunks. Defaults to 1000.
+	BatchMaxRows *int `pulumi:"batchMaxRows"`
+	// Response type the Lambda function requests from the endpoint: `text/json` (default) or `text/csv`, which is cheaper to parse.
+	ClientAccept *string `pulumi:"clientAccept"`
+	// Connect timeout in seconds of the SageMaker runtime client.
+	ClientConnectTimeout *float64 `pulumi:"clientConnectTimeout"`
+	// Total number of attempts, including the first, the SageMaker runtime client makes per call.
+	ClientMaxAttempts *int `pulumi:"clientMaxAttempts"`
+	// Size of the HTTP connection pool of the Lambda function's SageMaker runtime client. Defaults to the botocore default of 10.
+	ClientMaxPoolConnections *int `pulumi:"clientMaxPoolConnections"`
+	// Read timeout in seconds of the SageMaker runtime client.
+	ClientReadTimeout *float64 `pulumi:"clientReadTimeout"`
+	// botocore retry mode of the SageMaker runtime client: `legacy`, `standard` or `adaptive`.
+	ClientRetryMode *string `pulumi:"clientRetryMode"`
+	// Whether the SageMaker runtime client enables TCP keepalive on its connections.
+	ClientTcpKeepalive *bool `pulumi:"clientTcpKeepalive"`
 	// TODO
 	ColumnNames []string `pulumi:"columnNames"`
+	// Percentage of endpoint requests, from 1 to 100, whose payloads and responses SageMaker captures as JSON Lines under `capture/<name>/` in `modelDataBucket`. Not supported by serverless endpoints. Disabled by default.
+	DataCapturePercentage *int `pulumi:"dataCapturePercentage"`
+	// Authorization of the HTTP endpoint, `AWS_IAM` to require SigV4 signed requests or `NONE` for a public endpoint. Defaults to `AWS_IAM`.
+	HttpAuthType *string `pulumi:"httpAuthType"`
+	// Exposes the Lambda function over HTTP, as `function_url` for a Lambda Function URL or `http_api` for an API Gateway HTTP API, so that clients can POST requests over reused connections instead of calling the Lambda Invoke API.
+	HttpEndpoint *string `pulumi:"httpEndpoint"`
 	// TODO
 	InitialInstanceCount *int `pulumi:"initialInstanceCount"`
 	// TODO
 	InstanceType *string `pulumi:"instanceType"`
+	// Instruction set of the Lambda function: `x86_64` (default) or `arm64` for Graviton.
+	LambdaArchitecture *string `pulumi:"lambdaArchitecture"`
+	// Memory of the Lambda function in MB, which also scales its CPU. Defaults to 128.
+	LambdaMemorySize *int `pulumi:"lambdaMemorySize"`
+	// Python runtime of the Lambda function. Defaults to `python3.8`.
+	LambdaRuntime *string `pulumi:"lambdaRuntime"`
+	// Security groups of the Lambda function when it runs in a VPC.
+	LambdaSecurityGroupIds []string `pulumi:"lambdaSecurityGroupIds"`
+	// VPC subnets to run the Lambda function in, for example to reach an ElastiCache prediction cache. The subnets then need a route to S3 and the SageMaker runtime.
+	LambdaSubnetIds []string `pulumi:"lambdaSubnetIds"`
+	// Timeout of the Lambda function in seconds. Defaults to 30.
+	LambdaTimeout *int `pulumi:"lambdaTimeout"`
+	// When set, Application Auto Scaling scales the endpoint's `AllTraffic` variant between `minInstanceCount` and this many instances.
+	MaxInstanceCount *int `pulumi:"maxInstanceCount"`
+	// Fewest instances the endpoint scales in to. Defaults to `initialInstanceCount`.
+	MinInstanceCount *int `pulumi:"minInstanceCount"`
 	// TODO
 	ModelDataBucket string `pulumi:"modelDataBucket"`
 	// TODO
@@ -60,20 +116,108 @@ type sagemakerPredictorLambdaArgs struct {
 	ModelFramework *string `pulumi:"modelFramework"`
 	// TODO
 	ModelImage *string `pulumi:"modelImage"`
+	// Whether the endpoint is a multi-model endpoint serving every model artifact under the `modelDataKey` prefix. Requests name their model with `targetModel`, and a `<key>.json` object next to an artifact overrides `columnNames` for that model.
+	MultiModel *bool `pulumi:"multiModel"`
+	// Where the Lambda function caches scores: `memory` (default), an LRU per container, or `redis`, a server shared by all containers.
+	PredictionCacheBackend *string `pulumi:"predictionCacheBackend"`
+	// Maximum number of encoded feature rows whose scores the Lambda function caches in memory. Defaults to 0, which disables the cache.
+	PredictionCacheSize *int `pulumi:"predictionCacheSize"`
+	// Seconds a cached score stays valid. Defaults to 0, keeping scores until they are evicted.
+	PredictionCacheTtl *float64 `pulumi:"predictionCacheTtl"`
+	// URL of the Redis server for the `redis` prediction cache, such as `redis://host:6379/0`, or `rediss://` for TLS.
+	PredictionCacheUrl *string `pulumi:"predictionCacheUrl"`
+	// Number of pre-initialized execution environments kept warm for the Lambda function. When set, a version is published and the `live` alias serving it is given this provisioned concurrency.
+	ProvisionedConcurrency *int `pulumi:"provisionedConcurrency"`
+	// When set, Application Auto Scaling tracks provisioned concurrency utilization and scales between `provisionedConcurrency` and this maximum.
+	ProvisionedConcurrencyMax *int `pulumi:"provisionedConcurrencyMax"`
+	// Provisioned concurrency utilization the scaling policy aims for. Defaults to 0.7.
+	ProvisionedConcurrencyTargetUtilization *float64 `pulumi:"provisionedConcurrencyTargetUtilization"`
 	// TODO
 	Region *string `pulumi:"region"`
+	// Concurrent executions reserved for the Lambda function, which also caps its concurrency. Unreserved by default.
+	ReservedConcurrency *int `pulumi:"reservedConcurrency"`
+	// Seconds after a scale-in before the endpoint scales in again. Defaults to 300.
+	ScaleInCooldown *int `pulumi:"scaleInCooldown"`
+	// Seconds after a scale-out before the endpoint scales out again. Defaults to 60.
+	ScaleOutCooldown *int `pulumi:"scaleOutCooldown"`
+	// CloudWatch metric to track instead of invocations per instance, given as `metricName`, `namespace`, `statistic`, optional `unit` and `dimensions` (a map of dimension names to values) and the `targetValue` to aim for.
+	ScalingCustomMetric map[string]interface{} `pulumi:"scalingCustomMetric"`
+	// Where the Lambda function reads the feature schema from: `s3` (the default) stores it as an object in modelDataBucket, `archive` bundles it as schema.json with the function code and `environment` passes it in the SCHEMA_JSON variable. The latter two avoid an S3 request on every cold start.
+	SchemaSource *string `pulumi:"schemaSource"`
+	// Whether the endpoint uses SageMaker Serverless Inference instead of dedicated instances, scaling to zero when idle. Serverless endpoints take no instance type, count or autoscaling options and are not encrypted with the component's KMS key.
+	Serverless *bool `pulumi:"serverless"`
+	// Concurrent invocations a serverless endpoint serves before throttling. Defaults to 20.
+	ServerlessMaxConcurrency *int `pulumi:"serverlessMaxConcurrency"`
+	// Memory of a serverless endpoint in MB, from 1024 to 6144 in 1024 MB steps. Defaults to 2048.
+	ServerlessMemorySize *int `pulumi:"serverlessMemorySize"`
+	// Variant that is sent a copy of production requests, given in the same form as `variants`, whose responses SageMaker only logs. Its weight relative to the production variants sets the share of requests it receives.
+	ShadowVariant map[string]interface{} `pulumi:"shadowVariant"`
+	// Invocations per instance per minute the scaling policy aims for. Defaults to 70.
+	TargetInvocationsPerInstance *float64 `pulumi:"targetInvocationsPerInstance"`
+	// Production variants to split traffic between, each a map with a `name` and optional `modelDataKey`, `instanceType`, `initialInstanceCount` and `weight`, which default to the settings of the component and a weight of 1. Defaults to a single `AllTraffic` variant.
+	Variants []map[string]interface{} `pulumi:"variants"`
 }
 
 // The set of arguments for constructing a SagemakerPredictorLambda resource.
 type SagemakerPredictorLambdaArgs struct {
 	// TODO
 	AccountId pulumi.StringPtrInput
+	// SNS topic notified when an asynchronous inference fails.
+	AsyncErrorTopicArn pulumi.StringPtrInput
+	// Whether the endpoint serves asynchronous inference. The Lambda function then stages requests under `async/<name>/` in `modelDataBucket`, where the endpoint also writes its output, and answers with job handles that are sent back to fetch the results.
+	AsyncInference pulumi.BoolPtrInput
+	// Requests each instance of an asynchronous endpoint processes at once. Chosen by SageMaker by default.
+	AsyncMaxConcurrentInvocationsPerInstance pulumi.IntPtrInput
+	// SNS topic notified when an asynchronous inference succeeds.
+	AsyncSuccessTopicArn pulumi.StringPtrInput
+	// Number of chunks of one batch the Lambda function scores in parallel. Defaults to 4.
+	BatchConcurrency pulumi.IntPtrInput
+	// Maximum CSV payload size in bytes per endpoint call. Defaults to 5000000, under the 6 MB SageMaker limit.
+	BatchMaxBytes pulumi.IntPtrInput
+	// Maximum number of rows the Lambda function sends per endpoint call; larger batches are split into chunks. Defaults to 1000.
+	BatchMaxRows pulumi.IntPtrInput
+	// Response type the Lambda function requests from the endpoint: `text/json` (default) or `text/csv`, which is cheaper to parse.
+	ClientAccept pulumi.StringPtrInput
+	// Connect timeout in seconds of the SageMaker runtime client.
+	ClientConnectTimeout pulumi.Float64PtrInput
+	// Total number of attempts, including the first, the SageMaker runtime client makes per call.
+	ClientMaxAttempts pulumi.IntPtrInput
+	// Size of the HTTP connection pool of the Lambda function's SageMaker runtime client. Defaults to the botocore default of 10.
+	ClientMaxPoolConnections pulumi.IntPtrInput
+	// Read timeout in seconds of the SageMaker runtime client.
+	ClientReadTimeout pulumi.Float64PtrInput
+	// botocore retry mode of the SageMaker runtime client: `legacy`, `standard` or `adaptive`.
+	ClientRetryMode pulumi.StringPtrInput
+	// Whether the SageMaker runtime client enables TCP keepalive on its connections.
+	ClientTcpKeepalive pulumi.BoolPtrInput
 	// TODO
 	ColumnNames pulumi.StringArrayInput
+	// Percentage of endpoint requests, from 1 to 100, whose payloads and responses SageMaker captures as JSON Lines under `capture/<name>/` in `modelDataBucket`. Not supported by serverless endpoints. Disabled by default.
+	DataCapturePercentage pulumi.IntPtrInput
+	// Authorization of the HTTP endpoint, `AWS_IAM` to require SigV4 signed requests or `NONE` for a public endpoint. Defaults to `AWS_IAM`.
+	HttpAuthType pulumi.StringPtrInput
+	// Exposes the Lambda function over HTTP, as `function_url` for a Lambda Function URL or `http_api` for an API Gateway HTTP API, so that clients can POST requests over reused connections instead of calling the Lambda Invoke API.
+	HttpEndpoint pulumi.StringPtrInput
 	// TODO
 	InitialInstanceCount pulumi.IntPtrInput
 	// TODO
 	InstanceType pulumi.StringPtrInput
+	// Instruction set of the Lambda function: `x86_64` (default) or `arm64` for Graviton.
+	LambdaArchitecture pulumi.StringPtrInput
+	// Memory of the Lambda function in MB, which also scales its CPU. Defaults to 128.
+	LambdaMemorySize pulumi.IntPtrInput
+	// Python runtime of the Lambda function. Defaults to `python3.8`.
+	LambdaRuntime pulumi.StringPtrInput
+	// Security groups of the Lambda function when it runs in a VPC.
+	LambdaSecurityGroupIds pulumi.StringArrayInput
+	// VPC subnets to run the Lambda function in, for example to reach an ElastiCache prediction cache. The subnets then need a route to S3 and the SageMaker runtime.
+	LambdaSubnetIds pulumi.StringArrayInput
+	// Timeout of the Lambda function in seconds. Defaults to 30.
+	LambdaTimeout pulumi.IntPtrInput
+	// When set, Application Auto Scaling scales the endpoint's `AllTraffic` variant between `minInstanceCount` and this many instances.
+	MaxInstanceCount pulumi.IntPtrInput
+	// Fewest instances the endpoint scales in to. Defaults to `initialInstanceCount`.
+	MinInstanceCount pulumi.IntPtrInput
 	// TODO
 	ModelDataBucket pulumi.StringInput
 	// TODO
@@ -82,8 +226,46 @@ type SagemakerPredictorLambdaArgs struct {
 	ModelFramework pulumi.StringPtrInput
 	// TODO
 	ModelImage pulumi.StringPtrInput
+	// Whether the endpoint is a multi-model endpoint serving every model artifact under the `modelDataKey` prefix. Requests name their model with `targetModel`, and a `<key>.json` object next to an artifact overrides `columnNames` for that model.
+	MultiModel pulumi.BoolPtrInput
+	// Where the Lambda function caches scores: `memory` (default), an LRU per container, or `redis`, a server shared by all containers.
+	PredictionCacheBackend pulumi.StringPtrInput
+	// Maximum number of encoded feature rows whose scores the Lambda function caches in memory. Defaults to 0, which disables the cache.
+	PredictionCacheSize pulumi.IntPtrInput
+	// Seconds a cached score stays valid. Defaults to 0, keeping scores until they are evicted.
+	PredictionCacheTtl pulumi.Float64PtrInput
+	// URL of the Redis server for the `redis` prediction cache, such as `redis://host:6379/0`, or `rediss://` for TLS.
+	PredictionCacheUrl pulumi.StringPtrInput
+	// Number of pre-initialized execution environments kept warm for the Lambda function. When set, a version is published and the `live` alias serving it is given this provisioned concurrency.
+	ProvisionedConcurrency pulumi.IntPtrInput
+	// When set, Application Auto Scaling tracks provisioned concurrency utilization and scales between `provisionedConcurrency` and this maximum.
+	ProvisionedConcurrencyMax pulumi.IntPtrInput
+	// Provisioned concurrency utilization the scaling policy aims for. Defaults to 0.7.
+	ProvisionedConcurrencyTargetUtilization pulumi.Float64PtrInput
 	// TODO
 	Region pulumi.StringPtrInput
+	// Concurrent executions reserved for the Lambda function, which also caps its concurrency. Unreserved by default.
+	ReservedConcurrency pulumi.IntPtrInput
+	// Seconds after a scale-in before the endpoint scales in again. Defaults to 300.
+	ScaleInCooldown pulumi.IntPtrInput
+	// Seconds after a scale-out before the endpoint scales out again. Defaults to 60.
+	ScaleOutCooldown pulumi.IntPtrInput
+	// CloudWatch metric to track instead of invocations per instance, given as `metricName`, `namespace`, `statistic`, optional `unit` and `dimensions` (a map of dimension names to values) and the `targetValue` to aim for.
+	ScalingCustomMetric pulumi.MapInput
+	// Where the Lambda function reads the feature schema from: `s3` (the default) stores it as an object in modelDataBucket, `archive` bundles it as schema.json with the function code and `environment` passes it in the SCHEMA_JSON variable. The latter two avoid an S3 request on every cold start.
+	SchemaSource pulumi.StringPtrInput
+	// Whether the endpoint uses SageMaker Serverless Inference instead of dedicated instances, scaling to zero when idle. Serverless endpoints take no instance type, count or autoscaling options and are not encrypted with the component's KMS key.
+	Serverless pulumi.BoolPtrInput
+	// Concurrent invocations a serverless endpoint serves before throttling. Defaults to 20.
+	ServerlessMaxConcurrency pulumi.IntPtrInput
+	// Memory of a serverless endpoint in MB, from 1024 to 6144 in 1024 MB steps. Defaults to 2048.
+	ServerlessMemorySize pulumi.IntPtrInput
+	// Variant that is sent a copy of production requests, given in the same form as `variants`, whose responses SageMaker only logs. Its weight relative to the production variants sets the share of requests it receives.
+	ShadowVariant pulumi.MapInput
+	// Invocations per instance per minute the scaling policy aims for. Defaults to 70.
+	TargetInvocationsPerInstance pulumi.Float64PtrInput
+	// Production variants to split traffic between, each a map with a `name` and optional `modelDataKey`, `instanceType`, `initialInstanceCount` and `weight`, which default to the settings of the component and a weight of 1. Defaults to a single `AllTraffic` variant.
+	Variants pulumi.MapArrayInput
 }
 
 func (SagemakerPredictorLambdaArgs) ElementType() reflect.Type {
@@ -6,15 +6,19 @@ import * as utilities from "./utilities";
 
 // Export members:
 export * from "./provider";
+export * from "./sagemakerPredictorFleet";
 export * from "./sagemakerPredictorLambda";
 
 // Import resources to register:
+import { SagemakerPredictorFleet } from "./sagemakerPredictorFleet";
 import { SagemakerPredictorLambda } from "./sagemakerPredictorLambda";
 
 const _module = {
     version: utilities.getVersion(),
     construct: (name: string, type: string, urn: string): pulumi.Resource => {
         switch (type) {
+            case "sagemakerlambda:index:SagemakerPredictorFleet":
+                return new SagemakerPredictorFleet(name, <any>undefined, { urn })
             case "sagemakerlambda:index:SagemakerPredictorLambda":
                 return new SagemakerPredictorLambda(name, <any>undefined, { urn })
             default:
@@ -0,0 +1,126 @@
+// *** WARNING: this file was generated by Pulumi SDK Generator. ***
+// *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import * as pulumi from "@pulumi/pulumi";
+import * as utilities from "./utilities";
+
+export class SagemakerPredictorFleet extends pulumi.ComponentResource {
+    /** @internal */
+    public static readonly __pulumiType = 'sagemakerlambda:index:SagemakerPredictorFleet';
+
+    /**
+     * Returns true if the given object is an instance of SagemakerPredictorFleet.  This is designed to work even
+     * when multiple copies of the Pulumi SDK have been loaded into the same process.
+     */
+    public static isInstance(obj: any): obj is SagemakerPredictorFleet {
+        if (obj === undefined || obj === null) {
+            return false;
+        }
+        return obj['__pulumiType'] === SagemakerPredictorFleet.__pulumiType;
+    }
+
+    /**
+     * Names of the SageMaker endpoints by predictor.
+     */
+    public /*out*/ readonly endpointNames!: pulumi.Output<{[key: string]: string}>;
+    /**
+     * Name of the Lambda function serving every predictor.
+     */
+    public /*out*/ readonly lambdaFunctionName!: pulumi.Output<string>;
+    /**
+     * ARN of the provisioned role that can be reused for model training.
+     */
+    public /*out*/ readonly trainingRoleArn!: pulumi.Output<string>;
+
+    /**
+     * Create a SagemakerPredictorFleet resource with the given unique name, arguments, and options.
+     *
+     * @param name The _unique_ name of the resource.
+     * @param args The arguments to use to populate this resource's properties.
+     * @param opts A bag of options that control this resource's behavior.
+     */
+    constructor(name: string, args: SagemakerPredictorFleetArgs, opts?: pulumi.ComponentResourceOptions) {
+        let inputs: pulumi.Inputs = {};
+        opts = opts || {};
+        if (!opts.id) {
+            if ((!args || args.modelDataBucket === undefined) && !opts.urn) {
+                throw new Error("Missing required property 'modelDataBucket'");
+            }
+            if ((!args || args.models === undefined) && !opts.urn) {
+                throw new Error("Missing required property 'models'");
+            }
+            inputs["accountId"] = args ? args.accountId : undefined;
+            inputs["initialInstanceCount"] = args ? args.initialInstanceCount : undefined;
+            inputs["instanceType"] = args ? args.instanceType : undefined;
+            inputs["lambdaMemorySize"] = args ? args.lambdaMemorySize : undefined;
+            inputs["lambdaRuntime"] = args ? args.lambdaRuntime : undefined;
+            inputs["lambdaTimeout"] = args ? args.lambdaTimeout : undefined;
+            inputs["modelDataBucket"] = args ? args.modelDataBucket : undefined;
+            inputs["modelFramework"] = args ? args.modelFramework : undefined;
+            inputs["modelImage"] = args ? args.modelImage : undefined;
+            inputs["models"] = args ? args.models : undefined;
+            inputs["region"] = args ? args.region : undefined;
+            inputs["endpointNames"] = undefined /*out*/;
+            inputs["lambdaFunctionName"] = undefined /*out*/;
+            inputs["trainingRoleArn"] = undefined /*out*/;
+        } else {
+            inputs["endpointNames"] = undefined /*out*/;
+            inputs["lambdaFunctionName"] = undefined /*out*/;
+            inputs["trainingRoleArn"] = undefined /*out*/;
+        }
+        if (!opts.version) {
+            opts = pulumi.mergeOptions(opts, { version: utilities.getVersion()});
+        }
+        super(SagemakerPredictorFleet.__pulumiType, name, inputs, opts, true /*remote*/);
+    }
+}
+
+/**
+ * The set of arguments for constructing a SagemakerPredictorFleet resource.
+ */
+export interface SagemakerPredictorFleetArgs {
+    /**
+     * AWS account ID. If omitted, the account of the AWS provider's credentials.
+     */
+    readonly accountId?: pulumi.Input<string>;
+    /**
+     * Initial number of instances of each endpoint. Defaults to 1.
+     */
+    readonly initialInstanceCount?: pulumi.Input<number>;
+    /**
+     * Type of instance of each endpoint. Defaults to the smallest instance.
+     */
+    readonly instanceType?: pulumi.Input<string>;
+    /**
+     * Memory of the shared Lambda function in MB. Defaults to 128.
+     */
+    readonly lambdaMemorySize?: pulumi.Input<number>;
+    /**
+     * Python runtime of the shared Lambda function. Defaults to `python3.8`.
+     */
+    readonly lambdaRuntime?: pulumi.Input<string>;
+    /**
+     * Timeout of the shared Lambda function in seconds. Defaults to 30.
+     */
+    readonly lambdaTimeout?: pulumi.Input<number>;
+    /**
+     * ID of a bucket where trained model data is stored.
+     */
+    readonly modelDataBucket: pulumi.Input<string>;
+    /**
+     * Built-in SageMaker framework such as `linear-learner` serving the predictors that set neither `modelImage` nor `modelFramework`.
+     */
+    readonly modelFramework?: pulumi.Input<string>;
+    /**
+     * Custom Docker image serving the predictors that set neither `modelImage` nor `modelFramework`.
+     */
+    readonly modelImage?: pulumi.Input<string>;
+    /**
+     * Predictors of the fleet by name, each a map with the `modelDataKey` of its trained model and the `columnNames` of its features, dependent variable first. A predictor may also set `modelFramework` or `modelImage`, `instanceType` and `initialInstanceCount`, which default to the settings of the fleet.
+     */
+    readonly models: pulumi.Input<{[key: string]: pulumi.Input<{[key: string]: any}>}>;
+    /**
+     * AWS region name. If omitted, inferred from the environment.
+     */
+    readonly region?: pulumi.Input<string>;
+}
@@ -23,10 +23,22 @@ export class SagemakerPredictorLambda extends pulumi.ComponentResource {
      * Name of the provisioned SageMaker endpoint.  TODO can we just pass Endpoint type?
      */
     public /*out*/ readonly endpointName!: pulumi.Output<string | undefined>;
+    /**
+     * ARN of the Lambda alias serving provisioned concurrency, if any. Invoking the unqualified function bypasses the warm environments.
+     */
+    public /*out*/ readonly lambdaAliasArn!: pulumi.Output<string | undefined>;
     /**
      * Name of the provisioned Lambda function.  TODO can we just return the native object?
      */
     public /*out*/ readonly lambdaFunctionName!: pulumi.Output<string | undefined>;
+    /**
+     * Name of the SageMaker model behind the endpoint, which can also score offline with Batch Transform.
+     */
+    public /*out*/ readonly modelName!: pulumi.Output<string | undefined>;
+    /**
+     * URL to POST prediction requests to, if `httpEndpoint` is set.
+     */
+    public /*out*/ readonly predictorUrl!: pulumi.Output<string | undefined>;
     /**
      * ARN of the provisioned role that can be reused for model training.
      */
@@ -50,20 +62,70 @@ export class SagemakerPredictorLambda extends pulumi.ComponentResource {
                 throw new Error("Missing required property 'modelDataBucket'");
             }
             inputs["accountId"] = args ? args.accountId : undefined;
+            inputs["asyncErrorTopicArn"] = args ? args.asyncErrorTopicArn : undefined;
+            inputs["asyncInference"] = args ? args.asyncInference : undefined;
+            inputs["asyncMaxConcurrentInvocationsPerInstance"] = args ? args.asyncMaxConcurrentInvocationsPerInstance : undefined;
+            inputs["asyncSuccessTopicArn"] = args ? args.asyncSuccessTopicArn : undefined;
+            inputs["batchConcurrency"] = args ? args.batchConcurrency : undefined;
+            inputs["batchMaxBytes"] = args ? args.batchMaxBytes : undefined;
+            inputs["batchMaxRows"] = args ? args.batchMaxRows : undefined;
+            inputs["clientAccept"] = args ? args.clientAccept : undefined;
+            inputs["clientConnectTimeout"] = args ? args.clientConnectTimeout : undefined;
+            inputs["clientMaxAttempts"] = args ? args.clientMaxAttempts : undefined;
+            inputs["clientMaxPoolConnections"] = args ? args.clientMaxPoolConnections : undefined;
+            inputs["clientReadTimeout"] = args ? args.clientReadTimeout : undefined;
+            inputs["clientRetryMode"] = args ? args.clientRetryMode : undefined;
+            inputs["clientTcpKeepalive"] = args ? args.clientTcpKeepalive : undefined;
             inputs["columnNames"] = args ? args.columnNames : undefined;
+            inputs["dataCapturePercentage"] = args ? args.dataCapturePercentage : undefined;
+            inputs["httpAuthType"] = args ? args.httpAuthType : undefined;
+            inputs["httpEndpoint"] = args ? args.httpEndpoint : undefined;
             inputs["initialInstanceCount"] = args ? args.initialInstanceCount : undefined;
             inputs["instanceType"] = args ? args.instanceType : undefined;
+            inputs["lambdaArchitecture"] = args ? args.lambdaArchitecture : undefined;
+            inputs["lambdaMemorySize"] = args ? args.lambdaMemorySize : undefined;
+            inputs["lambdaRuntime"] = args ? args.lambdaRuntime : undefined;
+            inputs["lambdaSecurityGroupIds"] = args ? args.lambdaSecurityGroupIds : undefined;
+            inputs["lambdaSubnetIds"] = args ? args.lambdaSubnetIds : undefined;
+            inputs["lambdaTimeout"] = args ? args.lambdaTimeout : undefined;
+            inputs["maxInstanceCount"] = args ? args.maxInstanceCount : undefined;
+            inputs["minInstanceCount"] = args ? args.minInstanceCount : undefined;
             inputs["modelDataBucket"] = args ? args.modelDataBucket : undefined;
             inputs["modelDataKey"] = args ? args.modelDataKey : undefined;
             inputs["modelFramework"] = args ? args.modelFramework : undefined;
             inputs["modelImage"] = args ? args.modelImage : undefined;
+            inputs["multiModel"] = args ? args.multiModel : undefined;
+            inputs["predictionCacheBackend"] = args ? args.predictionCacheBackend : undefined;
+            inputs["predictionCacheSize"] = args ? args.predictionCacheSize : undefined;
+            inputs["predictionCacheTtl"] = args ? args.predictionCacheTtl : undefined;
+            inputs["predictionCacheUrl"] = args ? args.predictionCacheUrl : undefined;
+            inputs["provisionedConcurrency"] = args ? args.provisionedConcurrency : undefined;
+            inputs["provisionedConcurrencyMax"] = args ? args.provisionedConcurrencyMax : undefined;
+            inputs["provisionedConcurrencyTargetUtilization"] = args ? args.provisionedConcurrencyTargetUtilization : undefined;
             inputs["region"] = args ? args.region : undefined;
+            inputs["reservedConcurrency"] = args ? args.reservedConcurrency : undefined;
+            inputs["scaleInCooldown"] = args ? args.scaleInCooldown : undefined;
+            inputs["scaleOutCooldown"] = args ? args.scaleOutCooldown : undefined;
+            inputs["scalingCustomMetric"] = args ? args.scalingCustomMetric : undefined;
+            inputs["schemaSource"] = args ? args.schemaSource : undefined;
+            inputs["serverless"] = args ? args.serverless : undefined;
+            inputs["serverlessMaxConcurrency"] = args ? args.serverlessMaxConcurrency : undefined;
+            inputs["serverlessMemorySize"] = args ? args.serverlessMemorySize : undefined;
+            inputs["shadowVariant"] = args ? args.shadowVariant : undefined;
+            inputs["targetInvocationsPerInstance"] = args ? args.targetInvocationsPerInstance : undefined;
+            inputs["variants"] = args ? args.variants : undefined;
             inputs["endpointName"] = undefined /*out*/;
+            inputs["lambdaAliasArn"] = undefined /*out*/;
             inputs["lambdaFunctionName"] = undefined /*out*/;
+            inputs["modelName"] = undefined /*out*/;
+            inputs["predictorUrl"] = undefined /*out*/;
             inputs["trainingRoleArn"] = undefined /*out*/;
         } else {
             inputs["endpointName"] = undefined /*out*/;
+            inputs["lambdaAliasArn"] = undefined /*out*/;
             inputs["lambdaFunctionName"] = undefined /*out*/;
+            inputs["modelName"] = undefined /*out*/;
+            inputs["predictorUrl"] = undefined /*out*/;
             inputs["trainingRoleArn"] = undefined /*out*/;
         }
         if (!opts.version) {
@@ -81,10 +143,78 @@ export interface SagemakerPredictorLambdaArgs {
      * TODO
      */
     readonly accountId?: pulumi.Input<string>;
+    /**
+     * SNS topic notified when an asynchronous inference fails.
+     */
+    readonly asyncErrorTopicArn?: pulumi.Input<string>;
+    /**
+     * Whether the endpoint serves asynchronous inference. The Lambda function then stages requests under `async/<name>/` in `modelDataBucket`, where the endpoint also writes its output, and answers with job handles that are sent back to fetch the results.
+     */
+    readonly asyncInference?: pulumi.Input<boolean>;
+    /**
+     * Requests each instance of an asynchronous endpoint processes at once. Chosen by SageMaker by default.
+     */
+    readonly asyncMaxConcurrentInvocationsPerInstance?: pulumi.Input<number>;
+    /**
+     * SNS topic notified when an asynchronous inference succeeds.
+     */
+    readonly asyncSuccessTopicArn?: pulumi.Input<string>;
+    /**
+     * Number of chunks of one batch the Lambda function scores in parallel. Defaults to 4.
+     */
+    readonly batchConcurrency?: pulumi.Input<number>;
+    /**
+     * Maximum CSV payload size in bytes per endpoint call. Defaults to 5000000, under the 6 MB SageMaker limit.
+     */
+    readonly batchMaxBytes?: pulumi.Input<number>;
+    /**
+     * Maximum number of rows the Lambda function sends per endpoint call; larger batches are split into chunks. Defaults to 1000.
+     */
+    readonly batchMaxRows?: pulumi.Input<number>;
+    /**
+     * Response type the Lambda function requests from the endpoint: `text/json` (default) or `text/csv`, which is cheaper to parse.
+     */
+    readonly clientAccept?: pulumi.Input<string>;
+    /**
+     * Connect timeout in seconds of the SageMaker runtime client.
+     */
+    readonly clientConnectTimeout?: pulumi.Input<number>;
+    /**
+     * Total number of attempts, including the first, the SageMaker runtime client makes per call.
+     */
+    readonly clientMaxAttempts?: pulumi.Input<number>;
+    /**
+     * Size of the HTTP connection pool of the Lambda function's SageMaker runtime client. Defaults to the botocore default of 10.
+     */
+    readonly clientMaxPoolConnections?: pulumi.Input<number>;
+    /**
+     * Read timeout in seconds of the SageMaker runtime client.
+     */
+    readonly clientReadTimeout?: pulumi.Input<number>;
+    /**
+     * botocore retry mode of the SageMaker runtime client: `legacy`, `standard` or `adaptive`.
+     */
+    readonly clientRetryMode?: pulumi.Input<string>;
+    /**
+     * Whether the SageMaker runtime client enables TCP keepalive on its connections.
+     */
+    readonly clientTcpKeepalive?: pulumi.Input<boolean>;
     /**
      * TODO
      */
     readonly columnNames: pulumi.Input<pulumi.Input<string>[]>;
+    /**
+     * Percentage of endpoint requests, from 1 to 100, whose payloads and responses SageMaker captures as JSON Lines under `capture/<name>/` in `modelDataBucket`. Not supported by serverless endpoints. Disabled by default.
+     */
+    readonly dataCapturePercentage?: pulumi.Input<number>;
+    /**
+     * Authorization of the HTTP endpoint, `AWS_IAM` to require SigV4 signed requests or `NONE` for a public endpoint. Defaults to `AWS_IAM`.
+     */
+    readonly httpAuthType?: pulumi.Input<string>;
+    /**
+     * Exposes the Lambda function over HTTP, as `function_url` for a Lambda Function URL or `http_api` for an API Gateway HTTP API, so that clients can POST requests over reused connections instead of calling the Lambda Invoke API.
+     */
+    readonly httpEndpoint?: pulumi.Input<string>;
     /**
      * TODO
      */
@@ -93,6 +223,38 @@ export interface SagemakerPredictorLambdaArgs {
      * TODO
      */
     readonly instanceType?: pulumi.Input<string>;
+    /**
+     * Instruction set of the Lambda function: `x86_64` (default) or `arm64` for Graviton.
+     */
+    readonly lambdaArchitecture?: pulumi.Input<string>;
+    /**
+     * Memory of the Lambda function in MB, which also scales its CPU. Defaults to 128.
+     */
+    readonly lambdaMemorySize?: pulumi.Input<number>;
+    /**
+     * Python runtime of the Lambda function. Defaults to `python3.8`.
+     */
+    readonly lambdaRuntime?: pulumi.Input<string>;
+    /**
+     * Security groups of the Lambda function when it runs in a VPC.
+     */
+    readonly lambdaSecurityGroupIds?: pulumi.Input<pulumi.Input<string>[]>;
+    /**
+     * VPC subnets to run the Lambda function in, for example to reach an ElastiCache prediction cache. The subnets then need a route to S3 and the SageMaker runtime.
+     */
+    readonly lambdaSubnetIds?: pulumi.Input<pulumi.Input<string>[]>;
+    /**
+     * Timeout of the Lambda function in seconds. Defaults to 30.
+     */
+    readonly lambdaTimeout?: pulumi.Input<number>;
+    /**
+     * When set, Application Auto Scaling scales the endpoint's `AllTraffic` variant between `minInstanceCount` and this many instances.
+     */
+    readonly maxInstanceCount?: pulumi.Input<number>;
+    /**
+     * Fewest instances the endpoint scales in to. Defaults to `initialInstanceCount`.
+     */
+    readonly minInstanceCount?: pulumi.Input<number>;
     /**
      * TODO
      */
@@ -109,8 +271,84 @@ export interface SagemakerPredictorLambdaArgs {
      * TODO
      */
     readonly modelImage?: pulumi.Input<string>;
+    /**
+     * Whether the endpoint is a multi-model endpoint serving every model artifact under the `modelDataKey` prefix. Requests name their model with `targetModel`, and a `<key>.json` object next to an artifact overrides `columnNames` for that model.
+     */
+    readonly multiModel?: pulumi.Input<boolean>;
+    /**
+     * Where the Lambda function caches scores: `memory` (default), an LRU per container, or `redis`, a server shared by all containers.
+     */
+    readonly predictionCacheBackend?: pulumi.Input<string>;
+    /**
+     * Maximum number of encoded feature rows whose scores the Lambda function caches in memory. Defaults to 0, which disables the cache.
+     */
+    readonly predictionCacheSize?: pulumi.Input<number>;
+    /**
+     * Seconds a cached score stays valid. Defaults to 0, keeping scores until they are evicted.
+     */
+    readonly predictionCacheTtl?: pulumi.Input<number>;
+    /**
+     * URL of the Redis server for the `redis` prediction cache, such as `redis://host:6379/0`, or `rediss://` for TLS.
+     */
+    readonly predictionCacheUrl?: pulumi.Input<string>;
+    /**
+     * Number of pre-initialized execution environments kept warm for the Lambda function. When set, a version is published and the `live` alias serving it is given this provisioned concurrency.
+     */
+    readonly provisionedConcurrency?: pulumi.Input<number>;
+    /**
+     * When set, Application Auto Scaling tracks provisioned concurrency utilization and scales between `provisionedConcurrency` and this maximum.
+     */
+    readonly provisionedConcurrencyMax?: pulumi.Input<number>;
+    /**
+     * Provisioned concurrency utilization the scaling policy aims for. Defaults to 0.7.
+     */
+    readonly provisionedConcurrencyTargetUtilization?: pulumi.Input<number>;
     /**
      * TODO
      */
     readonly region?: pulumi.Input<string>;
+    /**
+     * Concurrent executions reserved for the Lambda function, which also caps its concurrency. Unreserved by default.
+     */
+    readonly reservedConcurrency?: pulumi.Input<number>;
+    /**
+     * Seconds after a scale-in before the endpoint scales in again. Defaults to 300.
+     */
+    readonly scaleInCooldown?: pulumi.Input<number>;
+    /**
+     * Seconds after a scale-out before the endpoint scales out again. Defaults to 60.
+     */
+    readonly scaleOutCooldown?: pulumi.Input<number>;
+    /**
+     * CloudWatch metric to track instead of invocations per instance, given as `metricName`, `namespace`, `statistic`, optional `unit` and `dimensions` (a map of dimension names to values) and the `targetValue` to aim for.
+     */
+    readonly scalingCustomMetric?: pulumi.Input<{[key: string]: any}>;
+    /**
+     * Where the Lambda function reads the feature schema from: `s3` (the default) stores it as an object in modelDataBucket, `archive` bundles it as schema.json with the function code and `environment` passes it in the SCHEMA_JSON variable. The latter two avoid an S3 request on every cold start.
+     */
+    readonly schemaSource?: pulumi.Input<string>;
+    /**
+     * Whether the endpoint uses SageMaker Serverless Inference instead of dedicated instances, scaling to zero when idle. Serverless endpoints take no instance type, count or autoscaling options and are not encrypted with the component's KMS key.
+     */
+    readonly serverless?: pulumi.Input<boolean>;
+    /**
+     * Concurrent invocations a serverless endpoint serves before throttling. Defaults to 20.
+     */
+    readonly serverlessMaxConcurrency?: pulumi.Input<number>;
+    /**
+     * Memory of a serverless endpoint in MB, from 1024 to 6144 in 1024 MB steps. Defaults to 2048.
+     */
+    readonly serverlessMemorySize?: pulumi.Input<number>;
+    /**
+     * Variant that is sent a copy of production requests, given in the same form as `variants`, whose responses SageMaker only logs. Its weight relative to the production variants sets the share of requests it receives.
+     */
+    readonly shadowVariant?: pulumi.Input<{[key: string]: any}>;
+    /**
+     * Invocations per instance per minute the scaling policy aims for. Defaults to 70.
+     */
+    readonly targetInvocationsPerInstance?: pulumi.Input<number>;
+    /**
+     * Production variants to split traffic between, each a map with a `name` and optional `modelDataKey`, `instanceType`, `initialInstanceCount` and `weight`, which default to the settings of the component and a weight of 1. Defaults to a single `AllTraffic` variant.
+     */
+    readonly variants?: pulumi.Input<pulumi.Input<{[key: string]: any}>[]>;
 }
@@ -4,6 +4,7 @@
 
 # Export this package's modules as members:
 from .provider import *
+from .sagemaker_predictor_fleet import *
 from .sagemaker_predictor_lambda import *
 
 def _register_module():
@@ -18,7 +19,9 @@ def _register_module():
             return Module._version
 
         def construct(self, name: str, typ: str, urn: str) -> pulumi.Resource:
-            if typ == "sagemakerlambda:index:SagemakerPredictorLambda":
+            if typ == "sagemakerlambda:index:SagemakerPredictorFleet":
+                return SagemakerPredictorFleet(name, pulumi.ResourceOptions(urn=urn))
+            elif typ == "sagemakerlambda:index:SagemakerPredictorLambda":
                 return SagemakerPredictorLambda(name, pulumi.ResourceOptions(urn=urn))
             else:
                 raise Exception(f"unknown resource type {typ}")
@@ -0,0 +1,324 @@
+# coding=utf-8
+# *** WARNING: this file was generated by Pulumi SDK Generator. ***
+# *** Do not edit by hand unless you're certain you know what you are doing! ***
+
+import warnings
+import pulumi
+import pulumi.runtime
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+from . import _utilities
+
+__all__ = ['SagemakerPredictorFleetArgs', 'SagemakerPredictorFleet']
+
+@pulumi.input_type
+class SagemakerPredictorFleetArgs:
+    def __init__(__self__, *,
+                 model_data_bucket: pulumi.Input[str],
+                 models: pulumi.Input[Mapping[str, pulumi.Input[Mapping[str, Any]]]],
+                 account_id: Optional[pulumi.Input[str]] = None,
+                 initial_instance_count: Optional[pulumi.Input[int]] = None,
+                 instance_type: Optional[pulumi.Input[str]] = None,
+                 lambda_memory_size: Optional[pulumi.Input[int]] = None,
+                 lambda_runtime: Optional[pulumi.Input[str]] = None,
+                 lambda_timeout: Optional[pulumi.Input[int]] = None,
+                 model_framework: Optional[pulumi.Input[str]] = None,
+                 model_image: Optional[pulumi.Input[str]] = None,
+                 region: Optional[pulumi.Input[str]] = None):
+        """
+        The set of arguments for constructing a SagemakerPredictorFleet resource.
+        :param pulumi.Input[str] model_data_bucket: ID of a bucket where trained model data is stored.
+        :param pulumi.Input[Mapping[str, pulumi.Input[Mapping[str, Any]]]] models: Predictors of the fleet by name, each a map with the `modelDataKey` of its trained model and the `columnNames` of its features, dependent variable first. A predictor may also set `modelFramework` or `modelImage`, `instanceType` and `initialInstanceCount`, which default to the settings of the fleet.
+        :param pulumi.Input[str] account_id: AWS account ID. If omitted, the account of the AWS provider's credentials.
+        :param pulumi.Input[int] initial_instance_count: Initial number of instances of each endpoint. Defaults to 1.
+        :param pulumi.Input[str] instance_type: Type of instance of each endpoint. Defaults to the smallest instance.
+        :param pulumi.Input[int] lambda_memory_size: Memory of the shared Lambda function in MB. Defaults to 128.
+        :param pulumi.Input[str] lambda_runtime: Python runtime of the shared Lambda function. Defaults to `python3.8`.
+        :param pulumi.Input[int] lambda_timeout: Timeout of the shared Lambda function in seconds. Defaults to 30.
+        :param pulumi.Input[str] model_framework: Built-in SageMaker framework such as `linear-learner` serving the predictors that set neither `modelImage` nor `modelFramework`.
+        :param pulumi.Input[str] model_image: Custom Docker image serving the predictors that set neither `modelImage` nor `modelFramework`.
+        :param pulumi.Input[str] region: AWS region name. If omitted, inferred from the environment.
+        """
+        pulumi.set(__self__, "model_data_bucket", model_data_bucket)
+        pulumi.set(__self__, "models", models)
+        if account_id is not None:
+            pulumi.set(__self__, "account_id", account_id)
+        if initial_instance_count is not None:
+            pulumi.set(__self__, "initial_instance_count", initial_instance_count)
+        if instance_type is not None:
+            pulumi.set(__self__, "instance_type", instance_type)
+        if lambda_memory_size is not None:
+            pulumi.set(__self__, "lambda_memory_size", lambda_memory_size)
+        if lambda_runtime is not None:
+            pulumi.set(__self__, "lambda_runtime", lambda_runtime)
+        if lambda_timeout is not None:
+            pulumi.set(__self__, "lambda_timeout", lambda_timeout)
+        if model_framework is not None:
+            pulumi.set(__self__, "model_framework", model_framework)
+        if model_image is not None:
+            pulumi.set(__self__, "model_image", model_image)
+        if region is not None:
+            pulumi.set(__self__, "region", region)
+
+    @property
+    @pulumi.getter(name="modelDataBucket")
+    def model_data_bucket(self) -> pulumi.Input[str]:
+        """
+        ID of a bucket where trained model data is stored.
+        """
+        return pulumi.get(self, "model_data_bucket")
+
+    @model_data_bucket.setter
+    def model_data_bucket(self, value: pulumi.Input[str]):
+        pulumi.set(self, "model_data_bucket", value)
+
+    @property
+    @pulumi.getter
+    def models(self) -> pulumi.Input[Mapping[str, pulumi.Input[Mapping[str, Any]]]]:
+        """
+        Predictors of the fleet by name, each a map with the `modelDataKey` of its trained model and the `columnNames` of its features, dependent variable first. A predictor may also set `modelFramework` or `modelImage`, `instanceType` and `initialInstanceCount`, which default to the settings of the fleet.
+        """
+        return pulumi.get(self, "models")
+
+    @models.setter
+    def models(self, value: pulumi.Input[Mapping[str, pulumi.Input[Mapping[str, Any]]]]):
+        pulumi.set(self, "models", value)
+
+    @property
+    @pulumi.getter(name="accountId")
+    def account_id(self) -> Optional[pulumi.Input[str]]:
+        """
+        AWS account ID. If omitted, the account of the AWS provider's credentials.
+        """
+        return pulumi.get(self, "account_id")
+
+    @account_id.setter
+    def account_id(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "account_id", value)
+
+    @property
+    @pulumi.getter(name="initialInstanceCount")
+    def initial_instance_count(self) -> Optional[pulumi.Input[int]]:
+        """
+        Initial number of instances of each endpoint. Defaults to 1.
+        """
+        return pulumi.get(self, "initial_instance_count")
+
+    @initial_instance_count.setter
+    def initial_instance_count(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "initial_instance_count", value)
+
+    @property
+    @pulumi.getter(name="instanceType")
+    def instance_type(self) -> Optional[pulumi.Input[str]]:
+        """
+        Type of instance of each endpoint. Defaults to the smallest instance.
+        """
+        return pulumi.get(self, "instance_type")
+
+    @instance_type.setter
+    def instance_type(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "instance_type", value)
+
+    @property
+    @pulumi.getter(name="lambdaMemorySize")
+    def lambda_memory_size(self) -> Optional[pulumi.Input[int]]:
+        """
+        Memory of the shared Lambda function in MB. Defaults to 128.
+        """
+        return pulumi.get(self, "lambda_memory_size")
+
+    @lambda_memory_size.setter
+    def lambda_memory_size(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "lambda_memory_size", value)
+
+    @property
+    @pulumi.getter(name="lambdaRuntime")
+    def lambda_runtime(self) -> Optional[pulumi.Input[str]]:
+        """
+        Python runtime of the shared Lambda function. Defaults to `python3.8`.
+        """
+        return pulumi.get(self, "lambda_runtime")
+
+    @lambda_runtime.setter
+    def lambda_runtime(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "lambda_runtime", value)
+
+    @property
+    @pulumi.getter(name="lambdaTimeout")
+    def lambda_timeout(self) -> Optional[pulumi.Input[int]]:
+        """
+        Timeout of the shared Lambda function in seconds. Defaults to 30.
+        """
+        return pulumi.get(self, "lambda_timeout")
+
+    @lambda_timeout.setter
+    def lambda_timeout(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "lambda_timeout", value)
+
+    @property
+    @pulumi.getter(name="modelFramework")
+    def model_framework(self) -> Optional[pulumi.Input[str]]:
+        """
+        Built-in SageMaker framework such as `linear-learner` serving the predictors that set neither `modelImage` nor `modelFramework`.
+        """
+        return pulumi.get(self, "model_framework")
+
+    @model_framework.setter
+    def model_framework(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "model_framework", value)
+
+    @property
+    @pulumi.getter(name="modelImage")
+    def model_image(self) -> Optional[pulumi.Input[str]]:
+        """
+        Custom Docker image serving the predictors that set neither `modelImage` nor `modelFramework`.
+        """
+        return pulumi.get(self, "model_image")
+
+    @model_image.setter
+    def model_image(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "model_image", value)
+
+    @property
+    @pulumi.getter
+    def region(self) -> Optional[pulumi.Input[str]]:
+        """
+        AWS region name. If omitted, inferred from the environment.
+        """
+        return pulumi.get(self, "region")
+
+    @region.setter
+    def region(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "region", value)
+
+
+class SagemakerPredictorFleet(pulumi.ComponentResource):
+    @overload
+    def __init__(__self__,
+                 resource_name: str,
+                 opts: Optional[pulumi.ResourceOptions] = None,
+                 account_id: Optional[pulumi.Input[str]] = None,
+                 initial_instance_count: Optional[pulumi.Input[int]] = None,
+                 instance_type: Optional[pulumi.Input[str]] = None,
+                 lambda_memory_size: Optional[pulumi.Input[int]] = None,
+                 lambda_runtime: Optional[pulumi.Input[str]] = None,
+                 lambda_timeout: Optional[pulumi.Input[int]] = None,
+                 model_data_bucket: Optional[pulumi.Input[str]] = None,
+                 model_framework: Optional[pulumi.Input[str]] = None,
+                 model_image: Optional[pulumi.Input[str]] = None,
+                 models: Optional[pulumi.Input[Mapping[str, pulumi.Input[Mapping[str, Any]]]]] = None,
+                 region: Optional[pulumi.Input[str]] = None,
+                 __props__=None):
+        """
+        Create a SagemakerPredictorFleet resource with the given unique name, props, and options.
+        :param str resource_name: The name of the resource.
+        :param pulumi.ResourceOptions opts: Options for the resource.
+        :param pulumi.Input[str] account_id: AWS account ID. If omitted, the account of the AWS provider's credentials.
+        :param pulumi.Input[int] initial_instance_count: Initial number of instances of each endpoint. Defaults to 1.
+        :param pulumi.Input[str] instance_type: Type of instance of each endpoint. Defaults to the smallest instance.
+        :param pulumi.Input[int] lambda_memory_size: Memory of the shared Lambda function in MB. Defaults to 128.
+        :param pulumi.Input[str] lambda_runtime: Python runtime of the shared Lambda function. Defaults to `python3.8`.
+        :param pulumi.Input[int] lambda_timeout: Timeout of the shared Lambda function in seconds. Defaults to 30.
+        :param pulumi.Input[str] model_data_bucket: ID of a bucket where trained model data is stored.
+        :param pulumi.Input[str] model_framework: Built-in SageMaker framework such as `linear-learner` serving the predictors that set neither `modelImage` nor `modelFramework`.
+        :param pulumi.Input[str] model_image: Custom Docker image serving the predictors that set neither `modelImage` nor `modelFramework`.
+        :param pulumi.Input[Mapping[str, pulumi.Input[Mapping[str, Any]]]] models: Predictors of the fleet by name, each a map with the `modelDataKey` of its trained model and the `columnNames` of its features, dependent variable first. A predictor may also set `modelFramework` or `modelImage`, `instanceType` and `initialInstanceCount`, which default to the settings of the fleet.
+        :param pulumi.Input[str] region: AWS region name. If omitted, inferred from the environment.
+        """
+        ...
+    @overload
+    def __init__(__self__,
+                 resource_name: str,
+                 args: SagemakerPredictorFleetArgs,
+                 opts: Optional[pulumi.ResourceOptions] = None):
+        """
+        Create a SagemakerPredictorFleet resource with the given unique name, props, and options.
+        :param str resource_name: The name of the resource.
+        :param SagemakerPredictorFleetArgs args: The arguments to use to populate this resource's properties.
+        :param pulumi.ResourceOptions opts: Options for the resource.
+        """
+        ...
+    def __init__(__self__, resource_name: str, *args, **kwargs):
+        resource_args, opts = _utilities.get_resource_args_opts(SagemakerPredictorFleetArgs, pulumi.ResourceOptions, *args, **kwargs)
+        if resource_args is not None:
+            __self__._internal_init(resource_name, opts, **resource_args.__dict__)
+        else:
+            __self__._internal_init(resource_name, *args, **kwargs)
+
+    def _internal_init(__self__,
+                 resource_name: str,
+                 opts: Optional[pulumi.ResourceOptions] = None,
+                 account_id: Optional[pulumi.Input[str]] = None,
+                 initial_instance_count: Optional[pulumi.Input[int]] = None,
+                 instance_type: Optional[pulumi.Input[str]] = None,
+                 lambda_memory_size: Optional[pulumi.Input[int]] = None,
+                 lambda_runtime: Optional[pulumi.Input[str]] = None,
+                 lambda_timeout: Optional[pulumi.Input[int]] = None,
+                 model_data_bucket: Optional[pulumi.Input[str]] = None,
+                 model_framework: Optional[pulumi.Input[str]] = None,
+                 model_image: Optional[pulumi.Input[str]] = None,
+                 models: Optional[pulumi.Input[Mapping[str, pulumi.Input[Mapping[str, Any]]]]] = None,
+                 region: Optional[pulumi.Input[str]] = None,
+                 __props__=None):
+        if opts is None:
+            opts = pulumi.ResourceOptions()
+        if not isinstance(opts, pulumi.ResourceOptions):
+            raise TypeError('Expected resource options to be a ResourceOptions instance')
+        if opts.version is None:
+            opts.version = _utilities.get_version()
+        if opts.id is not None:
+            raise ValueError('ComponentResource classes do not support opts.id')
+        else:
+            if __props__ is not None:
+                raise TypeError('__props__ is only valid when passed in combination with a valid opts.id to get an existing resource')
+            __props__ = SagemakerPredictorFleetArgs.__new__(SagemakerPredictorFleetArgs)
+
+            __props__.__dict__["account_id"] = account_id
+            __props__.__dict__["initial_instance_count"] = initial_instance_count
+            __props__.__dict__["instance_type"] = instance_type
+            __props__.__dict__["lambda_memory_size"] = lambda_memory_size
+            __props__.__dict__["lambda_runtime"] = lambda_runtime
+            __props__.__dict__["lambda_timeout"] = lambda_timeout
+            if model_data_bucket is None and not opts.urn:
+                raise TypeError("Missing required property 'model_data_bucket'")
+            __props__.__dict__["model_data_bucket"] = model_data_bucket
+            __props__.__dict__["model_framework"] = model_framework
+            __props__.__dict__["model_image"] = model_image
+            if models is None and not opts.urn:
+                raise TypeError("Missing required property 'models'")
+            __props__.__dict__["models"] = models
+            __props__.__dict__["region"] = region
+            __props__.__dict__["endpoint_names"] = None
+            __props__.__dict__["lambda_function_name"] = None
+            __props__.__dict__["training_role_arn"] = None
+        super(SagemakerPredictorFleet, __self__).__init__(
+            'sagemakerlambda:index:SagemakerPredictorFleet',
+            resource_name,
+            __props__,
+            opts,
+            remote=True)
+
+    @property
+    @pulumi.getter(name="endpointNames")
+    def endpoint_names(self) -> pulumi.Output[Mapping[str, str]]:
+        """
+        Names of the SageMaker endpoints by predictor.
+        """
+        return pulumi.get(self, "endpoint_names")
+
+    @property
+    @pulumi.getter(name="lambdaFunctionName")
+    def lambda_function_name(self) -> pulumi.Output[str]:
+        """
+        Name of the Lambda function serving every predictor.
+        """
+        return pulumi.get(self, "lambda_function_name")
+
+    @property
+    @pulumi.getter(name="trainingRoleArn")
+    def training_role_arn(self) -> pulumi.Output[str]:
+        """
+        ARN of the provisioned role that can be reused for model training.
+        """
+        return pulumi.get(self, "training_role_arn")
+
@@ -16,40 +16,216 @@ class SagemakerPredictorLambdaArgs:
                  column_names: pulumi.Input[Sequence[pulumi.Input[str]]],
                  model_data_bucket: pulumi.Input[str],
                  account_id: Optional[pulumi.Input[str]] = None,
+                 async_error_topic_arn: Optional[pulumi.Input[str]] = None,
+                 async_inference: Optional[pulumi.Input[bool]] = None,
+                 async_max_concurrent_invocations_per_instance: Optional[pulumi.Input[int]] = None,
+                 async_success_topic_arn: Optional[pulumi.Input[str]] = None,
+                 batch_concurrency: Optional[pulumi.Input[int]] = None,
+                 batch_max_bytes: Optional[pulumi.Input[int]] = None,
+                 batch_max_rows: Optional[pulumi.Input[int]] = None,
+                 client_accept: Optional[pulumi.Input[str]] = None,
+                 client_connect_timeout: Optional[pulumi.Input[float]] = None,
+                 client_max_attempts: Optional[pulumi.Input[int]] = None,
+                 client_max_pool_connections: Optional[pulumi.Input[int]] = None,
+                 client_read_timeout: Optional[pulumi.Input[float]] = None,
+                 client_retry_mode: Optional[pulumi.Input[str]] = None,
+                 client_tcp_keepalive: Optional[pulumi.Input[bool]] = None,
+                 data_capture_percentage: Optional[pulumi.Input[int]] = None,
+                 http_auth_type: Optional[pulumi.Input[str]] = None,
+                 http_endpoint: Optional[pulumi.Input[str]] = None,
                  initial_instance_count: Optional[pulumi.Input[int]] = None,
                  instance_type: Optional[pulumi.Input[str]] = None,
+                 lambda_architecture: Optional[pulumi.Input[str]] = None,
+                 lambda_memory_size: Optional[pulumi.Input[int]] = None,
+                 lambda_runtime: Optional[pulumi.Input[str]] = None,
+                 lambda_security_group_ids: Optional[pulumi.Input[Sequence[pulumi.Input[str]]]] = None,
+                 lambda_subnet_ids: Optional[pulumi.Input[Sequence[pulumi.Input[str]]]] = None,
+                 lambda_timeout: Optional[pulumi.Input[int]] = None,
+                 max_instance_count: Optional[pulumi.Input[int]] = None,
+                 min_instance_count: Optional[pulumi.Input[int]] = None,
                  model_data_key: Optional[pulumi.Input[str]] = None,
                  model_framework: Optional[pulumi.Input[str]] = None,
                  model_image: Optional[pulumi.Input[str]] = None,
-                 region: Optional[pulumi.Input[str]] = None):
+                 multi_model: Optional[pulumi.Input[bool]] = None,
+                 prediction_cache_backend: Optional[pulumi.Input[str]] = None,
+                 prediction_cache_size: Optional[pulumi.Input[int]] = None,
+                 prediction_cache_ttl: Optional[pulumi.Input[float]] = None,
+                 prediction_cache_url: Optional[pulumi.Input[str]] = None,
+                 provisioned_concurrency: Optional[pulumi.Input[int]] = None,
+                 provisioned_concurrency_max: Optional[pulumi.Input[int]] = None,
+                 provisioned_concurrency_target_utilization: Optional[pulumi.Input[float]] = None,
+                 region: Optional[pulumi.Input[str]] = None,
+                 reserved_concurrency: Optional[pulumi.Input[int]] = None,
+                 scale_in_cooldown: Optional[pulumi.Input[int]] = None,
+                 scale_out_cooldown: Optional[pulumi.Input[int]] = None,
+                 scaling_custom_metric: Optional[pulumi.Input[Mapping[str, Any]]] = None,
+                 schema_source: Optional[pulumi.Input[str]] = None,
+                 serverless: Optional[pulumi.Input[bool]] = None,
+                 serverless_max_concurrency: Optional[pulumi.Input[int]] = None,
+                 serverless_memory_size: Optional[pulumi.Input[int]] = None,
+                 shadow_variant: Optional[pulumi.Input[Mapping[str, Any]]] = None,
+                 target_invocations_per_instance: Optional[pulumi.Input[float]] = None,
+                 variants: Optional[pulumi.Input[Sequence[pulumi.Input[Mapping[str, Any]]]]] = None):
         """
         The set of arguments for constructing a SagemakerPredictorLambda resource.
         :param pulumi.Input[Sequence[pulumi.Input[str]]] column_names: TODO
         :param pulumi.Input[str] model_data_bucket: TODO
         :param pulumi.Input[str] account_id: TODO
+        :param pulumi.Input[str] async_error_topic_arn: SNS topic notified when an asynchronous inference fails.
+        :param pulumi.Input[bool] async_inference: Whether the endpoint serves asynchronous inference. The Lambda function then stages requests under `async/<name>/` in `modelDataBucket`, where the endpoint also writes its output, and answers with job handles that are sent back to fetch the results.
+        :param pulumi.Input[int] async_max_concurrent_invocations_per_instance: Requests each instance of an asynchronous endpoint processes at once. Chosen by SageMaker by default.
+        :param pulumi.Input[str] async_success_topic_arn: SNS topic notified when an asynchronous inference succeeds.
+        :param pulumi.Input[int] batch_concurrency: Number of chunks of one batch the Lambda function scores in parallel. Defaults to 4.
+        :param pulumi.Input[int] batch_max_bytes: Maximum CSV payload size in bytes per endpoint call. Defaults to 5000000, under the 6 MB SageMaker limit.
+        :param pulumi.Input[int] batch_max_rows: Maximum number of rows the Lambda function sends per endpoint call; larger batches are split into chunks. Defaults to 1000.
+        :param pulumi.Input[str] client_accept: Response type the Lambda function requests from the endpoint: `text/json` (default) or `text/csv`, which is cheaper to parse.
+        :param pulumi.Input[float] client_connect_timeout: Connect timeout in seconds of the SageMaker runtime client.
+        :param pulumi.Input[int] client_max_attempts: Total number of attempts, including the first, the SageMaker runtime client makes per call.
+        :param pulumi.Input[int] client_max_pool_connections: Size of the HTTP connection pool of the Lambda function's SageMaker runtime client. Defaults to the botocore default of 10.
+        :param pulumi.Input[float] client_read_timeout: Read timeout in seconds of the SageMaker runtime client.
+        :param pulumi.Input[str] client_retry_mode: botocore retry mode of the SageMaker runtime client: `legacy`, `standard` or `adaptive`.
+        :param pulumi.Input[bool] client_tcp_keepalive: Whether the SageMaker runtime client enables TCP keepalive on its connections.
+        :param pulumi.Input[int] data_capture_percentage: Percentage of endpoint requests, from 1 to 100, whose payloads and responses SageMaker captures as JSON Lines under `capture/<name>/` in `modelDataBucket`. Not supported by serverless endpoints. Disabled by default.
+        :param pulumi.Input[str] http_auth_type: Authorization of the HTTP endpoint, `AWS_IAM` to require SigV4 signed requests or `NONE` for a public endpoint. Defaults to `AWS_IAM`.
+        :param pulumi.Input[str] http_endpoint: Exposes the Lambda function over HTTP, as `function_url` for a Lambda Function URL or `http_api` for an API Gateway HTTP API, so that clients can POST requests over reused connections instead of calling the Lambda Invoke API.
         :param pulumi.Input[int] initial_instance_count: TODO
         :param pulumi.Input[str] instance_type: TODO
+        :param pulumi.Input[str] lambda_architecture: Instruction set of the Lambda function: `x86_64` (default) or `arm64` for Graviton.
+        :param pulumi.Input[int] lambda_memory_size: Memory of the Lambda function in MB, which also scales its CPU. Defaults to 128.
+        :param pulumi.Input[str] lambda_runtime: Python runtime of the Lambda function. Defaults to `python3.8`.
+        :param pulumi.Input[Sequence[pulumi.Input[str]]] lambda_security_group_ids: Security groups of the Lambda function when it runs in a VPC.
+        :param pulumi.Input[Sequence[pulumi.Input[str]]] lambda_subnet_ids: VPC subnets to run the Lambda function in, for example to reach an ElastiCache prediction cache. The subnets then need a route to S3 and the SageMaker runtime.
+        :param pulumi.Input[int] lambda_timeout: Timeout of the Lambda function in seconds. Defaults to 30.
+        :param pulumi.Input[int] max_instance_count: When set, Application Auto Scaling scales the endpoint's `AllTraffic` variant between `minInstanceCount` and this many instances.
+        :param pulumi.Input[int] min_instance_count: Fewest instances the endpoint scales in to. Defaults to `initialInstanceCount`.
         :param pulumi.Input[str] model_data_key: TODO
         :param pulumi.Input[str] model_framework: TODO
         :param pulumi.Input[str] model_image: TODO
+        :param pulumi.Input[bool] multi_model: Whether the endpoint is a multi-model endpoint serving every model artifact under the `modelDataKey` prefix. Requests name their model with `targetModel`, and a `<key>.json` object next to an artifact overrides `columnNames` for that model.
+        :param pulumi.Input[str] prediction_cache_backend: Where the Lambda function caches scores: `memory` (default), an LRU per container, or `redis`, a server shared by all containers.
+        :param pulumi.Input[int] prediction_cache_size: Maximum number of encoded feature rows whose scores the Lambda function caches in memory. Defaults to 0, which disables the cache.
+        :param pulumi.Input[float] prediction_cache_ttl: Seconds a cached score stays valid. Defaults to 0, keeping scores until they are evicted.
+        :param pulumi.Input[str] prediction_cache_url: URL of the Redis server for the `redis` prediction cache, such as `redis://host:6379/0`, or `rediss://` for TLS.
+        :param pulumi.Input[int] provisioned_concurrency: Number of pre-initialized execution environments kept warm for the Lambda function. When set, a version is published and the `live` alias serving it is given this provisioned concurrency.
+        :param pulumi.Input[int] provisioned_concurrency_max: When set, Application Auto Scaling tracks provisioned concurrency utilization and scales between `provisionedConcurrency` and this maximum.
+        :param pulumi.Input[float] provisioned_concurrency_target_utilization: Provisioned concurrency utilization the scaling policy aims for. Defaults to 0.7.
         :param pulumi.Input[str] region: TODO
+        :param pulumi.Input[int] reserved_concurrency: Concurrent executions reserved for the Lambda function, which also caps its concurrency. Unreserved by default.
+        :param pulumi.Input[int] scale_in_cooldown: Seconds after a scale-in before the endpoint scales in again. Defaults to 300.
+        :param pulumi.Input[int] scale_out_cooldown: Seconds after a scale-out before the endpoint scales out again. Defaults to 60.
+        :param pulumi.Input[Mapping[str, Any]] scaling_custom_metric: CloudWatch metric to track instead of invocations per instance, given as `metricName`, `namespace`, `statistic`, optional `unit` and `dimensions` (a map of dimension names to values) and the `targetValue` to aim for.
+        :param pulumi.Input[str] schema_source: Where the Lambda function reads the feature schema from: `s3` (the default) stores it as an object in modelDataBucket, `archive` bundles it as schema.json with the function code and `environment` passes it in the SCHEMA_JSON variable. The latter two avoid an S3 request on every cold start.
+        :param pulumi.Input[bool] serverless: Whether the endpoint uses SageMaker Serverless Inference instead of dedicated instances, scaling to zero when idle. Serverless endpoints take no instance type, count or autoscaling options and are not encrypted with the component's KMS key.
+        :param pulumi.Input[int] serverless_max_concurrency: Concurrent invocations a serverless endpoint serves before throttling. Defaults to 20.
+        :param pulumi.Input[int] serverless_memory_size: Memory of a serverless endpoint in MB, from 1024 to 6144 in 1024 MB steps. Defaults to 2048.
+        :param pulumi.Input[Mapping[str, Any]] shadow_variant: Variant that is sent a copy of production requests, given in the same form as `variants`, whose responses SageMaker only logs. Its weight relative to the production variants sets the share of requests it receives.
+        :param pulumi.Input[float] target_invocations_per_instance: Invocations per instance per minute the scaling policy aims for. Defaults to 70.
+        :param pulumi.Input[Sequence[pulumi.Input[Mapping[str, Any]]]] variants: Production variants to split traffic between, each a map with a `name` and optional `modelDataKey`, `instanceType`, `initialInstanceCount` and `weight`, which default to the settings of the component and a weight of 1. Defaults to a single `AllTraffic` variant.
         """
         pulumi.set(__self__, "column_names", column_names)
         pulumi.set(__self__, "model_data_bucket", model_data_bucket)
         if account_id is not None:
             pulumi.set(__self__, "account_id", account_id)
+        if async_error_topic_arn is not None:
+            pulumi.set(__self__, "async_error_topic_arn", async_error_topic_arn)
+        if async_inference is not None:
+            pulumi.set(__self__, "async_inference", async_inference)
+        if async_max_concurrent_invocations_per_instance is not None:
+            pulumi.set(__self__, "async_max_concurrent_invocations_per_instance", async_max_concurrent_invocations_per_instance)
+        if async_success_topic_arn is not None:
+            pulumi.set(__self__, "async_success_topic_arn", async_success_topic_arn)
+        if batch_concurrency is not None:
+            pulumi.set(__self__, "batch_concurrency", batch_concurrency)
+        if batch_max_bytes is not None:
+            pulumi.set(__self__, "batch_max_bytes", batch_max_bytes)
+        if batch_max_rows is not None:
+            pulumi.set(__self__, "batch_max_rows", batch_max_rows)
+        if client_accept is not None:
+            pulumi.set(__self__, "client_accept", client_accept)
+        if client_connect_timeout is not None:
+            pulumi.set(__self__, "client_connect_timeout", client_connect_timeout)
+        if client_max_attempts is not None:
+            pulumi.set(__self__, "client_max_attempts", client_max_attempts)
+        if client_max_pool_connections is not None:
+            pulumi.set(__self__, "client_max_pool_connections", client_max_pool_connections)
+        if client_read_timeout is not None:
+            pulumi.set(__self__, "client_read_timeout", client_read_timeout)
+        if client_retry_mode is not None:
+            pulumi.set(__self__, "client_retry_mode", client_retry_mode)
+        if client_tcp_keepalive is not None:
+            pulumi.set(__self__, "client_tcp_keepalive", client_tcp_keepalive)
+        if data_capture_percentage is not None:
+            pulumi.set(__self__, "data_capture_percentage", data_capture_percentage)
+        if http_auth_type is not None:
+            pulumi.set(__self__, "http_auth_type", http_auth_type)
+        if http_endpoint is not None:
+            pulumi.set(__self__, "http_endpoint", http_endpoint)
         if initial_instance_count is not None:
             pulumi.set(__self__, "initial_instance_count", initial_instance_count)
         if instance_type is not None:
             pulumi.set(__self__, "instance_type", instance_type)
+        if lambda_architecture is not None:
+            pulumi.set(__self__, "lambda_architecture", lambda_architecture)
+        if lambda_memory_size is not None:
+            pulumi.set(__self__, "lambda_memory_size", lambda_memory_size)
+        if lambda_runtime is not None:
+            pulumi.set(__self__, "lambda_runtime", lambda_runtime)
+        if lambda_security_group_ids is not None:
+            pulumi.set(__self__, "lambda_security_group_ids", lambda_security_group_ids)
+        if lambda_subnet_ids is not None:
+            pulumi.set(__self__, "lambda_subnet_ids", lambda_subnet_ids)
+        if lambda_timeout is not None:
+            pulumi.set(__self__, "lambda_timeout", lambda_timeout)
+        if max_instance_count is not None:
+            pulumi.set(__self__, "max_instance_count", max_instance_count)
+        if min_instance_count is not None:
+            pulumi.set(__self__, "min_instance_count", min_instance_count)
         if model_data_key is not None:
             pulumi.set(__self__, "model_data_key", model_data_key)
         if model_framework is not None:
             pulumi.set(__self__, "model_framework", model_framework)
         if model_image is not None:
             pulumi.set(__self__, "model_image", model_image)
+        if multi_model is not None:
+            pulumi.set(__self__, "multi_model", multi_model)
+        if prediction_cache_backend is not None:
+            pulumi.set(__self__, "prediction_cache_backend", prediction_cache_backend)
+        if prediction_cache_size is not None:
+            pulumi.set(__self__, "prediction_cache_size", prediction_cache_size)
+        if prediction_cache_ttl is not None:
+            pulumi.set(__self__, "prediction_cache_ttl", prediction_cache_ttl)
+        if prediction_cache_url is not None:
+            pulumi.set(__self__, "prediction_cache_url", prediction_cache_url)
+        if provisioned_concurrency is not None:
+            pulumi.set(__self__, "provisioned_concurrency", provisioned_concurrency)
+        if provisioned_concurrency_max is not None:
+            pulumi.set(__self__, "provisioned_concurrency_max", provisioned_concurrency_max)
+        if provisioned_concurrency_target_utilization is not None:
+            pulumi.set(__self__, "provisioned_concurrency_target_utilization", provisioned_concurrency_target_utilization)
         if region is not None:
             pulumi.set(__self__, "region", region)
+        if reserved_concurrency is not None:
+            pulumi.set(__self__, "reserved_concurrency", reserved_concurrency)
+        if scale_in_cooldown is not None:
+            pulumi.set(__self__, "scale_in_cooldown", scale_in_cooldown)
+        if scale_out_cooldown is not None:
+            pulumi.set(__self__, "scale_out_cooldown", scale_out_cooldown)
+        if scaling_custom_metric is not None:
+            pulumi.set(__self__, "scaling_custom_metric", scaling_custom_metric)
+        if schema_source is not None:
+            pulumi.set(__self__, "schema_source", schema_source)
+        if serverless is not None:
+            pulumi.set(__self__, "serverless", serverless)
+        if serverless_max_concurrency is not None:
+            pulumi.set(__self__, "serverless_max_concurrency", serverless_max_concurrency)
+        if serverless_memory_size is not None:
+            pulumi.set(__self__, "serverless_memory_size", serverless_memory_size)
+        if shadow_variant is not None:
+            pulumi.set(__self__, "shadow_variant", shadow_variant)
+        if target_invocations_per_instance is not None:
+            pulumi.set(__self__, "target_invocations_per_instance", target_invocations_per_instance)
+        if variants is not None:
+            pulumi.set(__self__, "variants", variants)
 
     @property
     @pulumi.getter(name="columnNames")
@@ -87,6 +263,210 @@ class SagemakerPredictorLambdaArgs:
     def account_id(self, value: Optional[pulumi.Input[str]]):
         pulumi.set(self, "account_id", value)
 
+    @property
+    @pulumi.getter(name="asyncErrorTopicArn")
+    def async_error_topic_arn(self) -> Optional[pulumi.Input[str]]:
+        """
+        SNS topic notified when an asynchronous inference fails.
+        """
+        return pulumi.get(self, "async_error_topic_arn")
+
+    @async_error_topic_arn.setter
+    def async_error_topic_arn(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "async_error_topic_arn", value)
+
+    @property
+    @pulumi.getter(name="asyncInference")
+    def async_inference(self) -> Optional[pulumi.Input[bool]]:
+        """
+        Whether the endpoint serves asynchronous inference. The Lambda function then stages requests under `async/<name>/` in `modelDataBucket`, where the endpoint also writes its output, and answers with job handles that are sent back to fetch the results.
+        """
+        return pulumi.get(self, "async_inference")
+
+    @async_inference.setter
+    def async_inference(self, value: Optional[pulumi.Input[bool]]):
+        pulumi.set(self, "async_inference", value)
+
+    @property
+    @pulumi.getter(name="asyncMaxConcurrentInvocationsPerInstance")
+    def async_max_concurrent_invocations_per_instance(self) -> Optional[pulumi.Input[int]]:
+        """
+        Requests each instance of an asynchronous endpoint processes at once. Chosen by SageMaker by default.
+        """
+        return pulumi.get(self, "async_max_concurrent_invocations_per_instance")
+
+    @async_max_concurrent_invocations_per_instance.setter
+    def async_max_concurrent_invocations_per_instance(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "async_max_concurrent_invocations_per_instance", value)
+
+    @property
+    @pulumi.getter(name="asyncSuccessTopicArn")
+    def async_success_topic_arn(self) -> Optional[pulumi.Input[str]]:
+        """
+        SNS topic notified when an asynchronous inference succeeds.
+        """
+        return pulumi.get(self, "async_success_topic_arn")
+
+    @async_success_topic_arn.setter
+    def async_success_topic_arn(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "async_success_topic_arn", value)
+
+    @property
+    @pulumi.getter(name="batchConcurrency")
+    def batch_concurrency(self) -> Optional[pulumi.Input[int]]:
+        """
+        Number of chunks of one batch the Lambda function scores in parallel. Defaults to 4.
+        """
+        return pulumi.get(self, "batch_concurrency")
+
+    @batch_concurrency.setter
+    def batch_concurrency(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "batch_concurrency", value)
+
+    @property
+    @pulumi.getter(name="batchMaxBytes")
+    def batch_max_bytes(self) -> Optional[pulumi.Input[int]]:
+        """
+        Maximum CSV payload size in bytes per endpoint call. Defaults to 5000000, under the 6 MB SageMaker limit.
+        """
+        return pulumi.get(self, "batch_max_bytes")
+
+    @batch_max_bytes.setter
+    def batch_max_bytes(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "batch_max_bytes", value)
+
+    @property
+    @pulumi.getter(name="batchMaxRows")
+    def batch_max_rows(self) -> Optional[pulumi.Input[int]]:
+        """
+        Maximum number of rows the Lambda function sends per endpoint call; larger batches are split into chunks. Defaults to 1000.
+        """
+        return pulumi.get(self, "batch_max_rows")
+
+    @batch_max_rows.setter
+    def batch_max_rows(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "batch_max_rows", value)
+
+    @property
+    @pulumi.getter(name="clientAccept")
+    def client_accept(self) -> Optional[pulumi.Input[str]]:
+        """
+        Response type the Lambda function requests from the endpoint: `text/json` (default) or `text/csv`, which is cheaper to parse.
+        """
+        return pulumi.get(self, "client_accept")
+
+    @client_accept.setter
+    def client_accept(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "client_accept", value)
+
+    @property
+    @pulumi.getter(name="clientConnectTimeout")
+    def client_connect_timeout(self) -> Optional[pulumi.Input[float]]:
+        """
+        Connect timeout in seconds of the SageMaker runtime client.
+        """
+        return pulumi.get(self, "client_connect_timeout")
+
+    @client_connect_timeout.setter
+    def client_connect_timeout(self, value: Optional[pulumi.Input[float]]):
+        pulumi.set(self, "client_connect_timeout", value)
+
+    @property
+    @pulumi.getter(name="clientMaxAttempts")
+    def client_max_attempts(self) -> Optional[pulumi.Input[int]]:
+        """
+        Total number of attempts, including the first, the SageMaker runtime client makes per call.
+        """
+        return pulumi.get(self, "client_max_attempts")
+
+    @client_max_attempts.setter
+    def client_max_attempts(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "client_max_attempts", value)
+
+    @property
+    @pulumi.getter(name="clientMaxPoolConnections")
+    def client_max_pool_connections(self) -> Optional[pulumi.Input[int]]:
+        """
+        Size of the HTTP connection pool of the Lambda function's SageMaker runtime client. Defaults to the botocore default of 10.
+        """
+        return pulumi.get(self, "client_max_pool_connections")
+
+    @client_max_pool_connections.setter
+    def client_max_pool_connections(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "client_max_pool_connections", value)
+
+    @property
+    @pulumi.getter(name="clientReadTimeout")
+    def client_read_timeout(self) -> Optional[pulumi.Input[float]]:
+        """
+        Read timeout in seconds of the SageMaker runtime client.
+        """
+        return pulumi.get(self, "client_read_timeout")
+
+    @client_read_timeout.setter
+    def client_read_timeout(self, value: Optional[pulumi.Input[float]]):
+        pulumi.set(self, "client_read_timeout", value)
+
+    @property
+    @pulumi.getter(name="clientRetryMode")
+    def client_retry_mode(self) -> Optional[pulumi.Input[str]]:
+        """
+        botocore retry mode of the SageMaker runtime client: `legacy`, `standard` or `adaptive`.
+        """
+        return pulumi.get(self, "client_retry_mode")
+
+    @client_retry_mode.setter
+    def client_retry_mode(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "client_retry_mode", value)
+
+    @property
+    @pulumi.getter(name="clientTcpKeepalive")
+    def client_tcp_keepalive(self) -> Optional[pulumi.Input[bool]]:
+        """
+        Whether the SageMaker runtime client enables TCP keepalive on its connections.
+        """
+        return pulumi.get(self, "client_tcp_keepalive")
+
+    @client_tcp_keepalive.setter
+    def client_tcp_keepalive(self, value: Optional[pulumi.Input[bool]]):
+        pulumi.set(self, "client_tcp_keepalive", value)
+
+    @property
+    @pulumi.getter(name="dataCapturePercentage")
+    def data_capture_percentage(self) -> Optional[pulumi.Input[int]]:
+        """
+        Percentage of endpoint requests, from 1 to 100, whose payloads and responses SageMaker captures as JSON Lines under `capture/<name>/` in `modelDataBucket`. Not supported by serverless endpoints. Disabled by default.
+        """
+        return pulumi.get(self, "data_capture_percentage")
+
+    @data_capture_percentage.setter
+    def data_capture_percentage(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "data_capture_percentage", value)
+
+    @property
+    @pulumi.getter(name="httpAuthType")
+    def http_auth_type(self) -> Optional[pulumi.Input[str]]:
+        """
+        Authorization of the HTTP endpoint, `AWS_IAM` to require SigV4 signed requests or `NONE` for a public endpoint. Defaults to `AWS_IAM`.
+        """
+        return pulumi.get(self, "http_auth_type")
+
+    @http_auth_type.setter
+    def http_auth_type(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "http_auth_type", value)
+
+    @property
+    @pulumi.getter(name="httpEndpoint")
+    def http_endpoint(self) -> Optional[pulumi.Input[str]]:
+        """
+        Exposes the Lambda function over HTTP, as `function_url` for a Lambda Function URL or `http_api` for an API Gateway HTTP API, so that clients can POST requests over reused connections instead of calling the Lambda Invoke API.
+        """
+        return pulumi.get(self, "http_endpoint")
+
+    @http_endpoint.setter
+    def http_endpoint(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "http_endpoint", value)
+
     @property
     @pulumi.getter(name="initialInstanceCount")
     def initial_instance_count(self) -> Optional[pulumi.Input[int]]:
@@ -111,6 +491,102 @@ class SagemakerPredictorLambdaArgs:
     def instance_type(self, value: Optional[pulumi.Input[str]]):
         pulumi.set(self, "instance_type", value)
 
+    @property
+    @pulumi.getter(name="lambdaArchitecture")
+    def lambda_architecture(self) -> Optional[pulumi.Input[str]]:
+        """
+        Instruction set of the Lambda function: `x86_64` (default) or `arm64` for Graviton.
+        """
+        return pulumi.get(self, "lambda_architecture")
+
+    @lambda_architecture.setter
+    def lambda_architecture(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "lambda_architecture", value)
+
+    @property
+    @pulumi.getter(name="lambdaMemorySize")
+    def lambda_memory_size(self) -> Optional[pulumi.Input[int]]:
+        """
+        Memory of the Lambda function in MB, which also scales its CPU. Defaults to 128.
+        """
+        return pulumi.get(self, "lambda_memory_size")
+
+    @lambda_memory_size.setter
+    def lambda_memory_size(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "lambda_memory_size", value)
+
+    @property
+    @pulumi.getter(name="lambdaRuntime")
+    def lambda_runtime(self) -> Optional[pulumi.Input[str]]:
+        """
+        Python runtime of the Lambda function. Defaults to `python3.8`.
+        """
+        return pulumi.get(self, "lambda_runtime")
+
+    @lambda_runtime.setter
+    def lambda_runtime(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "lambda_runtime", value)
+
+    @property
+    @pulumi.getter(name="lambdaSecurityGroupIds")
+    def lambda_security_group_ids(self) -> Optional[pulumi.Input[Sequence[pulumi.Input[str]]]]:
+        """
+        Security groups of the Lambda function when it runs in a VPC.
+        """
+        return pulumi.get(self, "lambda_security_group_ids")
+
+    @lambda_security_group_ids.setter
+    def lambda_security_group_ids(self, value: Optional[pulumi.Input[Sequence[pulumi.Input[str]]]]):
+        pulumi.set(self, "lambda_security_group_ids", value)
+
+    @property
+    @pulumi.getter(name="lambdaSubnetIds")
+    def lambda_subnet_ids(self) -> Optional[pulumi.Input[Sequence[pulumi.Input[str]]]]:
+        """
+        VPC subnets to run the Lambda function in, for example to reach an ElastiCache prediction cache. The subnets then need a route to S3 and the SageMaker runtime.
+        """
+        return pulumi.get(self, "lambda_subnet_ids")
+
+    @lambda_subnet_ids.setter
+    def lambda_subnet_ids(self, value: Optional[pulumi.Input[Sequence[pulumi.Input[str]]]]):
+        pulumi.set(self, "lambda_subnet_ids", value)
+
+    @property
+    @pulumi.getter(name="lambdaTimeout")
+    def lambda_timeout(self) -> Optional[pulumi.Input[int]]:
+        """
+        Timeout of the Lambda function in seconds. Defaults to 30.
+        """
+        return pulumi.get(self, "lambda_timeout")
+
+    @lambda_timeout.setter
+    def lambda_timeout(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "lambda_timeout", value)
+
+    @property
+    @pulumi.getter(name="maxInstanceCount")
+    def max_instance_count(self) -> Optional[pulumi.Input[int]]:
+        """
+        When set, Application Auto Scaling scales the endpoint's `AllTraffic` variant between `minInstanceCount` and this many instances.
+        """
+        return pulumi.get(self, "max_instance_count")
+
+    @max_instance_count.setter
+    def max_instance_count(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "max_instance_count", value)
+
+    @property
+    @pulumi.getter(name="minInstanceCount")
+    def min_instance_count(self) -> Optional[pulumi.Input[int]]:
+        """
+        Fewest instances the endpoint scales in to. Defaults to `initialInstanceCount`.
+        """
+        return pulumi.get(self, "min_instance_count")
+
+    @min_instance_count.setter
+    def min_instance_count(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "min_instance_count", value)
+
     @property
     @pulumi.getter(name="modelDataKey")
     def model_data_key(self) -> Optional[pulumi.Input[str]]:
@@ -147,6 +623,102 @@ class SagemakerPredictorLambdaArgs:
     def model_image(self, value: Optional[pulumi.Input[str]]):
         pulumi.set(self, "model_image", value)
 
+    @property
+    @pulumi.getter(name="multiModel")
+    def multi_model(self) -> Optional[pulumi.Input[bool]]:
+        """
+        Whether the endpoint is a multi-model endpoint serving every model artifact under the `modelDataKey` prefix. Requests name their model with `targetModel`, and a `<key>.json` object next to an artifact overrides `columnNames` for that model.
+        """
+        return pulumi.get(self, "multi_model")
+
+    @multi_model.setter
+    def multi_model(self, value: Optional[pulumi.Input[bool]]):
+        pulumi.set(self, "multi_model", value)
+
+    @property
+    @pulumi.getter(name="predictionCacheBackend")
+    def prediction_cache_backend(self) -> Optional[pulumi.Input[str]]:
+        """
+        Where the Lambda function caches scores: `memory` (default), an LRU per container, or `redis`, a server shared by all containers.
+        """
+        return pulumi.get(self, "prediction_cache_backend")
+
+    @prediction_cache_backend.setter
+    def prediction_cache_backend(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "prediction_cache_backend", value)
+
+    @property
+    @pulumi.getter(name="predictionCacheSize")
+    def prediction_cache_size(self) -> Optional[pulumi.Input[int]]:
+        """
+        Maximum number of encoded feature rows whose scores the Lambda function caches in memory. Defaults to 0, which disables the cache.
+        """
+        return pulumi.get(self, "prediction_cache_size")
+
+    @prediction_cache_size.setter
+    def prediction_cache_size(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "prediction_cache_size", value)
+
+    @property
+    @pulumi.getter(name="predictionCacheTtl")
+    def prediction_cache_ttl(self) -> Optional[pulumi.Input[float]]:
+        """
+        Seconds a cached score stays valid. Defaults to 0, keeping scores until they are evicted.
+        """
+        return pulumi.get(self, "prediction_cache_ttl")
+
+    @prediction_cache_ttl.setter
+    def prediction_cache_ttl(self, value: Optional[pulumi.Input[float]]):
+        pulumi.set(self, "prediction_cache_ttl", value)
+
+    @property
+    @pulumi.getter(name="predictionCacheUrl")
+    def prediction_cache_url(self) -> Optional[pulumi.Input[str]]:
+        """
+        URL of the Redis server for the `redis` prediction cache, such as `redis://host:6379/0`, or `rediss://` for TLS.
+        """
+        return pulumi.get(self, "prediction_cache_url")
+
+    @prediction_cache_url.setter
+    def prediction_cache_url(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "prediction_cache_url", value)
+
+    @property
+    @pulumi.getter(name="provisionedConcurrency")
+    def provisioned_concurrency(self) -> Optional[pulumi.Input[int]]:
+        """
+        Number of pre-initialized execution environments kept warm for the Lambda function. When set, a version is published and the `live` alias serving it is given this provisioned concurrency.
+        """
+        return pulumi.get(self, "provisioned_concurrency")
+
+    @provisioned_concurrency.setter
+    def provisioned_concurrency(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "provisioned_concurrency", value)
+
+    @property
+    @pulumi.getter(name="provisionedConcurrencyMax")
+    def provisioned_concurrency_max(self) -> Optional[pulumi.Input[int]]:
+        """
+        When set, Application Auto Scaling tracks provisioned concurrency utilization and scales between `provisionedConcurrency` and this maximum.
+        """
+        return pulumi.get(self, "provisioned_concurrency_max")
+
+    @provisioned_concurrency_max.setter
+    def provisioned_concurrency_max(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "provisioned_concurrency_max", value)
+
+    @property
+    @pulumi.getter(name="provisionedConcurrencyTargetUtilization")
+    def provisioned_concurrency_target_utilization(self) -> Optional[pulumi.Input[float]]:
+        """
+        Provisioned concurrency utilization the scaling policy aims for. Defaults to 0.7.
+        """
+        return pulumi.get(self, "provisioned_concurrency_target_utilization")
+
+    @provisioned_concurrency_target_utilization.setter
+    def provisioned_concurrency_target_utilization(self, value: Optional[pulumi.Input[float]]):
+        pulumi.set(self, "provisioned_concurrency_target_utilization", value)
+
     @property
     @pulumi.getter
     def region(self) -> Optional[pulumi.Input[str]]:
@@ -159,6 +731,138 @@ class SagemakerPredictorLambdaArgs:
     def region(self, value: Optional[pulumi.Input[str]]):
         pulumi.set(self, "region", value)
 
+    @property
+    @pulumi.getter(name="reservedConcurrency")
+    def reserved_concurrency(self) -> Optional[pulumi.Input[int]]:
+        """
+        Concurrent executions reserved for the Lambda function, which also caps its concurrency. Unreserved by default.
+        """
+        return pulumi.get(self, "reserved_concurrency")
+
+    @reserved_concurrency.setter
+    def reserved_concurrency(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "reserved_concurrency", value)
+
+    @property
+    @pulumi.getter(name="scaleInCooldown")
+    def scale_in_cooldown(self) -> Optional[pulumi.Input[int]]:
+        """
+        Seconds after a scale-in before the endpoint scales in again. Defaults to 300.
+        """
+        return pulumi.get(self, "scale_in_cooldown")
+
+    @scale_in_cooldown.setter
+    def scale_in_cooldown(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "scale_in_cooldown", value)
+
+    @property
+    @pulumi.getter(name="scaleOutCooldown")
+    def scale_out_cooldown(self) -> Optional[pulumi.Input[int]]:
+        """
+        Seconds after a scale-out before the endpoint scales out again. Defaults to 60.
+        """
+        return pulumi.get(self, "scale_out_cooldown")
+
+    @scale_out_cooldown.setter
+    def scale_out_cooldown(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "scale_out_cooldown", value)
+
+    @property
+    @pulumi.getter(name="scalingCustomMetric")
+    def scaling_custom_metric(self) -> Optional[pulumi.Input[Mapping[str, Any]]]:
+        """
+        CloudWatch metric to track instead of invocations per instance, given as `metricName`, `namespace`, `statistic`, optional `unit` and `dimensions` (a map of dimension names to values) and the `targetValue` to aim for.
+        """
+        return pulumi.get(self, "scaling_custom_metric")
+
+    @scaling_custom_metric.setter
+    def scaling_custom_metric(self, value: Optional[pulumi.Input[Mapping[str, Any]]]):
+        pulumi.set(self, "scaling_custom_metric", value)
+
+    @property
+    @pulumi.getter(name="schemaSource")
+    def schema_source(self) -> Optional[pulumi.Input[str]]:
+        """
+        Where the Lambda function reads the feature schema from: `s3` (the default) stores it as an object in modelDataBucket, `archive` bundles it as schema.json with the function code and `environment` passes it in the SCHEMA_JSON variable. The latter two avoid an S3 request on every cold start.
+        """
+        return pulumi.get(self, "schema_source")
+
+    @schema_source.setter
+    def schema_source(self, value: Optional[pulumi.Input[str]]):
+        pulumi.set(self, "schema_source", value)
+
+    @property
+    @pulumi.getter
+    def serverless(self) -> Optional[pulumi.Input[bool]]:
+        """
+        Whether the endpoint uses SageMaker Serverless Inference instead of dedicated instances, scaling to zero when idle. Serverless endpoints take no instance type, count or autoscaling options and are not encrypted with the component's KMS key.
+        """
+        return pulumi.get(self, "serverless")
+
+    @serverless.setter
+    def serverless(self, value: Optional[pulumi.Input[bool]]):
+        pulumi.set(self, "serverless", value)
+
+    @property
+    @pulumi.getter(name="serverlessMaxConcurrency")
+    def serverless_max_concurrency(self) -> Optional[pulumi.Input[int]]:
+        """
+        Concurrent invocations a serverless endpoint serves before throttling. Defaults to 20.
+        """
+        return pulumi.get(self, "serverless_max_concurrency")
+
+    @serverless_max_concurrency.setter
+    def serverless_max_concurrency(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "serverless_max_concurrency", value)
+
+    @property
+    @pulumi.getter(name="serverlessMemorySize")
+    def serverless_memory_size(self) -> Optional[pulumi.Input[int]]:
+        """
+        Memory of a serverless endpoint in MB, from 1024 to 6144 in 1024 MB steps. Defaults to 2048.
+        """
+        return pulumi.get(self, "serverless_memory_size")
+
+    @serverless_memory_size.setter
+    def serverless_memory_size(self, value: Optional[pulumi.Input[int]]):
+        pulumi.set(self, "serverless_memory_size", value)
+
+    @property
+    @pulumi.getter(name="shadowVariant")
+    def shadow_variant(self) -> Optional[pulumi.Input[Mapping[str, Any]]]:
+        """
+        Variant that is sent a copy of production requests, given in the same form as `variants`, whose responses SageMaker only logs. Its weight relative to the production variants sets the share of requests it receives.
+        """
+        return pulumi.get(self, "shadow_variant")
+
+    @shadow_variant.setter
+    def shadow_variant(self, value: Optional[pulumi.Input[Mapping[str, Any]]]):
+        pulumi.set(self, "shadow_variant", value)
+
+    @property
+    @pulumi.getter(name="targetInvocationsPerInstance")
+    def target_invocations_per_instance(self) -> Optional[pulumi.Input[float]]:
+        """
+        Invocations per instance per minute the scaling policy aims for. Defaults to 70.
+        """
+        return pulumi.get(self, "target_invocations_per_instance")
+
+    @target_invocations_per_instance.setter
+    def target_invocations_per_instance(self, value: Optional[pulumi.Input[float]]):
+        pulumi.set(self, "target_invocations_per_instance", value)
+
+    @property
+    @pulumi.getter
+    def variants(self) -> Optional[pulumi.Input[Sequence[pulumi.Input[Mapping[str, Any]]]]]:
+        """
+        Production variants to split traffic between, each a map with a `name` and optional `modelDataKey`, `instanceType`, `initialInstanceCount` and `weight`, which default to the settings of the component and a weight of 1. Defaults to a single `AllTraffic` variant.
+        """
+        return pulumi.get(self, "variants")
+
+    @variants.setter
+    def variants(self, value: Optional[pulumi.Input[Sequence[pulumi.Input[Mapping[str, Any]]]]]):
+        pulumi.set(self, "variants", value)
+
 
 class SagemakerPredictorLambda(pulumi.ComponentResource):
     @overload
@@ -166,28 +870,116 @@ class SagemakerPredictorLambda(pulumi.ComponentResource):
                  resource_name: str,
                  opts: Optional[pulumi.ResourceOptions] = None,
                  account_id: Optional[pulumi.Input[str]] = None,
+                 async_error_topic_arn: Optional[pulumi.Input[str]] = None,
+                 async_inference: Optional[pulumi.Input[bool]] = None,
+                 async_max_concurrent_invocations_per_instance: Optional[pulumi.Input[int]] = None,
+                 async_success_topic_arn: Optional[pulumi.Input[str]] = None,
+                 batch_concurrency: Optional[pulumi.Input[int]] = None,
+                 batch_max_bytes: Optional[pulumi.Input[int]] = None,
+                 batch_max_rows: Optional[pulumi.Input[int]] = None,
+                 client_accept: Optional[pulumi.Input[str]] = None,
+                 client_connect_timeout: Optional[pulumi.Input[float]] = None,
+                 client_max_attempts: Optional[pulumi.Input[int]] = None,
+                 client_max_pool_connections: Optional[pulumi.Input[int]] = None,
+                 client_read_timeout: Optional[pulumi.Input[float]] = None,
+                 client_retry_mode: Optional[pulumi.Input[str]] = None,
+                 client_tcp_keepalive: Optional[pulumi.Input[bool]] = None,
                  column_names: Optional[pulumi.Input[Sequence[pulumi.Input[str]]]] = None,
+                 data_capture_percentage: Optional[pulumi.Input[int]] = None,
+                 http_auth_type: Optional[pulumi.Input[str]] = None,
+                 http_endpoint: Optional[pulumi.Input[str]] = None,
                  initial_instance_count: Optional[pulumi.Input[int]] = None,
                  instance_type: Optional[pulumi.Input[str]] = None,
+                 lambda_architecture: Optional[pulumi.Input[str]] = None,
+                 lambda_memory_size: Optional[pulumi.Input[int]] = None,
+                 lambda_runtime: Optional[pulumi.Input[str]] = None,
+                 lambda_security_group_ids: Optional[pulumi.Input[Sequence[pulumi.Input[str]]]] = None,
+                 lambda_subnet_ids: Optional[pulumi.Input[Sequence[pulumi.Input[str]]]] = None,
+                 lambda_timeout: Optional[pulumi.Input[int]] = None,
+                 max_instance_count: Optional[pulumi.Input[int]] = None,
+                 min_instance_count: Optional[pulumi.Input[int]] = None,
                  model_data_bucket: Optional[pulumi.Input[str]] = None,
                  model_data_key: Optional[pulumi.Input[str]] = None,
                  model_framework: Optional[pulumi.Input[str]] = None,
                  model_image: Optional[pulumi.Input[str]] = None,
+                 multi_model: Optional[pulumi.Input[bool]] = None,
+                 prediction_cache_backend: Optional[pulumi.Input[str]] = None,
+                 prediction_cache_size: Optional[pulumi.Input[int]] = None,
+                 prediction_cache_ttl: Optional[pulumi.Input[float]] = None,
+                 prediction_cache_url: Optional[pulumi.Input[str]] = None,
+                 provisioned_concurrency: Optional[pulumi.Input[int]] = None,
+                 provisioned_concurrency_max: Optional[pulumi.Input[int]] = None,
+                 provisioned_concurrency_target_utilization: Optional[pulumi.Input[float]] = None,
                  region: Optional[pulumi.Input[str]] = None,
+                 reserved_concurrency: Optional[pulumi.Input[int]] = None,
+                 scale_in_cooldown: Optional[pulumi.Input[int]] = None,
+                 scale_out_cooldown: Optional[pulumi.Input[int]] = None,
+                 scaling_custom_metric: Optional[pulumi.Input[Mapping[str, Any]]] = None,
+                 schema_source: Optional[pulumi.Input[str]] = None,
+                 serverless: Optional[pulumi.Input[bool]] = None,
+                 serverless_max_concurrency: Optional[pulumi.Input[int]] = None,
+                 serverless_memory_size: Optional[pulumi.Input[int]] = None,
+                 shadow_variant: Optional[pulumi.Input[Mapping[str, Any]]] = None,
+                 target_invocations_per_instance: Optional[pulumi.Input[float]] = None,
+                 variants: Optional[pulumi.Input[Sequence[pulumi.Input[Mapping[str, Any]]]]] = None,
                  __props__=None):
         """
         Create a SagemakerPredictorLambda resource with the given unique name, props, and options.
         :param str resource_name: The name of the resource.
         :param pulumi.ResourceOptions opts: Options for the resource.
         :param pulumi.Input[str] account_id: TODO
+        :param pulumi.Input[str] async_error_topic_arn: SNS topic notified when an asynchronous inference fails.
+        :param pulumi.Input[bool] async_inference: Whether the endpoint serves asynchronous inference. The Lambda function then stages requests under `async/<name>/` in `modelDataBucket`, where the endpoint also writes its output, and answers with job handles that are sent back to fetch the results.
+        :param pulumi.Input[int] async_max_concurrent_invocations_per_instance: Requests each instance of an asynchronous endpoint processes at once. Chosen by SageMaker by default.
+        :param pulumi.Input[str] async_success_topic_arn: SNS topic notified when an asynchronous inference succeeds.
+        :param pulumi.Input[int] batch_concurrency: Number of chunks of one batch the Lambda function scores in parallel. Defaults to 4.
+        :param pulumi.Input[int] batch_max_bytes: Maximum CSV payload size in bytes per endpoint call. Defaults to 5000000, under the 6 MB SageMaker limit.
+        :param pulumi.Input[int] batch_max_rows: Maximum number of rows the Lambda function sends per endpoint call; larger batches are split into chunks. Defaults to 1000.
+        :param pulumi.Input[str] client_accept: Response type the Lambda function requests from the endpoint: `text/json` (default) or `text/csv`, which is cheaper to parse.
+        :param pulumi.Input[float] client_connect_timeout: Connect timeout in seconds of the SageMaker runtime client.
+        :param pulumi.Input[int] client_max_attempts: Total number of attempts, including the first, the SageMaker runtime client makes per call.
+        :param pulumi.Input[int] client_max_pool_connections: Size of the HTTP connection pool of the Lambda function's SageMaker runtime client. Defaults to the botocore default of 10.
+        :param pulumi.Input[float] client_read_timeout: Read timeout in seconds of the SageMaker runtime client.
+        :param pulumi.Input[str] client_retry_mode: botocore retry mode of the SageMaker runtime client: `legacy`, `standard` or `adaptive`.
+        :param pulumi.Input[bool] client_tcp_keepalive: Whether the SageMaker runtime client enables TCP keepalive on its connections.
         :param pulumi.Input[Sequence[pulumi.Input[str]]] column_names: TODO
+        :param pulumi.Input[int] data_capture_percentage: Percentage of endpoint requests, from 1 to 100, whose payloads and responses SageMaker captures as JSON Lines under `capture/<name>/` in `modelDataBucket`. Not supported by serverless endpoints. Disabled by default.
+        :param pulumi.Input[str] http_auth_type: Authorization of the HTTP endpoint, `AWS_IAM` to require SigV4 signed requests or `NONE` for a public endpoint. Defaults to `AWS_IAM`.
+        :param pulumi.Input[str] http_endpoint: Exposes the Lambda function over HTTP, as `function_url` for a Lambda Function URL or `http_api` for an API Gateway HTTP API, so that clients can POST requests over reused connections instead of calling the Lambda Invoke API.
         :param pulumi.Input[int] initial_instance_count: TODO
         :param pulumi.Input[str] instance_type: TODO
+        :param pulumi.Input[str] lambda_architecture: Instruction set of the Lambda function: `x86_64` (default) or `arm64` for Graviton.
+        :param pulumi.Input[int] lambda_memory_size: Memory of the Lambda function in MB, which also scales its CPU. Defaults to 128.
+        :param pulumi.Input[str] lambda_runtime: Python runtime of the Lambda function. Defaults to `python3.8`.
+        :param pulumi.Input[Sequence[pulumi.Input[str]]] lambda_security_group_ids: Security groups of the Lambda function when it runs in a VPC.
+        :param pulumi.Input[Sequence[pulumi.Input[str]]] lambda_subnet_ids: VPC subnets to run the Lambda function in, for example to reach an ElastiCache prediction cache. The subnets then need a route to S3 and the SageMaker runtime.
+        :param pulumi.Input[int] lambda_timeout: Timeout of the Lambda function in seconds. Defaults to 30.
+        :param pulumi.Input[int] max_instance_count: When set, Application Auto Scaling scales the endpoint's `AllTraffic` variant between `minInstanceCount` and this many instances.
+        :param pulumi.Input[int] min_instance_count: Fewest instances the endpoint scales in to. Defaults to `initialInstanceCount`.
         :param pulumi.Input[str] model_data_bucket: TODO
         :param pulumi.Input[str] model_data_key: TODO
         :param pulumi.Input[str] model_framework: TODO
         :param pulumi.Input[str] model_image: TODO
+        :param pulumi.Input[bool] multi_model: Whether the endpoint is a multi-model endpoint serving every model artifact under the `modelDataKey` prefix. Requests name their model with `targetModel`, and a `<key>.json` object next to an artifact overrides `columnNames` for that model.
+        :param pulumi.Input[str] prediction_cache_backend: Where the Lambda function caches scores: `memory` (default), an LRU per container, or `redis`, a server shared by all containers.
+        :param pulumi.Input[int] prediction_cache_size: Maximum number of encoded feature rows whose scores the Lambda function caches in memory. Defaults to 0, which disables the cache.
+        :param pulumi.Input[float] prediction_cache_ttl: Seconds a cached score stays valid. Defaults to 0, keeping scores until they are evicted.
+        :param pulumi.Input[str] prediction_cache_url: URL of the Redis server for the `redis` prediction cache, such as `redis://host:6379/0`, or `rediss://` for TLS.
+        :param pulumi.Input[int] provisioned_concurrency: Number of pre-initialized execution environments kept warm for the Lambda function. When set, a version is published and the `live` alias serving it is given this provisioned concurrency.
+        :param pulumi.Input[int] provisioned_concurrency_max: When set, Application Auto Scaling tracks provisioned concurrency utilization and scales between `provisionedConcurrency` and this maximum.
+        :param pulumi.Input[float] provisioned_concurrency_target_utilization: Provisioned concurrency utilization the scaling policy aims for. Defaults to 0.7.
         :param pulumi.Input[str] region: TODO
+        :param pulumi.Input[int] reserved_concurrency: Concurrent executions reserved for the Lambda function, which also caps its concurrency. Unreserved by default.
+        :param pulumi.Input[int] scale_in_cooldown: Seconds after a scale-in before the endpoint scales in again. Defaults to 300.
+        :param pulumi.Input[int] scale_out_cooldown: Seconds after a scale-out before the endpoint scales out again. Defaults to 60.
+        :param pulumi.Input[Mapping[str, Any]] scaling_custom_metric: CloudWatch metric to track instead of invocations per instance, given as `metricName`, `namespace`, `statistic`, optional `unit` and `dimensions` (a map of dimension names to values) and the `targetValue` to aim for.
+        :param pulumi.Input[str] schema_source: Where the Lambda function reads the feature schema from: `s3` (the default) stores it as an object in modelDataBucket, `archive` bundles it as schema.json with the function code and `environment` passes it in the SCHEMA_JSON variable. The latter two avoid an S3 request on every cold start.
+        :param pulumi.Input[bool] serverless: Whether the endpoint uses SageMaker Serverless Inference instead of dedicated instances, scaling to zero when idle. Serverless endpoints take no instance type, count or autoscaling options and are not encrypted with the component's KMS key.
+        :param pulumi.Input[int] serverless_max_concurrency: Concurrent invocations a serverless endpoint serves before throttling. Defaults to 20.
+        :param pulumi.Input[int] serverless_memory_size: Memory of a serverless endpoint in MB, from 1024 to 6144 in 1024 MB steps. Defaults to 2048.
+        :param pulumi.Input[Mapping[str, Any]] shadow_variant: Variant that is sent a copy of production requests, given in the same form as `variants`, whose responses SageMaker only logs. Its weight relative to the production variants sets the share of requests it receives.
+        :param pulumi.Input[float] target_invocations_per_instance: Invocations per instance per minute the scaling policy aims for. Defaults to 70.
+        :param pulumi.Input[Sequence[pulumi.Input[Mapping[str, Any]]]] variants: Production variants to split traffic between, each a map with a `name` and optional `modelDataKey`, `instanceType`, `initialInstanceCount` and `weight`, which default to the settings of the component and a weight of 1. Defaults to a single `AllTraffic` variant.
         """
         ...
     @overload
@@ -213,14 +1005,58 @@ class SagemakerPredictorLambda(pulumi.ComponentResource):
                  resource_name: str,
                  opts: Optional[pulumi.ResourceOptions] = None,
                  account_id: Optional[pulumi.Input[str]] = None,
+                 async_error_topic_arn: Optional[pulumi.Input[str]] = None,
+                 async_inference: Optional[pulumi.Input[bool]] = None,
+                 async_max_concurrent_invocations_per_instance: Optional[pulumi.Input[int]] = None,
+                 async_success_topic_arn: Optional[pulumi.Input[str]] = None,
+                 batch_concurrency: Optional[pulumi.Input[int]] = None,
+                 batch_max_bytes: Optional[pulumi.Input[int]] = None,
+                 batch_max_rows: Optional[pulumi.Input[int]] = None,
+                 client_accept: Optional[pulumi.Input[str]] = None,
+                 client_connect_timeout: Optional[pulumi.Input[float]] = None,
+                 client_max_attempts: Optional[pulumi.Input[int]] = None,
+                 client_max_pool_connections: Optional[pulumi.Input[int]] = None,
+                 client_read_timeout: Optional[pulumi.Input[float]] = None,
+                 client_retry_mode: Optional[pulumi.Input[str]] = None,
+                 client_tcp_keepalive: Optional[pulumi.Input[bool]] = None,
                  column_names: Optional[pulumi.Input[Sequence[pulumi.Input[str]]]] = None,
+                 data_capture_percentage: Optional[pulumi.Input[int]] = None,
+                 http_auth_type: Optional[pulumi.Input[str]] = None,
+                 http_endpoint: Optional[pulumi.Input[str]] = None,
                  initial_instance_count: Optional[pulumi.Input[int]] = None,
                  instance_type: Optional[pulumi.Input[str]] = None,
+                 lambda_architecture: Optional[pulumi.Input[str]] = None,
+                 lambda_memory_size: Optional[pulumi.Input[int]] = None,
+                 lambda_runtime: Optional[pulumi.Input[str]] = None,
+                 lambda_security_group_ids: Optional[pulumi.Input[Sequence[pulumi.Input[str]]]] = None,
+                 lambda_subnet_ids: Optional[pulumi.Input[Sequence[pulumi.Input[str]]]] = None,
+                 lambda_timeout: Optional[pulumi.Input[int]] = None,
+                 max_instance_count: Optional[pulumi.Input[int]] = None,
+                 min_instance_count: Optional[pulumi.Input[int]] = None,
                  model_data_bucket: Optional[pulumi.Input[str]] = None,
                  model_data_key: Optional[pulumi.Input[str]] = None,
                  model_framework: Optional[pulumi.Input[str]] = None,
                  model_image: Optional[pulumi.Input[str]] = None,
+                 multi_model: Optional[pulumi.Input[bool]] = None,
+                 prediction_cache_backend: Optional[pulumi.Input[str]] = None,
+                 prediction_cache_size: Optional[pulumi.Input[int]] = None,
+                 prediction_cache_ttl: Optional[pulumi.Input[float]] = None,
+                 prediction_cache_url: Optional[pulumi.Input[str]] = None,
+                 provisioned_concurrency: Optional[pulumi.Input[int]] = None,
+                 provisioned_concurrency_max: Optional[pulumi.Input[int]] = None,
+                 provisioned_concurrency_target_utilization: Optional[pulumi.Input[float]] = None,
                  region: Optional[pulumi.Input[str]] = None,
+                 reserved_concurrency: Optional[pulumi.Input[int]] = None,
+                 scale_in_cooldown: Optional[pulumi.Input[int]] = None,
+                 scale_out_cooldown: Optional[pulumi.Input[int]] = None,
+                 scaling_custom_metric: Optional[pulumi.Input[Mapping[str, Any]]] = None,
+                 schema_source: Optional[pulumi.Input[str]] = None,
+                 serverless: Optional[pulumi.Input[bool]] = None,
+                 serverless_max_concurrency: Optional[pulumi.Input[int]] = None,
+                 serverless_memory_size: Optional[pulumi.Input[int]] = None,
+                 shadow_variant: Optional[pulumi.Input[Mapping[str, Any]]] = None,
+                 target_invocations_per_instance: Optional[pulumi.Input[float]] = None,
+                 variants: Optional[pulumi.Input[Sequence[pulumi.Input[Mapping[str, Any]]]]] = None,
                  __props__=None):
         if opts is None:
             opts = pulumi.ResourceOptions()
@@ -236,20 +1072,67 @@ class SagemakerPredictorLambda(pulumi.ComponentResource):
             __props__ = SagemakerPredictorLambdaArgs.__new__(SagemakerPredictorLambdaArgs)
 
             __props__.__dict__["account_id"] = account_id
+            __props__.__dict__["async_error_topic_arn"] = async_error_topic_arn
+            __props__.__dict__["async_inference"] = async_inference
+            __props__.__dict__["async_max_concurrent_invocations_per_instance"] = async_max_concurrent_invocations_per_instance
+            __props__.__dict__["async_success_topic_arn"] = async_success_topic_arn
+            __props__.__dict__["batch_concurrency"] = batch_concurrency
+            __props__.__dict__["batch_max_bytes"] = batch_max_bytes
+            __props__.__dict__["batch_max_rows"] = batch_max_rows
+            __props__.__dict__["client_accept"] = client_accept
+            __props__.__dict__["client_connect_timeout"] = client_connect_timeout
+            __props__.__dict__["client_max_attempts"] = client_max_attempts
+            __props__.__dict__["client_max_pool_connections"] = client_max_pool_connections
+            __props__.__dict__["client_read_timeout"] = client_read_timeout
+            __props__.__dict__["client_retry_mode"] = client_retry_mode
+            __props__.__dict__["client_tcp_keepalive"] = client_tcp_keepalive
             if column_names is None and not opts.urn:
                 raise TypeError("Missing required property 'column_names'")
             __props__.__dict__["column_names"] = column_names
+            __props__.__dict__["data_capture_percentage"] = data_capture_percentage
+            __props__.__dict__["http_auth_type"] = http_auth_type
+            __props__.__dict__["http_endpoint"] = http_endpoint
             __props__.__dict__["initial_instance_count"] = initial_instance_count
             __props__.__dict__["instance_type"] = instance_type
+            __props__.__dict__["lambda_architecture"] = lambda_architecture
+            __props__.__dict__["lambda_memory_size"] = lambda_memory_size
+            __props__.__dict__["lambda_runtime"] = lambda_runtime
+            __props__.__dict__["lambda_security_group_ids"] = lambda_security_group_ids
+            __props__.__dict__["lambda_subnet_ids"] = lambda_subnet_ids
+            __props__.__dict__["lambda_timeout"] = lambda_timeout
+            __props__.__dict__["max_instance_count"] = max_instance_count
+            __props__.__dict__["min_instance_count"] = min_instance_count
             if model_data_bucket is None and not opts.urn:
                 raise TypeError("Missing required property 'model_data_bucket'")
             __props__.__dict__["model_data_bucket"] = model_data_bucket
             __props__.__dict__["model_data_key"] = model_data_key
             __props__.__dict__["model_framework"] = model_framework
             __props__.__dict__["model_image"] = model_image
+            __props__.__dict__["multi_model"] = multi_model
+            __props__.__dict__["prediction_cache_backend"] = prediction_cache_backend
+            __props__.__dict__["prediction_cache_size"] = prediction_cache_size
+            __props__.__dict__["prediction_cache_ttl"] = prediction_cache_ttl
+            __props__.__dict__["prediction_cache_url"] = prediction_cache_url
+            __props__.__dict__["provisioned_concurrency"] = provisioned_concurrency
+            __props__.__dict__["provisioned_concurrency_max"] = provisioned_concurrency_max
+            __props__.__dict__["provisioned_concurrency_target_utilization"] = provisioned_concurrency_target_utilization
             __props__.__dict__["region"] = region
+            __props__.__dict__["reserved_concurrency"] = reserved_concurrency
+            __props__.__dict__["scale_in_cooldown"] = scale_in_cooldown
+            __props__.__dict__["scale_out_cooldown"] = scale_out_cooldown
+            __props__.__dict__["scaling_custom_metric"] = scaling_custom_metric
+            __props__.__dict__["schema_source"] = schema_source
+            __props__.__dict__["serverless"] = serverless
+            __props__.__dict__["serverless_max_concurrency"] = serverless_max_concurrency
+            __props__.__dict__["serverless_memory_size"] = serverless_memory_size
+            __props__.__dict__["shadow_variant"] = shadow_variant
+            __props__.__dict__["target_invocations_per_instance"] = target_invocations_per_instance
+            __props__.__dict__["variants"] = variants
             __props__.__dict__["endpoint_name"] = None
+            __props__.__dict__["lambda_alias_arn"] = None
             __props__.__dict__["lambda_function_name"] = None
+            __props__.__dict__["model_name"] = None
+            __props__.__dict__["predictor_url"] = None
             __props__.__dict__["training_role_arn"] = None
         super(SagemakerPredictorLambda, __self__).__init__(
             'sagemakerlambda:index:SagemakerPredictorLambda',
@@ -266,6 +1149,14 @@ class SagemakerPredictorLambda(pulumi.ComponentResource):
         """
         return pulumi.get(self, "endpoint_name")
 
+    @property
+    @pulumi.getter(name="lambdaAliasArn")
+    def lambda_alias_arn(self) -> pulumi.Output[Optional[str]]:
+        """
+        ARN of the Lambda alias serving provisioned concurrency, if any. Invoking the unqualified function bypasses the warm environments.
+        """
+        return pulumi.get(self, "lambda_alias_arn")
+
     @property
     @pulumi.getter(name="lambdaFunctionName")
     def lambda_function_name(self) -> pulumi.Output[Optional[str]]:
@@ -274,6 +1165,22 @@ class SagemakerPredictorLambda(pulumi.ComponentResource):
         """
         return pulumi.get(self, "lambda_function_name")
 
+    @property
+    @pulumi.getter(name="modelName")
+    def model_name(self) -> pulumi.Output[Optional[str]]:
+        """
+        Name of the SageMaker model behind the endpoint, which can also score offline with Batch Transform.
+        """
+        return pulumi.get(self, "model_name")
+
+    @property
+    @pulumi.getter(name="predictorUrl")
+    def predictor_url(self) -> pulumi.Output[Optional[str]]:
+        """
+        URL to POST prediction requests to, if `httpEndpoint` is set.
+        """
+        return pulumi.get(self, "predictor_url")
+
     @property
     @pulumi.getter(name="trainingRoleArn")
     def training_role_arn(self) -> pulumi.Output[str]: